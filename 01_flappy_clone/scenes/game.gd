@@ -2,6 +2,8 @@ extends Node2D
 ## Flappy Clone: Tap to fly through pipes
 ## Simple one-touch gameplay with increasing difficulty
 
+const RecyclingSpawner = preload("res://scenes/recycling_spawner.gd")
+
 const GRAVITY = 1200.0
 const FLAP_FORCE = -450.0
 const PIPE_SPEED = 200.0
@@ -12,7 +14,6 @@ const PIPE_WIDTH = 80.0
 @onready var bird: Area2D = $Bird
 @onready var pipe_container: Node2D = $PipeContainer
 @onready var game_ui = $GameUI
-@onready var score_particles: CPUParticles2D = $ScoreParticles
 
 var velocity: float = 0.0
 var game_started: bool = false
@@ -20,12 +21,15 @@ var game_active: bool = false
 var pipe_timer: float = 0.0
 var screen_width: float
 var screen_height: float
+var pipes: RecyclingSpawner
 
 func _ready() -> void:
 	screen_width = get_viewport_rect().size.x
 	screen_height = get_viewport_rect().size.y
 	GameManager.start_game("flappy_clone")
 	bird.position = Vector2(screen_width * 0.3, screen_height * 0.4)
+	pipes = RecyclingSpawner.new().setup(_create_pipe)
+	pipe_container.add_child(pipes)
 
 func _input(event: InputEvent) -> void:
 	if event is InputEventScreenTouch and event.pressed:
@@ -57,18 +61,19 @@ func _process(delta: float) -> void:
 		pipe_timer = 0.0
 		_spawn_pipe()
 
-	for pipe in pipe_container.get_children():
-		pipe.position.x -= PIPE_SPEED * delta
-		if pipe.position.x < -100:
-			pipe.queue_free()
+	pipes.scroll(PIPE_SPEED * delta)
+	pipes.recycle_behind(-100)
 
 	if bird.position.y < -50 or bird.position.y > screen_height - 50:
 		_game_over()
 
 func _spawn_pipe() -> void:
-	var pipe = Node2D.new()
 	var gap_y = randf_range(screen_height * 0.25, screen_height * 0.65)
-	pipe.position = Vector2(screen_width + 100, gap_y)
+	pipes.spawn(Vector2(screen_width + 100, gap_y))
+
+func _create_pipe() -> Node2D:
+	# Built once per pooled pipe; recycled pipes only move to a new gap
+	var pipe = Node2D.new()
 
 	# Top pipe
 	var top = ColorRect.new()
@@ -114,13 +119,12 @@ func _spawn_pipe() -> void:
 	bottom_col.add_child(bottom_shape)
 	bottom_col.area_entered.connect(_on_pipe_hit)
 	pipe.add_child(bottom_col)
-
-	pipe_container.add_child(pipe)
+	return pipe
 
 func _on_score_area_entered(area: Area2D) -> void:
 	if area.get_parent() == bird:
 		GameManager.add_score()
-		score_particles.emit_celebration(bird.global_position)
+		Effects.emit("sparkle", bird.global_position, Color(1.0, 0.8, 0.1))
 
 func _on_pipe_hit(area: Area2D) -> void:
 	if area.get_parent() == bird:
@@ -1,6 +1,8 @@
 extends Node2D
 ## Endless Runner: Run and jump over obstacles
 
+const RecyclingSpawner = preload("res://scenes/recycling_spawner.gd")
+
 const GRAVITY = 2500.0
 const JUMP_FORCE = -900.0
 const INITIAL_SPEED = 400.0
@@ -19,11 +21,14 @@ var can_double_jump: bool = true
 var next_obstacle_x: float = 800.0
 var distance: float = 0.0
 var screen_width: float
+var obstacles: RecyclingSpawner
 
 func _ready() -> void:
 	screen_width = get_viewport_rect().size.x
 	GameManager.start_game("endless_runner")
 	player.position = Vector2(150, GROUND_Y - 50)
+	obstacles = RecyclingSpawner.new().setup(_create_obstacle)
+	obstacles_container.add_child(obstacles)
 
 func _input(event: InputEvent) -> void:
 	if (event is InputEventScreenTouch and event.pressed) or (event is InputEventMouseButton and event.pressed):
@@ -58,10 +63,8 @@ func _process(delta: float) -> void:
 
 	game_speed = min(game_speed + 10 * delta, MAX_SPEED)
 
-	for obstacle in obstacles_container.get_children():
-		obstacle.position.x -= game_speed * delta
-		if obstacle.position.x < -100:
-			obstacle.queue_free()
+	obstacles.scroll(game_speed * delta)
+	obstacles.recycle_behind(-100)
 
 	if next_obstacle_x < screen_width:
 		_spawn_obstacle()
@@ -75,18 +78,21 @@ func _process(delta: float) -> void:
 
 	_check_collisions()
 
-func _spawn_obstacle() -> void:
+func _create_obstacle() -> ColorRect:
 	var obstacle = ColorRect.new()
+	obstacle.color = Color("#e63946")
+	return obstacle
+
+func _spawn_obstacle() -> void:
 	var height = randf_range(40, 100)
+	var obstacle = obstacles.spawn(Vector2(screen_width + 100, GROUND_Y - height))
 	obstacle.size = Vector2(40, height)
-	obstacle.position = Vector2(screen_width + 100, GROUND_Y - height)
-	obstacle.color = Color("#e63946")
-	obstacles_container.add_child(obstacle)
 
 func _check_collisions() -> void:
 	var player_rect = Rect2(player.position.x - 20, player.position.y - 50, 40, 50)
-	for obstacle in obstacles_container.get_children():
-		var obs_rect = Rect2(obstacle.position, obstacle.size)
+	# Only obstacles overlapping the player's column can hit it
+	for obstacle in obstacles.in_range(player_rect.position.x - 40, player_rect.end.x):
+		var obs_rect = Rect2(obstacles.parent_position(obstacle), obstacle.size)
 		if player_rect.intersects(obs_rect):
 			_game_over()
 			return
@@ -0,0 +1,110 @@
+extends Node2D
+## Effects: Pooled one-shot particle effects
+## Preallocates a fixed set of emitters per effect kind and reuses them,
+## so bursts never create or free nodes during gameplay
+
+const EMITTERS_PER_KIND: int = 4
+const EFFECT_Z_INDEX: int = 100
+
+# Effect presets - each kind gets its own emitters configured once in _ready()
+const PRESETS = {
+	"burst": {
+		"amount": 12, "lifetime": 0.5, "spread": 180.0, "direction": Vector2.UP,
+		"velocity": Vector2(150, 300), "gravity": 0.0, "size": Vector2(6, 8)
+	},
+	"pop": {
+		"amount": 6, "lifetime": 0.3, "spread": 180.0, "direction": Vector2.UP,
+		"velocity": Vector2(180, 240), "gravity": 0.0, "size": Vector2(10, 12)
+	},
+	"sparkle": {
+		"amount": 12, "lifetime": 0.3, "spread": 180.0, "direction": Vector2.UP,
+		"velocity": Vector2(100, 200), "gravity": 300.0, "size": Vector2(4, 6)
+	},
+	"dust": {
+		"amount": 8, "lifetime": 0.5, "spread": 90.0, "direction": Vector2.UP,
+		"velocity": Vector2(100, 200), "gravity": 400.0, "size": Vector2(6, 12)
+	},
+	"explosion": {
+		"amount": 15, "lifetime": 0.4, "spread": 180.0, "direction": Vector2.UP,
+		"velocity": Vector2(200, 400), "gravity": 0.0, "size": Vector2(4, 12)
+	},
+	"flash": {
+		"amount": 1, "lifetime": 0.2, "spread": 0.0, "direction": Vector2.UP,
+		"velocity": Vector2(0, 0), "gravity": 0.0, "size": Vector2(100, 100)
+	}
+}
+
+var _pools: Dictionary = {}
+var _next_index: Dictionary = {}
+var _fade_ramp: Gradient
+var _shrink_curve: Curve
+
+func _ready() -> void:
+	z_index = EFFECT_Z_INDEX
+
+	# Shared resources - particles fade out and shrink over their lifetime
+	_fade_ramp = Gradient.new()
+	_fade_ramp.set_color(0, Color(1, 1, 1, 1))
+	_fade_ramp.set_color(1, Color(1, 1, 1, 0))
+
+	_shrink_curve = Curve.new()
+	_shrink_curve.add_point(Vector2(0, 1))
+	_shrink_curve.add_point(Vector2(1, 0.1))
+
+	for kind in PRESETS:
+		var pool: Array[CPUParticles2D] = []
+		for i in range(EMITTERS_PER_KIND):
+			var emitter = _create_emitter(PRESETS[kind])
+			add_child(emitter)
+			pool.append(emitter)
+		_pools[kind] = pool
+		_next_index[kind] = 0
+
+func _create_emitter(preset: Dictionary) -> CPUParticles2D:
+	var emitter = CPUParticles2D.new()
+	emitter.emitting = false
+	emitter.one_shot = true
+	emitter.explosiveness = 1.0
+	emitter.amount = preset.amount
+	emitter.lifetime = preset.lifetime
+	emitter.spread = preset.spread
+	emitter.direction = preset.direction
+	emitter.initial_velocity_min = preset.velocity.x
+	emitter.initial_velocity_max = preset.velocity.y
+	emitter.gravity = Vector2(0, preset.gravity)
+	emitter.scale_amount_min = preset.size.x
+	emitter.scale_amount_max = preset.size.y
+	emitter.scale_amount_curve = _shrink_curve
+	emitter.color_ramp = _fade_ramp
+	return emitter
+
+func emit(kind: String, pos: Vector2, color: Color = Color.WHITE) -> void:
+	## Play a one-shot effect at a global canvas position
+	if not _pools.has(kind):
+		push_warning("Effects: unknown effect kind '%s'" % kind)
+		return
+
+	var emitter = _acquire(kind)
+	emitter.global_position = pos
+	emitter.color = color
+	emitter.restart()
+
+func clear() -> void:
+	## Stop every running effect (e.g. on level change)
+	for kind in _pools:
+		for emitter in _pools[kind]:
+			emitter.emitting = false
+
+func _acquire(kind: String) -> CPUParticles2D:
+	# Prefer an idle emitter; when all are busy, recycle the oldest one
+	# so the number of live effects never exceeds the pool size
+	var pool: Array[CPUParticles2D] = _pools[kind]
+	var start: int = _next_index[kind]
+	for i in range(pool.size()):
+		var index = (start + i) % pool.size()
+		if not pool[index].emitting:
+			_next_index[kind] = (index + 1) % pool.size()
+			return pool[index]
+
+	_next_index[kind] = (start + 1) % pool.size()
+	return pool[start]
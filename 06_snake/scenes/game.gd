@@ -168,3 +168,30 @@ func _reset_combo() -> void:
 	combo_active = false
 	time_since_last_food = 0.0
 	game_ui.update_combo(0)  # 0 indicates no active combo
+
+# Snapshot interface - lets the test agent jump straight to late-game states
+func get_snapshot() -> Dictionary:
+	var segments: Array = []
+	for segment in snake:
+		segments.append([segment.x, segment.y])
+	return {
+		"snake": segments,
+		"direction": [direction.x, direction.y],
+		"speed": current_speed,
+		"score": GameManager.current_score
+	}
+
+func load_snapshot(data: Dictionary) -> void:
+	snake.clear()
+	for segment in data.get("snake", []):
+		snake.append(Vector2i(int(segment[0]), int(segment[1])))
+	var dir = data.get("direction", [0, -1])
+	direction = Vector2i(int(dir[0]), int(dir[1]))
+	next_direction = direction
+	current_speed = float(data.get("speed", INITIAL_SPEED))
+	GameManager.current_score = int(data.get("score", 0))
+	GameManager.emit_signal("score_changed", GameManager.current_score)
+	game_started = true
+	game_active = true
+	_spawn_food()
+	_update_snake_visuals()
@@ -11,6 +11,8 @@ var current_score: int = 0
 var high_score: int = 0
 var game_name: String = ""
 
+const LEGACY_SAVE_PATH = "user://highscore.save"
+
 func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
 	_load_high_score()
@@ -45,12 +47,16 @@ func go_to_menu() -> void:
 	get_tree().change_scene_to_file("res://scenes/main_menu.tscn")
 
 func _save_high_score() -> void:
-	var file = FileAccess.open("user://highscore.save", FileAccess.WRITE)
-	if file:
-		file.store_var(high_score)
+	SaveManager.set_value("high_score", high_score)
 
 func _load_high_score() -> void:
-	if FileAccess.file_exists("user://highscore.save"):
-		var file = FileAccess.open("user://highscore.save", FileAccess.READ)
+	if not SaveManager.has_value("high_score"):
+		_import_legacy_save()
+	high_score = SaveManager.get_value("high_score", 0)
+
+func _import_legacy_save() -> void:
+	# One-time import of the high score file used before SaveManager
+	if FileAccess.file_exists(LEGACY_SAVE_PATH):
+		var file = FileAccess.open(LEGACY_SAVE_PATH, FileAccess.READ)
 		if file:
-			high_score = file.get_var()
+			SaveManager.set_value("high_score", file.get_var())
@@ -1,6 +1,8 @@
 extends Node2D
 ## Doodle Jump: Jump on platforms to climb higher
 
+const RecyclingSpawner = preload("res://scenes/recycling_spawner.gd")
+
 const GRAVITY = 1200.0
 const JUMP_FORCE = -700.0
 const SUPER_JUMP_FORCE = -1100.0
@@ -17,6 +19,7 @@ var highest_y: float = 0.0
 var next_platform_y: float = 0.0
 var screen_width: float
 var touch_x: float = 0.0
+var platforms: RecyclingSpawner  # Scrolls upward: axis positions are -y
 
 enum PlatformType { NORMAL, MOVING, BREAKING, SPRING }
 var platform_colors = {PlatformType.NORMAL: Color("#4caf50"), PlatformType.MOVING: Color("#2196f3"), PlatformType.BREAKING: Color("#ff9800"), PlatformType.SPRING: Color("#e91e63")}
@@ -25,6 +28,8 @@ func _ready() -> void:
 	screen_width = get_viewport_rect().size.x
 	GameManager.start_game("doodle_jump")
 	player.position = Vector2(screen_width / 2, 900)
+	platforms = RecyclingSpawner.new().setup(_new_platform, Vector2.UP, 16)
+	platforms_container.add_child(platforms)
 	_spawn_starting_platforms()
 
 func _spawn_starting_platforms() -> void:
@@ -43,14 +48,16 @@ func _get_random_type(y: float) -> int:
 		return PlatformType.BREAKING
 	return PlatformType.SPRING
 
-func _create_platform(pos: Vector2, type: int) -> void:
+func _new_platform() -> ColorRect:
 	var platform = ColorRect.new()
 	platform.size = Vector2(100, 20)
-	platform.position = pos
+	return platform
+
+func _create_platform(pos: Vector2, type: int) -> void:
+	var platform = platforms.spawn(pos)
 	platform.color = platform_colors[type]
 	platform.set_meta("type", type)
 	platform.set_meta("original_x", pos.x)
-	platforms_container.add_child(platform)
 
 func _input(event: InputEvent) -> void:
 	if event is InputEventScreenTouch:
@@ -89,18 +96,21 @@ func _process(delta: float) -> void:
 		_create_platform(Vector2(randf_range(50, screen_width - 50) - 50, next_platform_y), _get_random_type(next_platform_y))
 		next_platform_y -= SPAWN_INTERVAL
 
-	for platform in platforms_container.get_children():
+	# Platforms that dropped below the screen go back to the top
+	platforms.recycle_behind(-(camera.position.y + 800))
+	var sway = sin(Time.get_ticks_msec() * 0.002) * 100
+	for platform in platforms.get_active():
 		if platform.get_meta("type") == PlatformType.MOVING:
-			platform.position.x = platform.get_meta("original_x") + sin(Time.get_ticks_msec() * 0.002) * 100
-		if platform.position.y > camera.position.y + 800:
-			platform.queue_free()
+			platform.position.x = platform.get_meta("original_x") + sway
 
 	if player.position.y > camera.position.y + 700:
 		_game_over()
 
 func _check_platform_collisions() -> void:
-	for platform in platforms_container.get_children():
-		if player.position.y + 25 >= platform.position.y and player.position.y + 25 <= platform.position.y + 30:
+	# Only platforms level with the player's feet can be landed on
+	var feet_y = player.position.y + 25
+	for platform in platforms.in_range(-feet_y, -(feet_y - 30)):
+		if feet_y >= platform.position.y and feet_y <= platform.position.y + 30:
 			if player.position.x > platform.position.x - 20 and player.position.x < platform.position.x + 120:
 				_land_on_platform(platform)
 				break
@@ -110,7 +120,7 @@ func _land_on_platform(platform: ColorRect) -> void:
 	velocity.y = SUPER_JUMP_FORCE if type == PlatformType.SPRING else JUMP_FORCE
 	AudioManager.play_sfx("tap")
 	if type == PlatformType.BREAKING:
-		platform.queue_free()
+		platforms.release(platform)
 
 func _game_over() -> void:
 	if not game_active:
@@ -190,3 +190,29 @@ func _update_display() -> void:
 			block.position = Vector2(x * CELL_SIZE + 1, y * CELL_SIZE + 1)
 			block.color = current_piece.color
 			grid_container.add_child(block)
+
+# Snapshot interface - lets the test agent jump straight to late-game states
+func get_snapshot() -> Dictionary:
+	var cells: Array = []
+	for x in range(GRID_WIDTH):
+		var column: Array = []
+		for y in range(GRID_HEIGHT):
+			column.append(grid[x][y].to_html() if grid[x][y] != null else null)
+		cells.append(column)
+	return {
+		"grid": cells,
+		"lines_cleared": lines_cleared,
+		"score": GameManager.current_score
+	}
+
+func load_snapshot(data: Dictionary) -> void:
+	var cells: Array = data.get("grid", [])
+	for x in range(min(cells.size(), GRID_WIDTH)):
+		for y in range(min(cells[x].size(), GRID_HEIGHT)):
+			grid[x][y] = Color(cells[x][y]) if cells[x][y] != null else null
+	lines_cleared = int(data.get("lines_cleared", 0))
+	current_drop_time = max(MIN_DROP_TIME, INITIAL_DROP_TIME - lines_cleared * 0.02)
+	GameManager.current_score = int(data.get("score", 0))
+	GameManager.emit_signal("score_changed", GameManager.current_score)
+	game_active = true
+	_update_display()
@@ -0,0 +1,109 @@
+extends Node
+## SaveManager: Buffered persistence for scores, stats and settings
+## All values live in one versioned file; writes are coalesced and
+## performed atomically (temp file + rename) on a worker thread
+
+const SAVE_PATH: String = "user://save_data.save"
+const TEMP_PATH: String = "user://save_data.save.tmp"
+const SAVE_VERSION: int = 1
+const FLUSH_DELAY: float = 1.0  ## Seconds of quiet before buffered changes are written
+const MAX_FLUSH_WAIT: float = 5.0  ## Longest an unflushed change may wait under constant updates
+
+var _values: Dictionary = {}
+var _dirty: bool = false
+var _dirty_time: float = 0.0  # Since the latest change
+var _pending_time: float = 0.0  # Since the oldest unflushed change
+var _write_task_id: int = -1
+
+func _ready() -> void:
+	process_mode = Node.PROCESS_MODE_ALWAYS
+	_load()
+	set_process(false)
+
+func has_value(key: String) -> bool:
+	return _values.has(key)
+
+func get_value(key: String, default: Variant = null) -> Variant:
+	return _values.get(key, default)
+
+func set_value(key: String, value: Variant) -> void:
+	## Buffer a value; it is written after FLUSH_DELAY without further changes,
+	## or MAX_FLUSH_WAIT after the first unflushed change at the latest
+	if _values.has(key) and typeof(_values[key]) == typeof(value) and _values[key] == value:
+		return
+	_values[key] = value
+	if not _dirty:
+		_pending_time = 0.0
+	_dirty = true
+	_dirty_time = 0.0
+	set_process(true)
+
+func flush() -> void:
+	## Write pending changes now on a worker thread
+	if not _dirty:
+		return
+	if _write_task_id != -1:
+		if not WorkerThreadPool.is_task_completed(_write_task_id):
+			# A write is still in flight; retry on the next frame
+			set_process(true)
+			return
+		WorkerThreadPool.wait_for_task_completion(_write_task_id)
+		_write_task_id = -1
+
+	_dirty = false
+	var snapshot = {"version": SAVE_VERSION, "values": _values.duplicate(true)}
+	_write_task_id = WorkerThreadPool.add_task(_write_file.bind(snapshot))
+
+func flush_blocking() -> void:
+	## Write pending changes immediately on the calling thread (app shutdown)
+	_wait_for_write()
+	if not _dirty:
+		return
+	_dirty = false
+	_write_file({"version": SAVE_VERSION, "values": _values.duplicate(true)})
+
+func _process(delta: float) -> void:
+	if not _dirty:
+		set_process(false)
+		return
+	_dirty_time += delta
+	_pending_time += delta
+	if _dirty_time >= FLUSH_DELAY or _pending_time >= MAX_FLUSH_WAIT:
+		set_process(false)
+		flush()
+
+func _wait_for_write() -> void:
+	if _write_task_id != -1:
+		WorkerThreadPool.wait_for_task_completion(_write_task_id)
+		_write_task_id = -1
+
+func _write_file(data: Dictionary) -> void:
+	# Runs on a worker thread - only touches its own snapshot
+	var file = FileAccess.open(TEMP_PATH, FileAccess.WRITE)
+	if not file:
+		push_warning("SaveManager: could not open %s" % TEMP_PATH)
+		return
+	file.store_var(data)
+	file.close()
+	var err = DirAccess.rename_absolute(TEMP_PATH, SAVE_PATH)
+	if err != OK:
+		push_warning("SaveManager: could not replace %s (error %d)" % [SAVE_PATH, err])
+
+func _load() -> void:
+	if not FileAccess.file_exists(SAVE_PATH):
+		return
+	var file = FileAccess.open(SAVE_PATH, FileAccess.READ)
+	if not file:
+		return
+	var data = file.get_var()
+	if data is Dictionary and data.get("version", 0) <= SAVE_VERSION:
+		var values = data.get("values", {})
+		if values is Dictionary:
+			_values = values
+
+func _notification(what: int) -> void:
+	if what == NOTIFICATION_WM_CLOSE_REQUEST or what == NOTIFICATION_APPLICATION_PAUSED:
+		flush_blocking()
+
+func _exit_tree() -> void:
+	flush_blocking()
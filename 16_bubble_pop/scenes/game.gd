@@ -9,7 +9,8 @@ const SPAWN_AREA_TOP = 1200
 const ESCAPE_LINE = 150
 const MAX_ESCAPED = 5
 
-# Bubble sizes and their properties
+# Bubble sizes and their properties (a bubble's type is its index in SIZE_TYPES)
+const SIZE_TYPES = ["small", "medium", "large"]
 const BUBBLE_SIZES = {
 	"small": {"radius": 35, "points": 3, "speed_mult": 1.3},
 	"medium": {"radius": 55, "points": 2, "speed_mult": 1.0},
@@ -27,12 +28,33 @@ const BUBBLE_COLORS = [
 ]
 
 const GOLDEN_COLOR = Color("#ffd700")
+const SHINE_COLOR = Color(1, 1, 1, 0.5)
+const SPAWN_ANIM_TIME = 0.2
+
+# Coarse grid for tap hit testing; cells are at least as large as the biggest
+# radius, so a tap only has to look at its own cell and the eight around it
+const GRID_CELL = 160.0
+const GRID_COLS = int(SCREEN_WIDTH / GRID_CELL) + 1
+const GRID_ROWS = int(SCREEN_HEIGHT / GRID_CELL) + 1
 
 @onready var bubbles_container: Control = $BubblesContainer
 @onready var escaped_label: Label = $EscapedLabel
 @onready var combo_label: Label = $ComboLabel
 
-var bubbles: Array = []
+# Bubble field as parallel arrays, one slot per live bubble in draw order
+var bubble_pos: PackedVector2Array = PackedVector2Array()  # Centre
+var bubble_speed: PackedFloat32Array = PackedFloat32Array()
+var bubble_radius: PackedFloat32Array = PackedFloat32Array()
+var bubble_type: PackedInt32Array = PackedInt32Array()
+var bubble_golden: PackedByteArray = PackedByteArray()
+var bubble_color: PackedColorArray = PackedColorArray()
+var bubble_age: PackedFloat32Array = PackedFloat32Array()  # Drives the spawn animation
+
+# Hit-test grid (counting sort: cell c holds grid_items[grid_start[c]..grid_start[c + 1]])
+var grid_start: PackedInt32Array = PackedInt32Array()
+var grid_items: PackedInt32Array = PackedInt32Array()
+var grid_dirty: bool = true
+
 var base_speed: float = 120.0
 var spawn_timer: float = 0.0
 var spawn_interval: float = 1.2
@@ -49,6 +71,9 @@ func _ready() -> void:
 	GameManager.start_game("bubble_pop")
 	_update_escaped_display()
 	combo_label.modulate.a = 0.0
+	grid_start.resize(GRID_COLS * GRID_ROWS + 1)
+	bubbles_container.draw.connect(_draw_bubbles)
+	bubbles_container.gui_input.connect(_on_field_input)
 
 func _process(delta: float) -> void:
 	if not game_active:
@@ -71,22 +96,61 @@ func _process(delta: float) -> void:
 		if combo_timer >= COMBO_TIMEOUT:
 			_reset_combo()
 
-	# Move bubbles and check for escapes
-	var to_remove: Array = []
-	for bubble in bubbles:
-		if not is_instance_valid(bubble):
-			to_remove.append(bubble)
+	_update_bubbles(delta)
+	bubbles_container.queue_redraw()
+
+func _update_bubbles(delta: float) -> void:
+	# Move bubbles and drop escaped ones, compacting in place to keep draw order
+	var count = bubble_pos.size()
+	var kept = 0
+	var escaped = 0
+	for i in range(count):
+		var pos = bubble_pos[i]
+		pos.y -= bubble_speed[i] * delta
+
+		# Check if bubble escaped (its top crossed the line)
+		if pos.y - bubble_radius[i] < ESCAPE_LINE:
+			escaped += 1
 			continue
 
-		bubble.position.y -= bubble.get_meta("speed") * delta
-
-		# Check if bubble escaped
-		if bubble.position.y < ESCAPE_LINE:
-			to_remove.append(bubble)
-			_bubble_escaped(bubble)
-
-	for bubble in to_remove:
-		_remove_bubble(bubble)
+		if kept != i:
+			bubble_speed[kept] = bubble_speed[i]
+			bubble_radius[kept] = bubble_radius[i]
+			bubble_type[kept] = bubble_type[i]
+			bubble_golden[kept] = bubble_golden[i]
+			bubble_color[kept] = bubble_color[i]
+		bubble_pos[kept] = pos
+		bubble_age[kept] = bubble_age[i] + delta
+		kept += 1
+
+	if kept != count:
+		_resize_bubbles(kept)
+	grid_dirty = true
+
+	for i in range(escaped):
+		if game_active:
+			_bubble_escaped()
+
+func _resize_bubbles(count: int) -> void:
+	bubble_pos.resize(count)
+	bubble_speed.resize(count)
+	bubble_radius.resize(count)
+	bubble_type.resize(count)
+	bubble_golden.resize(count)
+	bubble_color.resize(count)
+	bubble_age.resize(count)
+	grid_dirty = true
+
+func _draw_bubbles() -> void:
+	# One pass over the arrays; scaling grows from the top-left corner like the old nodes
+	for i in range(bubble_pos.size()):
+		var radius = bubble_radius[i]
+		var grow = 1.0
+		if bubble_age[i] < SPAWN_ANIM_TIME:
+			grow = Tween.interpolate_value(0.1, 0.9, bubble_age[i], SPAWN_ANIM_TIME, Tween.TRANS_ELASTIC, Tween.EASE_OUT)
+		var top_left = bubble_pos[i] - Vector2(radius, radius)
+		bubbles_container.draw_rect(Rect2(top_left, Vector2(radius, radius) * 2 * grow), bubble_color[i])
+		bubbles_container.draw_rect(Rect2(top_left + Vector2(radius, radius) * 0.3 * grow, Vector2(radius, radius) * 0.4 * grow), SHINE_COLOR)
 
 func _update_difficulty() -> void:
 	# Increase speed and spawn rate over time
@@ -95,8 +159,6 @@ func _update_difficulty() -> void:
 	spawn_interval = lerp(1.2, 0.4, progress)
 
 func _spawn_bubble() -> void:
-	var bubble = Control.new()
-
 	# Determine bubble type
 	var size_type: String
 	var rand = randf()
@@ -107,75 +169,94 @@ func _spawn_bubble() -> void:
 	else:
 		size_type = "large"
 
-	var props = BUBBLE_SIZES[size_type]
-	var radius = props.radius
-	var points = props.points
-	var speed = base_speed * props.speed_mult
-
 	# Check for golden bubble (10% chance)
 	var is_golden = randf() < 0.1
-	if is_golden:
-		points = 10
-
-	# Set bubble size
-	bubble.size = Vector2(radius * 2, radius * 2)
-	bubble.custom_minimum_size = bubble.size
 
 	# Random X position with margin
-	var margin = radius + 20
+	var margin = BUBBLE_SIZES[size_type].radius + 20
 	var x_pos = randf_range(margin, SCREEN_WIDTH - margin)
-	bubble.position = Vector2(x_pos - radius, SPAWN_AREA_TOP)
 
-	# Store metadata
-	bubble.set_meta("speed", speed)
-	bubble.set_meta("points", points)
-	bubble.set_meta("radius", radius)
-	bubble.set_meta("is_golden", is_golden)
+	var index = _add_bubble(size_type, x_pos, SPAWN_AREA_TOP, is_golden)
+
+	# Spawn animation
+	bubble_age[index] = 0.0
 
-	# Create the bubble visual (circle shape)
-	var color_rect = ColorRect.new()
-	color_rect.name = "BubbleVisual"
-	color_rect.size = Vector2(radius * 2, radius * 2)
+func _add_bubble(size_type: String, x_pos: float, y_pos: float, is_golden: bool) -> int:
+	## Append a bubble centred on x_pos with its top at y_pos; returns its index
+	var props = BUBBLE_SIZES[size_type]
+	var radius = props.radius
 
+	bubble_pos.append(Vector2(x_pos, y_pos + radius))
+	bubble_speed.append(base_speed * props.speed_mult)
+	bubble_radius.append(radius)
+	bubble_type.append(SIZE_TYPES.find(size_type))
+	bubble_golden.append(1 if is_golden else 0)
 	if is_golden:
-		color_rect.color = GOLDEN_COLOR
+		bubble_color.append(GOLDEN_COLOR)
 	else:
-		color_rect.color = BUBBLE_COLORS[randi() % BUBBLE_COLORS.size()]
-
-	bubble.add_child(color_rect)
-
-	# Add shine effect (small white circle)
-	var shine = ColorRect.new()
-	shine.name = "Shine"
-	shine.size = Vector2(radius * 0.4, radius * 0.4)
-	shine.position = Vector2(radius * 0.3, radius * 0.3)
-	shine.color = Color(1, 1, 1, 0.5)
-	bubble.add_child(shine)
-
-	# Add clickable button
-	var btn = Button.new()
-	btn.flat = true
-	btn.size = Vector2(radius * 2, radius * 2)
-	btn.modulate.a = 0
-	btn.pressed.connect(_on_bubble_clicked.bind(bubble))
-	bubble.add_child(btn)
-
-	bubbles.append(bubble)
-	bubbles_container.add_child(bubble)
-
-	# Spawn animation
-	bubble.scale = Vector2(0.1, 0.1)
-	var tween = create_tween()
-	tween.tween_property(bubble, "scale", Vector2(1.0, 1.0), 0.2).set_ease(Tween.EASE_OUT).set_trans(Tween.TRANS_ELASTIC)
-
-func _on_bubble_clicked(bubble: Control) -> void:
+		bubble_color.append(BUBBLE_COLORS[randi() % BUBBLE_COLORS.size()])
+	bubble_age.append(SPAWN_ANIM_TIME)
+	grid_dirty = true
+	return bubble_pos.size() - 1
+
+func _on_field_input(event: InputEvent) -> void:
+	# Touches arrive here as emulated mouse presses, like they did for the old buttons
+	if event is InputEventMouseButton and event.pressed and event.button_index == MOUSE_BUTTON_LEFT:
+		var index = _bubble_at(event.position)
+		if index != -1:
+			_on_bubble_clicked(index)
+
+func _bubble_at(point: Vector2) -> int:
+	## Topmost bubble under a point in field space, or -1
+	if grid_dirty:
+		_rebuild_grid()
+	var col = _grid_col(point.x)
+	var row = _grid_row(point.y)
+	var hit = -1
+	for r in range(max(row - 1, 0), min(row + 2, GRID_ROWS)):
+		for c in range(max(col - 1, 0), min(col + 2, GRID_COLS)):
+			var cell = r * GRID_COLS + c
+			for k in range(grid_start[cell], grid_start[cell + 1]):
+				var i = grid_items[k]
+				if i <= hit:
+					continue
+				var offset = point - bubble_pos[i]
+				var radius = bubble_radius[i]
+				if abs(offset.x) <= radius and abs(offset.y) <= radius:
+					hit = i
+	return hit
+
+func _rebuild_grid() -> void:
+	var count = bubble_pos.size()
+	var cells = PackedInt32Array()
+	cells.resize(count)
+	grid_start.fill(0)
+	for i in range(count):
+		var cell = _grid_row(bubble_pos[i].y) * GRID_COLS + _grid_col(bubble_pos[i].x)
+		cells[i] = cell
+		grid_start[cell + 1] += 1
+	for cell in range(GRID_COLS * GRID_ROWS):
+		grid_start[cell + 1] += grid_start[cell]
+
+	var fill = grid_start.duplicate()
+	grid_items.resize(count)
+	for i in range(count):
+		grid_items[fill[cells[i]]] = i
+		fill[cells[i]] += 1
+	grid_dirty = false
+
+func _grid_col(x: float) -> int:
+	return clampi(int(x / GRID_CELL), 0, GRID_COLS - 1)
+
+func _grid_row(y: float) -> int:
+	return clampi(int(y / GRID_CELL), 0, GRID_ROWS - 1)
+
+func _on_bubble_clicked(index: int) -> void:
 	if not game_active:
 		return
-	if not is_instance_valid(bubble):
-		return
 
-	var points = bubble.get_meta("points")
-	var is_golden = bubble.get_meta("is_golden")
+	var is_golden = bubble_golden[index] == 1
+	var points = 10 if is_golden else BUBBLE_SIZES[SIZE_TYPES[bubble_type[index]]].points
 
 	# Increment combo
 	combo_count += 1
@@ -197,10 +278,10 @@ func _on_bubble_clicked(bubble: Control) -> void:
 		AudioManager.play_sfx("pop")
 
 	# Create pop effect
-	_create_pop_effect(bubble)
+	_create_pop_effect(index)
 
 	# Remove bubble
-	_remove_bubble(bubble)
+	_remove_bubble(index)
 
 func _show_combo() -> void:
 	combo_label.text = "COMBO x" + str(combo_count)
@@ -215,7 +296,7 @@ func _reset_combo() -> void:
 	var tween = create_tween()
 	tween.tween_property(combo_label, "modulate:a", 0.0, 0.3)
 
-func _bubble_escaped(bubble: Control) -> void:
+func _bubble_escaped() -> void:
 	escaped_count += 1
 	_update_escaped_display()
 	AudioManager.play_sfx("hit")
@@ -233,33 +314,48 @@ func _update_escaped_display() -> void:
 	elif escaped_count >= MAX_ESCAPED - 3:
 		escaped_label.modulate = Color.ORANGE
 
-func _create_pop_effect(bubble: Control) -> void:
-	var pos = bubble.position + bubble.size / 2
-	var radius = bubble.get_meta("radius")
-	var color = bubble.get_node("BubbleVisual").color
-
-	# Create particle-like pop effect
-	for i in range(6):
-		var particle = ColorRect.new()
-		particle.size = Vector2(12, 12)
-		particle.color = color
-		particle.position = pos - Vector2(6, 6)
-		bubbles_container.add_child(particle)
-
-		# Random direction
-		var angle = (TAU / 6) * i + randf_range(-0.3, 0.3)
-		var distance = radius * 1.5
-		var target_pos = pos + Vector2(cos(angle), sin(angle)) * distance
-
-		var tween = create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(particle, "position", target_pos - Vector2(6, 6), 0.3).set_ease(Tween.EASE_OUT)
-		tween.tween_property(particle, "modulate:a", 0.0, 0.3)
-		tween.tween_property(particle, "scale", Vector2(0.1, 0.1), 0.3)
-		tween.chain().tween_callback(particle.queue_free)
-
-func _remove_bubble(bubble: Control) -> void:
-	if bubble in bubbles:
-		bubbles.erase(bubble)
-	if is_instance_valid(bubble):
-		bubble.queue_free()
+func _create_pop_effect(index: int) -> void:
+	var pos = bubbles_container.global_position + bubble_pos[index]
+	Effects.emit("pop", pos, bubble_color[index])
+
+func _remove_bubble(index: int) -> void:
+	# Shifting keeps the draw order; pops are rare next to the per-frame update
+	bubble_pos.remove_at(index)
+	bubble_speed.remove_at(index)
+	bubble_radius.remove_at(index)
+	bubble_type.remove_at(index)
+	bubble_golden.remove_at(index)
+	bubble_color.remove_at(index)
+	bubble_age.remove_at(index)
+	grid_dirty = true
+	bubbles_container.queue_redraw()
+
+# Snapshot interface - lets the test agent jump straight to late-game states
+func get_snapshot() -> Dictionary:
+	var bubble_data: Array = []
+	for i in range(bubble_pos.size()):
+		bubble_data.append({
+			"size": SIZE_TYPES[bubble_type[i]],
+			"x": bubble_pos[i].x,
+			"y": bubble_pos[i].y - bubble_radius[i],
+			"golden": bubble_golden[i] == 1
+		})
+	return {
+		"game_time": game_time,
+		"escaped": escaped_count,
+		"bubbles": bubble_data,
+		"score": GameManager.current_score
+	}
+
+func load_snapshot(data: Dictionary) -> void:
+	_resize_bubbles(0)
+	game_time = float(data.get("game_time", 0.0))
+	_update_difficulty()
+	escaped_count = int(data.get("escaped", 0))
+	_update_escaped_display()
+	for entry in data.get("bubbles", []):
+		_add_bubble(entry.size, float(entry.x), float(entry.y), bool(entry.golden))
+	GameManager.current_score = int(data.get("score", 0))
+	GameManager.emit_signal("score_changed", GameManager.current_score)
+	game_active = true
+	bubbles_container.queue_redraw()
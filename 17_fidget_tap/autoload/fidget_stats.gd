@@ -1,10 +1,10 @@
 extends Node
 ## FidgetStats: Tracks and persists tap statistics
-## Saves to user:// for persistence between sessions
+## Persists through SaveManager between sessions
 
 signal stats_updated
 
-const SAVE_PATH: String = "user://fidget_stats.save"
+const LEGACY_SAVE_PATH: String = "user://fidget_stats.save"
 
 ## Statistics data
 var total_lifetime_taps: int = 0
@@ -76,38 +76,34 @@ func get_all_stats() -> Dictionary:
 		"current_streak": current_streak
 	}
 
-var _save_timer: float = 0.0
-const AUTO_SAVE_INTERVAL: float = 5.0
-
 func _auto_save() -> void:
-	# Save periodically rather than on every tap for performance
-	var current_time = Time.get_ticks_msec() / 1000.0
-	if current_time - _save_timer > AUTO_SAVE_INTERVAL:
-		_save_timer = current_time
-		_save_stats()
+	# SaveManager buffers and coalesces writes, so every tap can hand over its values
+	_save_stats()
 
 func _save_stats() -> void:
-	var file = FileAccess.open(SAVE_PATH, FileAccess.WRITE)
-	if file:
-		var data = {
-			"total_lifetime_taps": total_lifetime_taps,
-			"best_session_taps": best_session_taps,
-			"fastest_tap_streak": fastest_tap_streak
-		}
-		file.store_var(data)
+	SaveManager.set_value("total_lifetime_taps", total_lifetime_taps)
+	SaveManager.set_value("best_session_taps", best_session_taps)
+	SaveManager.set_value("fastest_tap_streak", fastest_tap_streak)
 
 func _load_stats() -> void:
-	if FileAccess.file_exists(SAVE_PATH):
-		var file = FileAccess.open(SAVE_PATH, FileAccess.READ)
+	if not SaveManager.has_value("total_lifetime_taps"):
+		_import_legacy_save()
+	total_lifetime_taps = SaveManager.get_value("total_lifetime_taps", 0)
+	best_session_taps = SaveManager.get_value("best_session_taps", 0)
+	fastest_tap_streak = SaveManager.get_value("fastest_tap_streak", 0)
+
+func _import_legacy_save() -> void:
+	# One-time import of the stats file used before SaveManager
+	if FileAccess.file_exists(LEGACY_SAVE_PATH):
+		var file = FileAccess.open(LEGACY_SAVE_PATH, FileAccess.READ)
 		if file:
 			var data = file.get_var()
 			if data is Dictionary:
-				total_lifetime_taps = data.get("total_lifetime_taps", 0)
-				best_session_taps = data.get("best_session_taps", 0)
-				fastest_tap_streak = data.get("fastest_tap_streak", 0)
+				for key in ["total_lifetime_taps", "best_session_taps", "fastest_tap_streak"]:
+					SaveManager.set_value(key, data.get(key, 0))
 
 ## Called when app is about to close
 func _notification(what: int) -> void:
 	if what == NOTIFICATION_WM_CLOSE_REQUEST:
 		reset_session()
-		_save_stats()
+		SaveManager.flush_blocking()
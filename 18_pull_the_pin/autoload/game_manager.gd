@@ -15,6 +15,8 @@ var game_name: String = ""
 var current_level: int = 1
 var max_level_reached: int = 1
 
+const LEGACY_SAVE_PATH = "user://highscore.save"
+
 func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
 	_load_high_score()
@@ -63,15 +65,20 @@ func go_to_menu() -> void:
 	get_tree().change_scene_to_file("res://scenes/main_menu.tscn")
 
 func _save_high_score() -> void:
-	var file = FileAccess.open("user://highscore.save", FileAccess.WRITE)
-	if file:
-		file.store_var(high_score)
-		file.store_var(max_level_reached)
+	SaveManager.set_value("high_score", high_score)
+	SaveManager.set_value("max_level_reached", max_level_reached)
 
 func _load_high_score() -> void:
-	if FileAccess.file_exists("user://highscore.save"):
-		var file = FileAccess.open("user://highscore.save", FileAccess.READ)
+	if not SaveManager.has_value("high_score"):
+		_import_legacy_save()
+	high_score = SaveManager.get_value("high_score", 0)
+	max_level_reached = SaveManager.get_value("max_level_reached", 1)
+
+func _import_legacy_save() -> void:
+	# One-time import of the save file used before SaveManager
+	if FileAccess.file_exists(LEGACY_SAVE_PATH):
+		var file = FileAccess.open(LEGACY_SAVE_PATH, FileAccess.READ)
 		if file:
-			high_score = file.get_var()
+			SaveManager.set_value("high_score", file.get_var())
 			if not file.eof_reached():
-				max_level_reached = file.get_var()
+				SaveManager.set_value("max_level_reached", file.get_var())
@@ -11,6 +11,10 @@ const BALL_RADIUS: float = 20.0
 const PIN_LENGTH: float = 80.0
 const PIN_WIDTH: float = 12.0
 
+# Level cache - generation is deterministic per level, so results are kept on disk
+const LEVEL_CACHE_DIR: String = "user://level_cache"
+const LEVEL_CACHE_VERSION: int = 1  ## Bump whenever _generate_level output changes
+
 # Pin types
 enum PinType { NORMAL, LOCKED, TIMED }
 
@@ -51,6 +55,13 @@ var level_active: bool = false
 
 var hint_pin: Node2D = null
 
+# Upcoming level: generated on a worker thread, then built off-tree while this one is played
+var _level_data: Dictionary = {}  # Level -> generated data (main thread only)
+var _prefetch_level: int = 0
+var _prefetch_data: Dictionary = {}  # Written by the worker task, read once it has completed
+var _prefetch_task_id: int = -1
+var _prebuilt: Dictionary = {}  # Detached subtrees and bookkeeping for _prefetch_level
+
 func _ready() -> void:
 	screen_width = get_viewport_rect().size.x
 	screen_height = get_viewport_rect().size.y
@@ -131,6 +142,7 @@ func _pull_pin(pin_data: Dictionary) -> void:
 		hint_pin = null
 
 func _process(delta: float) -> void:
+	_poll_prefetch()
 	if not level_active:
 		return
 
@@ -455,53 +467,12 @@ func _show_hint(pin_data: Dictionary) -> void:
 	tween.chain().tween_callback(hint_effect.queue_free)
 
 func _create_particles(pos: Vector2, color: Color) -> void:
-	for i in range(12):
-		var particle = ColorRect.new()
-		particle.size = Vector2(8, 8)
-		particle.color = color
-		particle.position = pos - Vector2(4, 4)
-		effect_container.add_child(particle)
-
-		var angle = randf() * TAU
-		var speed = randf_range(150, 300)
-		var vel = Vector2(cos(angle), sin(angle)) * speed
-
-		var tween = create_tween()
-		tween.tween_property(particle, "position", particle.position + vel * 0.5, 0.5).set_ease(Tween.EASE_OUT)
-		tween.parallel().tween_property(particle, "modulate:a", 0.0, 0.5)
-		tween.parallel().tween_property(particle, "scale", Vector2(0.1, 0.1), 0.5)
-		tween.tween_callback(particle.queue_free)
+	Effects.emit("burst", ball_container.to_global(pos), color)
 
 func _create_explosion(pos: Vector2) -> void:
-	# Flash
-	var flash = ColorRect.new()
-	flash.size = Vector2(100, 100)
-	flash.position = pos - Vector2(50, 50)
-	flash.color = Color(1, 0.5, 0, 0.8)
-	effect_container.add_child(flash)
-
-	var flash_tween = create_tween()
-	flash_tween.tween_property(flash, "scale", Vector2(2, 2), 0.1)
-	flash_tween.parallel().tween_property(flash, "modulate:a", 0.0, 0.2)
-	flash_tween.tween_callback(flash.queue_free)
-
-	# Debris
-	for i in range(15):
-		var debris = ColorRect.new()
-		debris.size = Vector2(randf_range(4, 12), randf_range(4, 12))
-		debris.color = Color(0.3, 0.3, 0.3)
-		debris.position = pos
-		effect_container.add_child(debris)
-
-		var angle = randf() * TAU
-		var speed = randf_range(200, 400)
-		var end_pos = pos + Vector2(cos(angle), sin(angle)) * speed * 0.4
-
-		var tween = create_tween()
-		tween.tween_property(debris, "position", end_pos, 0.4).set_ease(Tween.EASE_OUT)
-		tween.parallel().tween_property(debris, "rotation", randf_range(-3, 3), 0.4)
-		tween.parallel().tween_property(debris, "modulate:a", 0.0, 0.4)
-		tween.tween_callback(debris.queue_free)
+	var global_pos = ball_container.to_global(pos)
+	Effects.emit("flash", global_pos, Color(1, 0.5, 0, 0.8))
+	Effects.emit("explosion", global_pos, Color(0.3, 0.3, 0.3))
 
 func _screen_shake() -> void:
 	var original_pos = game_container.position
@@ -519,15 +490,16 @@ func _load_level(level: int) -> void:
 	balls_saved = 0
 	balls_lost = 0
 	keys_collected = 0
-	total_keys = 0
-	total_balls = 0
 	hint_pin = null
 
-	# Generate level based on level number
-	var level_data = _generate_level(level)
-	_build_level(level_data)
+	# Swap in the prebuilt subtrees when this is the upcoming level, otherwise build now
+	var built = _take_prebuilt(level)
+	if built.is_empty():
+		built = _build_level(_get_level_data(level))
+	_attach_level(built)
 
 	game_ui.update_stars(0)
+	_prefetch(level + 1)
 
 func _clear_level() -> void:
 	for child in ball_container.get_children():
@@ -539,6 +511,7 @@ func _clear_level() -> void:
 			child.queue_free()
 	for child in effect_container.get_children():
 		child.queue_free()
+	Effects.clear()
 
 	balls.clear()
 	pins.clear()
@@ -546,9 +519,110 @@ func _clear_level() -> void:
 	hazards.clear()
 	walls.clear()
 
+func _get_level_data(level: int) -> Dictionary:
+	if _prefetch_level == level:
+		_finish_prefetch_task()
+	if not _level_data.has(level):
+		_level_data[level] = _read_or_generate_level(level)
+	return _level_data[level]
+
+func _read_or_generate_level(level: int) -> Dictionary:
+	# Safe on a worker thread: own RNG, and only this level's cache file is touched
+	var data = _read_cached_level(level)
+	if data.is_empty():
+		data = _generate_level(level)
+		_write_cached_level(level, data)
+	return data
+
+func _cache_path(level: int) -> String:
+	return "%s/level_%d.bin" % [LEVEL_CACHE_DIR, level]
+
+func _read_cached_level(level: int) -> Dictionary:
+	var path = _cache_path(level)
+	if not FileAccess.file_exists(path):
+		return {}
+	var file = FileAccess.open_compressed(path, FileAccess.READ, FileAccess.COMPRESSION_ZSTD)
+	if not file:
+		return {}
+	var cached = file.get_var()
+	# Entries from an older generator or another screen layout are regenerated
+	if cached is Dictionary and cached.get("version", 0) == LEVEL_CACHE_VERSION and cached.get("grid_offset") == grid_offset:
+		var data = cached.get("data", {})
+		if data is Dictionary:
+			return data
+	return {}
+
+func _write_cached_level(level: int, data: Dictionary) -> void:
+	DirAccess.make_dir_recursive_absolute(LEVEL_CACHE_DIR)
+	var path = _cache_path(level)
+	var temp_path = path + ".tmp"
+	var file = FileAccess.open_compressed(temp_path, FileAccess.WRITE, FileAccess.COMPRESSION_ZSTD)
+	if not file:
+		push_warning("Level cache: could not open %s" % temp_path)
+		return
+	file.store_var({"version": LEVEL_CACHE_VERSION, "grid_offset": grid_offset, "data": data})
+	file.close()
+	DirAccess.rename_absolute(temp_path, path)
+
+func _prefetch(level: int) -> void:
+	## Start preparing a level in the background; _poll_prefetch builds it once the data is in
+	if _prefetch_level == level:
+		return
+	_finish_prefetch_task()
+	_discard_prebuilt()
+	_prefetch_level = level
+	if not _level_data.has(level):
+		_prefetch_task_id = WorkerThreadPool.add_task(_prefetch_task.bind(level))
+
+func _prefetch_task(level: int) -> void:
+	# Runs on a worker thread - the result is only read after the task has completed
+	_prefetch_data = _read_or_generate_level(level)
+
+func _finish_prefetch_task() -> void:
+	if _prefetch_task_id == -1:
+		return
+	WorkerThreadPool.wait_for_task_completion(_prefetch_task_id)
+	_prefetch_task_id = -1
+	_level_data[_prefetch_level] = _prefetch_data
+	_prefetch_data = {}
+
+func _poll_prefetch() -> void:
+	if _prefetch_level == 0 or not _prebuilt.is_empty():
+		return
+	if _prefetch_task_id != -1:
+		if not WorkerThreadPool.is_task_completed(_prefetch_task_id):
+			return
+		_finish_prefetch_task()
+	# Build the detached subtrees now, mid-level, instead of at the transition
+	_prebuilt = _build_level(_level_data[_prefetch_level])
+
+func _take_prebuilt(level: int) -> Dictionary:
+	## Hand over the prebuilt subtrees for a level, or {} when they are not ready
+	if _prefetch_level != level or _prebuilt.is_empty():
+		return {}
+	var built = _prebuilt
+	_prebuilt = {}
+	_prefetch_level = 0
+	return built
+
+func _discard_prebuilt() -> void:
+	if _prebuilt.is_empty():
+		return
+	# Detached subtrees are never freed by the tree, so free them here
+	_prebuilt.world_layer.free()
+	_prebuilt.pin_layer.free()
+	_prebuilt.ball_layer.free()
+	_prebuilt = {}
+
+func _exit_tree() -> void:
+	_finish_prefetch_task()
+	_discard_prebuilt()
+
 func _generate_level(level: int) -> Dictionary:
-	# Seed for consistent level generation
-	seed(level * 12345)
+	# Seeded per level for consistent generation; a private RNG gives the same
+	# sequence as the global seed() but can run on a worker thread
+	var rng = RandomNumberGenerator.new()
+	rng.seed = level * 12345
 
 	var data = {
 		"walls": [],
@@ -565,7 +639,7 @@ func _generate_level(level: int) -> Dictionary:
 	var num_hazards = mini(level / 8, 4)
 	var has_locked_pins = level >= 10
 	var has_timed_pins = level >= 20
-	var num_keys = 1 if has_locked_pins and randi() % 3 == 0 else 0
+	var num_keys = 1 if has_locked_pins and rng.randi() % 3 == 0 else 0
 
 	# Create container walls (left, right, bottom)
 	var container_left = grid_offset.x + CELL_SIZE
@@ -584,9 +658,9 @@ func _generate_level(level: int) -> Dictionary:
 	# Add some internal walls/platforms based on level
 	var num_platforms = 2 + level % 4
 	for i in range(num_platforms):
-		var px = randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE * 2)
-		var py = grid_offset.y + CELL_SIZE * (4 + i * 2 + randf_range(0, 1))
-		var pwidth = randf_range(CELL_SIZE, CELL_SIZE * 3)
+		var px = rng.randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE * 2)
+		var py = grid_offset.y + CELL_SIZE * (4 + i * 2 + rng.randf_range(0, 1))
+		var pwidth = rng.randf_range(CELL_SIZE, CELL_SIZE * 3)
 		data.walls.append({
 			"rect": Rect2(px, py, pwidth, CELL_SIZE * 0.4)
 		})
@@ -604,8 +678,8 @@ func _generate_level(level: int) -> Dictionary:
 	# Create balls at top
 	var ball_spacing = (container_right - container_left) / float(num_balls + 1)
 	for i in range(num_balls):
-		var bx = container_left + ball_spacing * (i + 1) + randf_range(-20, 20)
-		var by = grid_offset.y + CELL_SIZE * 2 + randf_range(0, CELL_SIZE)
+		var bx = container_left + ball_spacing * (i + 1) + rng.randf_range(-20, 20)
+		var by = grid_offset.y + CELL_SIZE * 2 + rng.randf_range(0, CELL_SIZE)
 		data.balls.append({
 			"pos": Vector2(bx, by),
 			"color_idx": i % BALL_COLORS.size()
@@ -615,22 +689,22 @@ func _generate_level(level: int) -> Dictionary:
 	var locked_count = 0
 	var timed_count = 0
 	for i in range(num_pins):
-		var horizontal = randi() % 2 == 0
+		var horizontal = rng.randi() % 2 == 0
 		var px: float
 		var py: float
 
 		if horizontal:
-			px = randf_range(container_left + PIN_LENGTH / 2, container_right - PIN_LENGTH / 2)
-			py = grid_offset.y + CELL_SIZE * (3 + i * 1.5) + randf_range(0, CELL_SIZE * 0.5)
+			px = rng.randf_range(container_left + PIN_LENGTH / 2, container_right - PIN_LENGTH / 2)
+			py = grid_offset.y + CELL_SIZE * (3 + i * 1.5) + rng.randf_range(0, CELL_SIZE * 0.5)
 		else:
-			px = randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
+			px = rng.randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
 			py = grid_offset.y + CELL_SIZE * (4 + i * 1.2)
 
 		var pin_type = PinType.NORMAL
-		if has_locked_pins and locked_count < num_keys and randi() % 4 == 0:
+		if has_locked_pins and locked_count < num_keys and rng.randi() % 4 == 0:
 			pin_type = PinType.LOCKED
 			locked_count += 1
-		elif has_timed_pins and timed_count < 2 and randi() % 5 == 0:
+		elif has_timed_pins and timed_count < 2 and rng.randi() % 5 == 0:
 			pin_type = PinType.TIMED
 			timed_count += 1
 
@@ -642,56 +716,70 @@ func _generate_level(level: int) -> Dictionary:
 
 	# Add hazards
 	for i in range(num_hazards):
-		var hx = randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
-		var hy = grid_offset.y + CELL_SIZE * (6 + i * 2) + randf_range(0, CELL_SIZE)
+		var hx = rng.randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
+		var hy = grid_offset.y + CELL_SIZE * (6 + i * 2) + rng.randf_range(0, CELL_SIZE)
 		data.hazards.append({
 			"pos": Vector2(hx, hy)
 		})
 
 	# Add keys if needed
 	for i in range(num_keys):
-		var kx = randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
-		var ky = grid_offset.y + CELL_SIZE * randf_range(5, 10)
+		var kx = rng.randf_range(container_left + CELL_SIZE, container_right - CELL_SIZE)
+		var ky = grid_offset.y + CELL_SIZE * rng.randf_range(5, 10)
 		data.keys.append({
 			"pos": Vector2(kx, ky)
 		})
 
 	return data
 
-func _build_level(data: Dictionary) -> void:
+func _build_level(data: Dictionary) -> Dictionary:
+	## Build a level's nodes into detached layers (one per container) without touching the tree
+	var built = {
+		"world_layer": Node2D.new(),
+		"pin_layer": Node2D.new(),
+		"ball_layer": Node2D.new(),
+		"walls": [],
+		"goals": [],
+		"hazards": [],
+		"pins": [],
+		"balls": [],
+		"total_keys": 0,
+		"total_balls": 0
+	}
+
 	# Build walls
 	for wall_info in data.walls:
 		var wall = ColorRect.new()
 		wall.size = wall_info.rect.size
 		wall.position = wall_info.rect.position
 		wall.color = Color(0.25, 0.28, 0.35)
-		game_container.add_child(wall)
-		walls.append({"node": wall, "rect": wall_info.rect})
+		built.world_layer.add_child(wall)
+		built.walls.append({"node": wall, "rect": wall_info.rect})
 
 	# Build goals
 	for goal_info in data.goals:
 		var goal = _create_goal(goal_info.pos, goal_info.color_idx)
-		game_container.add_child(goal)
-		goals.append({"node": goal, "color_idx": goal_info.color_idx})
+		built.world_layer.add_child(goal)
+		built.goals.append({"node": goal, "color_idx": goal_info.color_idx})
 
 	# Build hazards
 	for hazard_info in data.hazards:
 		var hazard = _create_hazard(hazard_info.pos)
-		game_container.add_child(hazard)
-		hazards.append(hazard)
+		built.world_layer.add_child(hazard)
+		built.hazards.append(hazard)
 
 	# Build keys
 	for key_info in data.keys:
 		var key = _create_key(key_info.pos)
-		game_container.add_child(key)
-		walls.append({"node": key, "is_key": true})
-		total_keys += 1
+		built.world_layer.add_child(key)
+		built.walls.append({"node": key, "is_key": true})
+		built.total_keys += 1
 
 	# Build pins
 	for pin_info in data.pins:
 		var pin = _create_pin(pin_info.pos, pin_info.horizontal, pin_info.type)
-		pin_container.add_child(pin)
-		pins.append({
+		built.pin_layer.add_child(pin)
+		built.pins.append({
 			"node": pin,
 			"horizontal": pin_info.horizontal,
 			"type": pin_info.type,
@@ -701,14 +789,29 @@ func _build_level(data: Dictionary) -> void:
 	# Build balls
 	for ball_info in data.balls:
 		var ball = _create_ball(ball_info.pos, ball_info.color_idx)
-		ball_container.add_child(ball)
-		balls.append({
+		built.ball_layer.add_child(ball)
+		built.balls.append({
 			"node": ball,
 			"color_idx": ball_info.color_idx,
 			"color": BALL_COLORS[ball_info.color_idx],
 			"velocity": Vector2.ZERO
 		})
-		total_balls += 1
+		built.total_balls += 1
+
+	return built
+
+func _attach_level(built: Dictionary) -> void:
+	# Layers sit at the origin, so node positions stay in container space
+	game_container.add_child(built.world_layer)
+	pin_container.add_child(built.pin_layer)
+	ball_container.add_child(built.ball_layer)
+	walls = built.walls
+	goals = built.goals
+	hazards = built.hazards
+	pins = built.pins
+	balls = built.balls
+	total_keys = built.total_keys
+	total_balls = built.total_balls
 
 func _create_ball(pos: Vector2, color_idx: int) -> Node2D:
 	var ball = Node2D.new()
@@ -866,3 +969,16 @@ func _create_pin(pos: Vector2, horizontal: bool, type: PinType) -> Node2D:
 		pin.add_child(timer_bg)
 
 	return pin
+
+# Snapshot interface - lets the test agent jump straight to late-game states
+func get_snapshot() -> Dictionary:
+	return {
+		"level": GameManager.current_level,
+		"score": GameManager.current_score
+	}
+
+func load_snapshot(data: Dictionary) -> void:
+	GameManager.current_score = int(data.get("score", 0))
+	GameManager.emit_signal("score_changed", GameManager.current_score)
+	GameManager.set_level(int(data.get("level", 1)))
+	_load_level(GameManager.current_level)
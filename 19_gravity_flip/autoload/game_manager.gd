@@ -15,7 +15,7 @@ var session_gems: int = 0
 var distance: float = 0.0
 var sound_enabled: bool = true
 
-const SAVE_PATH = "user://gravity_flip.save"
+const LEGACY_SAVE_PATH = "user://gravity_flip.save"
 
 func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
@@ -71,19 +71,25 @@ func toggle_sound() -> void:
 	_save_data()
 
 func _save_data() -> void:
-	var file = FileAccess.open(SAVE_PATH, FileAccess.WRITE)
-	if file:
-		file.store_var(high_score)
-		file.store_var(total_gems)
-		file.store_var(sound_enabled)
+	SaveManager.set_value("high_score", high_score)
+	SaveManager.set_value("total_gems", total_gems)
+	SaveManager.set_value("sound_enabled", sound_enabled)
 
 func _load_data() -> void:
-	if FileAccess.file_exists(SAVE_PATH):
-		var file = FileAccess.open(SAVE_PATH, FileAccess.READ)
+	if not SaveManager.has_value("high_score"):
+		_import_legacy_save()
+	high_score = SaveManager.get_value("high_score", 0)
+	total_gems = SaveManager.get_value("total_gems", 0)
+	sound_enabled = SaveManager.get_value("sound_enabled", true)
+	AudioManager.sfx_enabled = sound_enabled
+
+func _import_legacy_save() -> void:
+	# One-time import of the save file used before SaveManager
+	if FileAccess.file_exists(LEGACY_SAVE_PATH):
+		var file = FileAccess.open(LEGACY_SAVE_PATH, FileAccess.READ)
 		if file:
-			high_score = file.get_var()
+			SaveManager.set_value("high_score", file.get_var())
 			if not file.eof_reached():
-				total_gems = file.get_var()
+				SaveManager.set_value("total_gems", file.get_var())
 			if not file.eof_reached():
-				sound_enabled = file.get_var()
-	AudioManager.sfx_enabled = sound_enabled
+				SaveManager.set_value("sound_enabled", file.get_var())
@@ -2,6 +2,8 @@ extends Node2D
 ## Game: Main gameplay for Gravity Flip
 ## Infinite runner with gravity flipping mechanic
 
+const RecyclingSpawner = preload("res://scenes/recycling_spawner.gd")
+
 signal player_died
 signal gem_collected
 
@@ -18,6 +20,7 @@ const OBSTACLE_SPAWN_DISTANCE = 400.0
 const GEM_SPAWN_CHANCE = 0.3
 const SPEED_INCREASE_DISTANCE = 500.0
 const SPEED_INCREASE_PERCENT = 0.1
+const COLLISION_WINDOW = 100.0  # Obstacles further than this from the player are not tested
 
 # Game state
 var game_active: bool = false
@@ -33,15 +36,14 @@ var last_speed_milestone: float = 0.0
 var player: Node2D
 var player_visual: ColorRect
 var trail_container: Node2D
-var obstacles_container: Node2D
-var gems_container: Node2D
+var obstacles: RecyclingSpawner
+var gems: RecyclingSpawner
 var stars_container: Node2D
 var floor_line: ColorRect
 var ceiling_line: ColorRect
 var game_ui: CanvasLayer
 
-# Particles
-var gem_particles: Array[Dictionary] = []
+# Trail
 var trail_points: Array[Dictionary] = []
 const MAX_TRAIL_POINTS = 15
 const TRAIL_FADE_SPEED = 3.0
@@ -89,15 +91,14 @@ func _setup_scene() -> void:
 	ceiling_line.z_index = 1
 	add_child(ceiling_line)
 
-	# Obstacles container
-	obstacles_container = Node2D.new()
-	obstacles_container.z_index = 2
-	add_child(obstacles_container)
+	# Obstacles and gems scroll as recycled layers
+	obstacles = RecyclingSpawner.new().setup(_create_obstacle)
+	obstacles.z_index = 2
+	add_child(obstacles)
 
-	# Gems container
-	gems_container = Node2D.new()
-	gems_container.z_index = 2
-	add_child(gems_container)
+	gems = RecyclingSpawner.new().setup(_create_gem)
+	gems.z_index = 2
+	add_child(gems)
 
 	# Trail container
 	trail_container = Node2D.new()
@@ -143,14 +144,11 @@ func _start_game() -> void:
 	player.position = Vector2(150, FLOOR_Y - PLAYER_SIZE / 2)
 	player.rotation = 0.0
 
-	# Clear containers
-	for child in obstacles_container.get_children():
-		child.queue_free()
-	for child in gems_container.get_children():
-		child.queue_free()
+	# Clear scrolling layers
+	obstacles.clear()
+	gems.clear()
 
 	trail_points.clear()
-	gem_particles.clear()
 
 func _input(event: InputEvent) -> void:
 	if event.is_action_pressed("tap") and game_active and not is_flipping:
@@ -176,7 +174,6 @@ func _process(delta: float) -> void:
 	_update_obstacles(delta)
 	_update_gems(delta)
 	_update_trail(delta)
-	_update_particles(delta)
 	_update_stars(delta)
 	_update_shake(delta)
 	_spawn_obstacles()
@@ -212,30 +209,19 @@ func _update_player(delta: float) -> void:
 func _update_trail(delta: float) -> void:
 	for point in trail_points:
 		point.alpha -= TRAIL_FADE_SPEED * delta
-	trail_points = trail_points.filter(func(p): return p.alpha > 0)
+	# Oldest points are at the back and fade out first
+	while not trail_points.is_empty() and trail_points[-1].alpha <= 0:
+		trail_points.pop_back()
 
 func _update_obstacles(delta: float) -> void:
-	var move_amount = current_speed * delta
-	for obstacle in obstacles_container.get_children():
-		obstacle.position.x -= move_amount
-		if obstacle.position.x < -100:
-			obstacle.queue_free()
+	obstacles.scroll(current_speed * delta)
+	obstacles.recycle_behind(-100)
 
 func _update_gems(delta: float) -> void:
-	var move_amount = current_speed * delta
-	for gem in gems_container.get_children():
-		gem.position.x -= move_amount
+	gems.scroll(current_speed * delta)
+	gems.recycle_behind(-50)
+	for gem in gems.get_active():
 		gem.rotation += delta * 2.0
-		if gem.position.x < -50:
-			gem.queue_free()
-
-func _update_particles(delta: float) -> void:
-	for particle in gem_particles:
-		particle.x += particle.vx * delta
-		particle.y += particle.vy * delta
-		particle.vy += 300.0 * delta
-		particle.life -= delta
-	gem_particles = gem_particles.filter(func(p): return p.life > 0)
 
 func _update_stars(delta: float) -> void:
 	var star_speed = current_speed * 0.1
@@ -277,60 +263,52 @@ func _spawn_obstacles() -> void:
 		match obstacle_type:
 			0:
 				# Floor spike
-				_create_spike(spawn_x, FLOOR_Y, false)
+				_spawn_spike(spawn_x, FLOOR_Y, false)
 			1:
 				# Ceiling spike
-				_create_spike(spawn_x, CEILING_Y, true)
+				_spawn_spike(spawn_x, CEILING_Y, true)
 			2:
 				# Both spikes (narrow passage)
-				_create_spike(spawn_x, FLOOR_Y, false)
-				_create_spike(spawn_x, CEILING_Y, true)
+				_spawn_spike(spawn_x, FLOOR_Y, false)
+				_spawn_spike(spawn_x, CEILING_Y, true)
 			3:
 				# Gap (no floor for a bit - handled by collision)
-				_create_gap(spawn_x)
+				_spawn_gap(spawn_x)
 
 		# Spawn gem
 		if randf() < GEM_SPAWN_CHANCE:
 			var gem_y = randf_range(CEILING_Y + 150, FLOOR_Y - 150)
-			_create_gem(spawn_x + 100, gem_y)
+			_spawn_gem(spawn_x + 100, gem_y)
+
+func _create_obstacle() -> Node2D:
+	# Spikes and gaps share one node shape; _spawn_* restyle it on every reuse
+	var obstacle = Node2D.new()
+	obstacle.add_child(ColorRect.new())
+	return obstacle
 
-func _create_spike(x: float, y: float, is_ceiling: bool) -> void:
-	var spike = Node2D.new()
-	spike.position = Vector2(x, y)
+func _spawn_spike(x: float, y: float, is_ceiling: bool) -> void:
+	var spike = obstacles.spawn(Vector2(x, y))
 	spike.set_meta("type", "spike")
+	spike.set_meta("is_ceiling", is_ceiling)
 
-	var spike_visual = ColorRect.new()
+	var spike_visual: ColorRect = spike.get_child(0)
 	spike_visual.color = Color("#e74c3c")
 	spike_visual.size = Vector2(30, 60)
+	spike_visual.position = Vector2(-15, 0) if is_ceiling else Vector2(-15, -60)
 
-	if is_ceiling:
-		spike_visual.position = Vector2(-15, 0)
-		spike.set_meta("is_ceiling", true)
-	else:
-		spike_visual.position = Vector2(-15, -60)
-		spike.set_meta("is_ceiling", false)
-
-	spike.add_child(spike_visual)
-	obstacles_container.add_child(spike)
-
-func _create_gap(x: float) -> void:
-	var gap = Node2D.new()
-	gap.position = Vector2(x, FLOOR_Y)
+func _spawn_gap(x: float) -> void:
+	var gap = obstacles.spawn(Vector2(x, FLOOR_Y))
 	gap.set_meta("type", "gap")
 	gap.set_meta("width", 120.0)
 
 	# Visual indicator of gap (dark area)
-	var gap_visual = ColorRect.new()
+	var gap_visual: ColorRect = gap.get_child(0)
 	gap_visual.color = Color(0, 0, 0, 0.8)
 	gap_visual.size = Vector2(120, 100)
 	gap_visual.position = Vector2(-60, 0)
-	gap.add_child(gap_visual)
-
-	obstacles_container.add_child(gap)
 
-func _create_gem(x: float, y: float) -> void:
+func _create_gem() -> Node2D:
 	var gem = Node2D.new()
-	gem.position = Vector2(x, y)
 	gem.set_meta("type", "gem")
 
 	var gem_visual = ColorRect.new()
@@ -338,8 +316,10 @@ func _create_gem(x: float, y: float) -> void:
 	gem_visual.size = Vector2(25, 25)
 	gem_visual.position = Vector2(-12.5, -12.5)
 	gem.add_child(gem_visual)
+	return gem
 
-	gems_container.add_child(gem)
+func _spawn_gem(x: float, y: float) -> void:
+	gems.spawn(Vector2(x, y)).rotation = 0.0
 
 func _check_collisions() -> void:
 	var player_rect = Rect2(
@@ -349,16 +329,18 @@ func _check_collisions() -> void:
 		PLAYER_SIZE
 	)
 
-	# Check obstacles
-	for obstacle in obstacles_container.get_children():
+	# Check obstacles near the player only
+	var near_x = player.position.x
+	for obstacle in obstacles.in_range(near_x - COLLISION_WINDOW, near_x + COLLISION_WINDOW):
 		var obs_type = obstacle.get_meta("type")
+		var obs_pos = obstacles.parent_position(obstacle)
 
 		if obs_type == "spike":
 			var spike_rect: Rect2
 			if obstacle.get_meta("is_ceiling"):
-				spike_rect = Rect2(obstacle.position.x - 15, obstacle.position.y, 30, 60)
+				spike_rect = Rect2(obs_pos.x - 15, obs_pos.y, 30, 60)
 			else:
-				spike_rect = Rect2(obstacle.position.x - 15, obstacle.position.y - 60, 30, 60)
+				spike_rect = Rect2(obs_pos.x - 15, obs_pos.y - 60, 30, 60)
 
 			if player_rect.intersects(spike_rect):
 				_game_over()
@@ -366,7 +348,7 @@ func _check_collisions() -> void:
 
 		elif obs_type == "gap":
 			var gap_width = obstacle.get_meta("width")
-			var gap_x = obstacle.position.x - gap_width / 2
+			var gap_x = obs_pos.x - gap_width / 2
 
 			# Check if player is over gap and at floor level
 			if player.position.x > gap_x and player.position.x < gap_x + gap_width:
@@ -375,10 +357,11 @@ func _check_collisions() -> void:
 					return
 
 	# Check gems
-	for gem in gems_container.get_children():
+	for gem in gems.in_range(near_x - COLLISION_WINDOW, near_x + COLLISION_WINDOW):
+		var gem_pos = gems.parent_position(gem)
 		var gem_rect = Rect2(
-			gem.position.x - 15,
-			gem.position.y - 15,
+			gem_pos.x - 15,
+			gem_pos.y - 15,
 			30,
 			30
 		)
@@ -386,19 +369,9 @@ func _check_collisions() -> void:
 			_collect_gem(gem)
 
 func _collect_gem(gem: Node2D) -> void:
-	# Spawn particles
-	for i in range(8):
-		var angle = randf() * TAU
-		var speed = randf_range(100, 200)
-		gem_particles.append({
-			"x": gem.position.x,
-			"y": gem.position.y,
-			"vx": cos(angle) * speed,
-			"vy": sin(angle) * speed,
-			"life": 0.5
-		})
-
-	gem.queue_free()
+	Effects.emit("sparkle", gem.global_position, Color(0.204, 0.596, 0.859))
+
+	gems.release(gem)
 	GameManager.add_gem()
 	emit_signal("gem_collected")
 
@@ -427,9 +400,3 @@ func _draw() -> void:
 		var alpha = point.alpha * 0.6
 		var color = Color(0.608, 0.349, 0.714, alpha)
 		draw_circle(point.pos, size, color)
-
-	# Draw gem particles
-	for particle in gem_particles:
-		var alpha = particle.life * 2.0
-		var color = Color(0.204, 0.596, 0.859, alpha)
-		draw_circle(Vector2(particle.x, particle.y), 4, color)
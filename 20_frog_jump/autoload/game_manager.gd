@@ -7,7 +7,7 @@ signal game_started
 signal game_ended
 signal new_high_score(score: int)
 
-const SAVE_PATH = "user://frog_jump_save.json"
+const LEGACY_SAVE_PATH = "user://frog_jump_save.json"
 
 var score: int = 0
 var high_score: int = 0
@@ -45,29 +45,30 @@ func get_score() -> int:
 	return score
 
 func save_data() -> void:
-	var data = {
-		"high_score": high_score,
-		"total_jumps": total_jumps,
-		"games_played": games_played
-	}
-
-	var file = FileAccess.open(SAVE_PATH, FileAccess.WRITE)
-	if file:
-		file.store_string(JSON.stringify(data))
-		file.close()
+	SaveManager.set_value("high_score", high_score)
+	SaveManager.set_value("total_jumps", total_jumps)
+	SaveManager.set_value("games_played", games_played)
 
 func load_data() -> void:
-	if not FileAccess.file_exists(SAVE_PATH):
+	if not SaveManager.has_value("high_score"):
+		_import_legacy_save()
+	high_score = SaveManager.get_value("high_score", 0)
+	total_jumps = SaveManager.get_value("total_jumps", 0)
+	games_played = SaveManager.get_value("games_played", 0)
+
+func _import_legacy_save() -> void:
+	# One-time import of the JSON save used before SaveManager
+	if not FileAccess.file_exists(LEGACY_SAVE_PATH):
 		return
 
-	var file = FileAccess.open(SAVE_PATH, FileAccess.READ)
+	var file = FileAccess.open(LEGACY_SAVE_PATH, FileAccess.READ)
 	if file:
 		var json = JSON.new()
 		var error = json.parse(file.get_as_text())
 		file.close()
 
-		if error == OK:
+		if error == OK and json.data is Dictionary:
 			var data = json.data
-			high_score = data.get("high_score", 0)
-			total_jumps = data.get("total_jumps", 0)
-			games_played = data.get("games_played", 0)
+			SaveManager.set_value("high_score", int(data.get("high_score", 0)))
+			SaveManager.set_value("total_jumps", int(data.get("total_jumps", 0)))
+			SaveManager.set_value("games_played", int(data.get("games_played", 0)))
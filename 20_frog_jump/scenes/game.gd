@@ -2,6 +2,8 @@ extends Node2D
 ## Frog Jump - Tap and hold to charge, release to jump!
 ## Lateral scrolling - always jump to the right!
 
+const RecyclingSpawner = preload("res://scenes/recycling_spawner.gd")
+
 signal jump_completed(jump_count: int)
 signal game_over_triggered
 
@@ -37,6 +39,12 @@ const TRAJECTORY_FADE_JUMPS = 5
 const FROG_SCREEN_X = 200.0  # Frog stays at left side of screen
 const CAMERA_SMOOTH = 4.0
 
+# Scenery parallax (fraction of the camera movement each layer follows)
+const CLOUD_PARALLAX = 0.3
+const TREE_PARALLAX = 0.8
+const CLOUD_SPACING = Vector2(100, 300)  # Min/max gap to the next cloud in its layer
+const TREE_SPACING = Vector2(60, 200)
+
 # Rope swing (tongue) settings
 const ROPE_SWING_UNLOCK_PLATFORM = 10  # Unlocks after platform 10
 const TONGUE_ANGLE = 45.0  # Degrees from horizontal (upward-right)
@@ -75,17 +83,18 @@ var background_container: Node2D
 var game_ui: CanvasLayer
 var charge_indicator: Node2D
 
-# Platform data
-var platforms: Array[Dictionary] = []
+# Platform data - platforms and scenery are recycled once they scroll off the left
+var platforms: RecyclingSpawner
+var platform_count: int = 0
+var last_platform_pos: Vector2 = Vector2.ZERO
 var camera_x: float = 0.0
 var camera_target_x: float = 0.0
 
-# Visual effects
-var landing_particles: Array[Dictionary] = []
-
 # Background elements
-var clouds: Array[Dictionary] = []
-var trees: Array[Dictionary] = []
+var clouds: RecyclingSpawner
+var trees: RecyclingSpawner
+var next_cloud_x: float = 0.0
+var next_tree_x: float = 0.0
 
 func _ready() -> void:
 	_setup_scene()
@@ -99,6 +108,12 @@ func _setup_scene() -> void:
 	bg.size = Vector2(SCREEN_WIDTH, SCREEN_HEIGHT)
 	add_child(bg)
 
+	# Parallax scenery layers, in screen space behind the world
+	clouds = RecyclingSpawner.new().setup(_create_cloud)
+	add_child(clouds)
+	trees = RecyclingSpawner.new().setup(_create_tree)
+	add_child(trees)
+
 	# World container - moves with camera
 	world_container = Node2D.new()
 	add_child(world_container)
@@ -128,6 +143,8 @@ func _setup_scene() -> void:
 	platforms_container = Node2D.new()
 	platforms_container.z_index = 1
 	world_container.add_child(platforms_container)
+	platforms = RecyclingSpawner.new().setup(_create_platform)
+	platforms_container.add_child(platforms)
 
 	# Trajectory container
 	trajectory_container = Node2D.new()
@@ -142,9 +159,6 @@ func _setup_scene() -> void:
 	# Create frog
 	_create_frog()
 
-	# Create background elements
-	_create_background_elements()
-
 	# Charge indicator
 	_create_charge_indicator()
 
@@ -249,30 +263,61 @@ func _create_circle_polygon(radius: float, segments: int = 12) -> PackedVector2A
 	return points
 
 func _create_background_elements() -> void:
-	# Create initial clouds
-	for i in range(10):
-		_add_cloud(randf() * 2000, randf_range(50, 300))
-
-	# Create initial trees/bushes
-	for i in range(15):
-		_add_tree(randf() * 2000, SCREEN_HEIGHT - 180)
+	next_cloud_x = randf_range(0, CLOUD_SPACING.y)
+	next_tree_x = randf_range(0, TREE_SPACING.y)
+	_extend_scenery()
+
+func _extend_scenery() -> void:
+	# Scenery is laid out just ahead of the screen in increasing x, the order the
+	# layers recycle in (cloud drift is a few pixels per second, so it stays close)
+	while next_cloud_x - camera_x * CLOUD_PARALLAX < SCREEN_WIDTH + 200:
+		_add_cloud(next_cloud_x, randf_range(50, 300))
+		next_cloud_x += randf_range(CLOUD_SPACING.x, CLOUD_SPACING.y)
+	while next_tree_x - camera_x * TREE_PARALLAX < SCREEN_WIDTH + 100:
+		_add_tree(next_tree_x, SCREEN_HEIGHT - 180)
+		next_tree_x += randf_range(TREE_SPACING.x, TREE_SPACING.y)
+
+func _create_cloud() -> Node2D:
+	var cloud = Node2D.new()
+	for i in range(3):
+		var puff = Polygon2D.new()
+		puff.color = Color(1, 1, 1, 0.7)
+		cloud.add_child(puff)
+	return cloud
 
 func _add_cloud(x: float, y: float) -> void:
-	clouds.append({
-		"x": x,
-		"y": y,
-		"width": randf_range(80, 150),
-		"height": randf_range(30, 50),
-		"speed": randf_range(10, 30)
-	})
+	var cloud = clouds.spawn(Vector2(x - camera_x * CLOUD_PARALLAX, y))
+	var width = randf_range(80, 150)
+	var puffs = [[Vector2.ZERO, 0.3], [Vector2(width * 0.3, -10), 0.25], [Vector2(-width * 0.3, 5), 0.2]]
+	for i in range(puffs.size()):
+		var puff: Polygon2D = cloud.get_child(i)
+		puff.position = puffs[i][0]
+		puff.polygon = _create_circle_polygon(width * puffs[i][1])
+	cloud.set_meta("speed", randf_range(10, 30))
+
+func _create_tree() -> Node2D:
+	var tree = Node2D.new()
+	var trunk = ColorRect.new()
+	trunk.color = Color(0.4, 0.26, 0.13)
+	tree.add_child(trunk)
+	for i in range(3):
+		var foliage = Polygon2D.new()
+		foliage.color = Color(0.13, 0.55, 0.13, 0.8)
+		tree.add_child(foliage)
+	return tree
 
 func _add_tree(x: float, y: float) -> void:
-	trees.append({
-		"x": x,
-		"y": y,
-		"height": randf_range(40, 80),
-		"width": randf_range(30, 50)
-	})
+	var tree = trees.spawn(Vector2(x - camera_x * TREE_PARALLAX, y))
+	var height = randf_range(40, 80)
+	var width = randf_range(30, 50)
+	var trunk: ColorRect = tree.get_child(0)
+	trunk.position = Vector2(-5, -height * 0.3)
+	trunk.size = Vector2(10, height * 0.5)
+	var foliage = [[Vector2(0, -height * 0.5), 0.5], [Vector2(-15, -height * 0.3), 0.35], [Vector2(15, -height * 0.35), 0.4]]
+	for i in range(foliage.size()):
+		var part: Polygon2D = tree.get_child(i + 1)
+		part.position = foliage[i][0]
+		part.polygon = _create_circle_polygon(width * foliage[i][1])
 
 func _create_charge_indicator() -> void:
 	charge_indicator = Node2D.new()
@@ -299,54 +344,61 @@ func _start_game() -> void:
 	swing_angular_velocity = 0.0
 	rope_swing_available = false
 
-	# Clear containers
-	for child in platforms_container.get_children():
-		child.queue_free()
+	# Clear containers (scenery is rebuilt since the camera starts over)
+	platforms.clear()
+	platform_count = 0
+	clouds.clear()
+	trees.clear()
+	_create_background_elements()
 	for child in trajectory_container.get_children():
 		child.queue_free()
 
-	platforms.clear()
-	landing_particles.clear()
-
 	# Create initial platforms
-	_create_initial_platforms()
+	var first_platform = _create_initial_platforms()
 
 	# Position frog on first platform
-	var first_platform = platforms[0]
-	frog.position = Vector2(first_platform.x, first_platform.y - 25)
+	frog.position = first_platform.position + Vector2(0, -25)
 	frog.rotation = 0
 	frog.scale = Vector2.ONE
 
 	# Set initial camera
-	camera_x = first_platform.x - FROG_SCREEN_X
+	camera_x = first_platform.position.x - FROG_SCREEN_X
 	camera_target_x = camera_x
 
-func _create_initial_platforms() -> void:
+func _create_initial_platforms() -> Node2D:
 	# Starting platform (large, at left)
 	var start_x = 150.0
 	var start_y = SCREEN_HEIGHT - 350
-	_add_platform(start_x, start_y, PLATFORM_START_WIDTH * 1.5)
+	var first_platform = _add_platform(start_x, start_y, PLATFORM_START_WIDTH * 1.5)
 
 	# Generate next platforms (going right)
 	for i in range(10):
 		_generate_next_platform()
+	return first_platform
 
-func _add_platform(x: float, y: float, width: float) -> void:
-	var platform_data = {
-		"x": x,
-		"y": y,
-		"width": width,
-		"index": platforms.size()
-	}
-	platforms.append(platform_data)
-
-	# Create visual
+func _create_platform() -> Node2D:
 	var platform = Node2D.new()
-	platform.position = Vector2(x, y)
 
 	# Platform top (lily pad style)
 	var pad = Polygon2D.new()
 	pad.color = Color(0.0, 0.502, 0.0)  # Dark green
+	platform.add_child(pad)
+
+	# Highlight
+	var highlight = Polygon2D.new()
+	highlight.color = Color(0.196, 0.804, 0.196, 0.5)
+	platform.add_child(highlight)
+	return platform
+
+func _add_platform(x: float, y: float, width: float) -> Node2D:
+	var platform = platforms.spawn(Vector2(x, y))
+	platform.set_meta("width", width)
+	platform.set_meta("index", platform_count)
+	platform_count += 1
+	last_platform_pos = Vector2(x, y)
+
+	# Shape the pad for this width
+	var pad: Polygon2D = platform.get_child(0)
 	var half_w = width / 2
 	pad.polygon = PackedVector2Array([
 		Vector2(-half_w, 0),
@@ -358,11 +410,8 @@ func _add_platform(x: float, y: float, width: float) -> void:
 		Vector2(0, PLATFORM_HEIGHT * 0.5),
 		Vector2(-half_w * 0.8, PLATFORM_HEIGHT * 0.3)
 	])
-	platform.add_child(pad)
 
-	# Highlight
-	var highlight = Polygon2D.new()
-	highlight.color = Color(0.196, 0.804, 0.196, 0.5)
+	var highlight: Polygon2D = platform.get_child(1)
 	highlight.polygon = PackedVector2Array([
 		Vector2(-half_w * 0.6, -PLATFORM_HEIGHT * 0.2),
 		Vector2(0, -PLATFORM_HEIGHT * 0.1),
@@ -370,16 +419,14 @@ func _add_platform(x: float, y: float, width: float) -> void:
 		Vector2(half_w * 0.3, PLATFORM_HEIGHT * 0.1),
 		Vector2(-half_w * 0.4, PLATFORM_HEIGHT * 0.15)
 	])
-	platform.add_child(highlight)
-
-	platforms_container.add_child(platform)
+	return platform
 
 func _generate_next_platform() -> void:
-	if platforms.is_empty():
+	if platform_count == 0:
 		return
 
-	var last = platforms[-1]
-	var platform_num = platforms.size()
+	var last = last_platform_pos
+	var platform_num = platform_count
 
 	# Calculate horizontal distance (always to the right, increases with platform number)
 	var base_distance = PLATFORM_START_DISTANCE_X + platform_num * PLATFORM_DISTANCE_INCREASE
@@ -405,12 +452,6 @@ func _generate_next_platform() -> void:
 
 	_add_platform(new_x, new_y, width)
 
-	# Add background elements as we progress
-	if randf() > 0.5:
-		_add_tree(new_x + randf_range(-100, 100), SCREEN_HEIGHT - 180)
-	if randf() > 0.7:
-		_add_cloud(new_x + randf_range(0, 300), randf_range(50, 250))
-
 func _input(event: InputEvent) -> void:
 	if not game_active:
 		return
@@ -570,7 +611,6 @@ func _process(delta: float) -> void:
 		_update_frog_physics(delta)
 
 	_update_camera(delta)
-	_update_particles(delta)
 	_update_background(delta)
 	_check_generate_platforms()
 	queue_redraw()
@@ -661,25 +701,26 @@ func _update_frog_physics(delta: float) -> void:
 		_game_over()
 
 func _check_landing() -> void:
-	# Check collision with platforms
-	for i in range(platforms.size()):
-		var platform = platforms[i]
-		var half_width = platform.width / 2
+	# Check collision with platforms close enough horizontally to be under the frog
+	var max_half_width = PLATFORM_START_WIDTH * 0.75
+	for platform in platforms.in_range(frog.position.x - max_half_width, frog.position.x + max_half_width):
+		var half_width = platform.get_meta("width") / 2
+		var pos = platform.position
 
 		# Check if frog is within platform horizontal bounds
-		if frog.position.x >= platform.x - half_width and frog.position.x <= platform.x + half_width:
+		if frog.position.x >= pos.x - half_width and frog.position.x <= pos.x + half_width:
 			# Check if frog is landing on platform (coming from above)
-			if frog_velocity.y > 0 and frog.position.y >= platform.y - 30 and frog.position.y <= platform.y + 10:
-				_land_on_platform(i)
+			if frog_velocity.y > 0 and frog.position.y >= pos.y - 30 and frog.position.y <= pos.y + 10:
+				_land_on_platform(platform)
 				return
 
-func _land_on_platform(platform_index: int) -> void:
-	var platform = platforms[platform_index]
+func _land_on_platform(platform: Node2D) -> void:
+	var platform_index: int = platform.get_meta("index")
 
 	# Stop frog - NO sliding, stays exactly where it lands
 	frog_jumping = false
 	frog_velocity = Vector2.ZERO
-	frog.position.y = platform.y - 25
+	frog.position.y = platform.position.y - 25
 	frog.rotation = 0
 
 	# Reset legs
@@ -711,17 +752,7 @@ func _land_on_platform(platform_index: int) -> void:
 		return
 
 func _spawn_landing_particles(pos: Vector2) -> void:
-	for i in range(8):
-		var angle = randf() * PI  # Only upward
-		var speed = randf_range(100, 200)
-		landing_particles.append({
-			"x": pos.x,
-			"y": pos.y,
-			"vx": cos(angle) * speed * (1 if randf() > 0.5 else -1),
-			"vy": -sin(angle) * speed,
-			"life": 0.5,
-			"size": randf_range(3, 6)
-		})
+	Effects.emit("dust", world_container.to_global(pos), Color(0.565, 0.933, 0.565))
 
 func _update_camera(delta: float) -> void:
 	# Camera follows frog horizontally (frog stays at left side of screen)
@@ -733,30 +764,30 @@ func _update_camera(delta: float) -> void:
 	# Move world container (simulates camera moving right)
 	world_container.position.x = -camera_x
 
-func _update_particles(delta: float) -> void:
-	# Update landing particles
-	for particle in landing_particles:
-		particle.x += particle.vx * delta
-		particle.y += particle.vy * delta
-		particle.vy += GRAVITY * 0.5 * delta
-		particle.life -= delta
-
-	landing_particles = landing_particles.filter(func(p): return p.life > 0)
-
 func _update_background(delta: float) -> void:
+	# Parallax layers follow the camera at a fraction of its speed
+	clouds.position.x = -camera_x * CLOUD_PARALLAX
+	trees.position.x = -camera_x * TREE_PARALLAX
+
 	# Move clouds slowly
-	for cloud in clouds:
-		cloud.x -= cloud.speed * delta * 0.1
+	for cloud in clouds.get_active():
+		cloud.position.x -= cloud.get_meta("speed") * delta * 0.1
+
+	# Recycle whatever scrolled off the left edge and lay out what comes into view
+	_extend_scenery()
+	clouds.recycle_behind(-200)
+	trees.recycle_behind(-100)
+	platforms.recycle_behind(camera_x - PLATFORM_START_WIDTH)
 
 func _check_generate_platforms() -> void:
 	# Generate more platforms as frog progresses right
 	var furthest_x = 0.0
-	if not platforms.is_empty():
-		furthest_x = platforms[-1].x
+	if platform_count > 0:
+		furthest_x = last_platform_pos.x
 
 	while furthest_x < frog.position.x + SCREEN_WIDTH * 2:
 		_generate_next_platform()
-		furthest_x = platforms[-1].x
+		furthest_x = last_platform_pos.x
 
 func _game_over() -> void:
 	game_active = false
@@ -778,34 +809,7 @@ func restart() -> void:
 		game_ui.hide_game_over()
 
 func _draw() -> void:
-	# Draw clouds (parallax - move slower than camera)
-	for cloud in clouds:
-		var screen_x = cloud.x - camera_x * 0.3
-		if screen_x > -200 and screen_x < SCREEN_WIDTH + 200:
-			var cloud_color = Color(1, 1, 1, 0.7)
-			# Draw cloud as ellipses
-			draw_circle(Vector2(screen_x, cloud.y), cloud.width * 0.3, cloud_color)
-			draw_circle(Vector2(screen_x + cloud.width * 0.3, cloud.y - 10), cloud.width * 0.25, cloud_color)
-			draw_circle(Vector2(screen_x - cloud.width * 0.3, cloud.y + 5), cloud.width * 0.2, cloud_color)
-
-	# Draw trees (parallax - move slightly slower)
-	for tree in trees:
-		var screen_x = tree.x - camera_x * 0.8
-		if screen_x > -100 and screen_x < SCREEN_WIDTH + 100:
-			# Tree trunk
-			draw_rect(Rect2(screen_x - 5, tree.y - tree.height * 0.3, 10, tree.height * 0.5), Color(0.4, 0.26, 0.13))
-			# Tree foliage
-			var foliage_color = Color(0.13, 0.55, 0.13, 0.8)
-			draw_circle(Vector2(screen_x, tree.y - tree.height * 0.5), tree.width * 0.5, foliage_color)
-			draw_circle(Vector2(screen_x - 15, tree.y - tree.height * 0.3), tree.width * 0.35, foliage_color)
-			draw_circle(Vector2(screen_x + 15, tree.y - tree.height * 0.35), tree.width * 0.4, foliage_color)
-
-	# Draw landing particles
-	for particle in landing_particles:
-		var alpha = particle.life * 2
-		var color = Color(0.565, 0.933, 0.565, alpha)
-		var screen_x = particle.x - camera_x
-		draw_circle(Vector2(screen_x, particle.y), particle.size, color)
+	# Clouds and trees are recycled nodes in the parallax layers
 
 	# Draw charge indicator (fixed to screen, above frog)
 	if is_charging:
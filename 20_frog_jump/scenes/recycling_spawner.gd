@@ -0,0 +1,133 @@
+extends Node2D
+## RecyclingSpawner: Scrolling layer of reusable world objects
+## Active objects live in a ring buffer ordered along the scroll axis, so the
+## trailing edge is always at the head: objects that scroll past it are hidden
+## and handed back to the next spawn instead of being freed, and range queries
+## stop at the first object beyond the range. Positions passed in and out are
+## in the parent's space; the layer itself moves when the world scrolls.
+## Games preload it as a const (class_name needs an editor import to resolve)
+
+signal object_recycled(obj)
+
+const MIN_CAPACITY: int = 8
+
+var axis: Vector2 = Vector2.RIGHT  # Direction new objects appear in (ahead of the player)
+var factory: Callable  # Returns a new object when no recycled one is free
+
+var _ring: Array = []
+var _head: int = 0
+var _count: int = 0
+var _free: Array = []
+var _released: Dictionary = {}  # Instance id -> true for objects removed mid-buffer
+
+func setup(object_factory: Callable, scroll_axis: Vector2 = Vector2.RIGHT, capacity: int = MIN_CAPACITY):
+	factory = object_factory
+	axis = scroll_axis.normalized()
+	_ring.resize(max(capacity, MIN_CAPACITY))
+	return self
+
+func spawn(pos: Vector2):
+	## Place an object (recycled when possible) at the leading edge; spawn in scroll order
+	var obj
+	if _free.is_empty():
+		obj = factory.call()
+		add_child(obj)
+	else:
+		obj = _free.pop_back()
+		obj.process_mode = Node.PROCESS_MODE_INHERIT
+		obj.show()
+	obj.position = pos - position
+	_push(obj)
+	return obj
+
+func scroll(distance: float) -> void:
+	## Move every object back along the axis at once
+	position -= axis * distance
+
+func recycle_behind(edge: float) -> int:
+	## Recycle objects whose axis position has fallen behind the trailing edge
+	var recycled = 0
+	while _count > 0:
+		var obj = _ring[_head]
+		if not _released.has(obj.get_instance_id()) and axis_position(obj) >= edge:
+			break
+		_pop_head()
+		_recycle(obj)
+		recycled += 1
+	return recycled
+
+func release(obj) -> void:
+	## Take an object out of play now (e.g. a collected gem); its slot frees up
+	## once it reaches the trailing edge
+	_released[obj.get_instance_id()] = true
+	obj.hide()
+	obj.process_mode = Node.PROCESS_MODE_DISABLED
+
+func in_range(from: float, to: float) -> Array:
+	## Active objects whose axis position lies in [from, to], in scroll order
+	var found = []
+	for i in range(_count):
+		var obj = _ring[(_head + i) % _ring.size()]
+		var at = axis_position(obj)
+		if at > to:
+			break
+		if at >= from and not _released.has(obj.get_instance_id()):
+			found.append(obj)
+	return found
+
+func get_active() -> Array:
+	## Every active object, in scroll order
+	var found = []
+	for i in range(_count):
+		var obj = _ring[(_head + i) % _ring.size()]
+		if not _released.has(obj.get_instance_id()):
+			found.append(obj)
+	return found
+
+func last():
+	## Object furthest along the axis (null when empty)
+	return _ring[(_head + _count - 1) % _ring.size()] if _count > 0 else null
+
+func size() -> int:
+	return _count
+
+func clear() -> void:
+	## Recycle everything and reset the scroll
+	while _count > 0:
+		_recycle(_pop_head())
+	position = Vector2.ZERO
+
+func axis_position(obj) -> float:
+	return (position + obj.position).dot(axis)
+
+func parent_position(obj) -> Vector2:
+	return position + obj.position
+
+func _push(obj) -> void:
+	if _count == _ring.size():
+		_grow()
+	_ring[(_head + _count) % _ring.size()] = obj
+	_count += 1
+
+func _pop_head():
+	var obj = _ring[_head]
+	_ring[_head] = null
+	_head = (_head + 1) % _ring.size()
+	_count -= 1
+	return obj
+
+func _grow() -> void:
+	var grown = []
+	grown.resize(max(_ring.size() * 2, MIN_CAPACITY))
+	for i in range(_count):
+		grown[i] = _ring[(_head + i) % _ring.size()]
+	_ring = grown
+	_head = 0
+
+func _recycle(obj) -> void:
+	# Disabled objects also drop out of physics, so recycled areas stop colliding
+	_released.erase(obj.get_instance_id())
+	obj.hide()
+	obj.process_mode = Node.PROCESS_MODE_DISABLED
+	_free.append(obj)
+	object_recycled.emit(obj)
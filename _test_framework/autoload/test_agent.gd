@@ -23,6 +23,64 @@ var screenshots: Array[Image] = []
 var simulated_touches: Dictionary = {}
 var pending_actions: Array[Dictionary] = []
 
+# Frames to wait for the game scene before giving up on a snapshot
+const SNAPSHOT_WAIT_FRAMES = 120
+
+# Input trace recording and replay
+const TRACE_VERSION = 1
+const TRACE_FPS = 60  # Replays run with --fixed-fps at this rate
+const TRACE_PATH = "user://input_trace.json"
+var trace_seed: int = 0
+var agent_rng := RandomNumberGenerator.new()  # Scenario randomness; the global RNG belongs to the game
+var trace_frame: int = 0
+var trace_events: Array[Dictionary] = []
+var is_recording: bool = false
+var is_replaying: bool = false
+var replay_events: Array = []
+var replay_index: int = 0
+var replay_end_frame: int = 0
+
+# Performance sampling (wall-clock time per frame, independent of --fixed-fps)
+var frame_times_ms: PackedFloat32Array = []
+var last_frame_usec: int = 0
+var startup_ms: int = 0  # Engine start to first processed frame
+const MEMORY_SAMPLE_FRAMES = 30
+var memory_samples: PackedVector2Array = []  # (seconds, MB)
+
+# Heuristic bot players (scripts copied into res://test_bots/ by the orchestrator)
+const BOTS_DIR = "res://test_bots/"
+const BOT_DEFAULT_DURATION = 180.0
+var bot_name: String = ""
+var bot_inputs: int = 0
+var survival_time: float = 0.0
+var bot_game_over: bool = false
+
+# Input-to-response latency: each simulated press is timed until the game's first
+# reaction - a GameManager signal, a watched property change (test_config
+# "latency_watch") or the redraw of a canvas item that was not already redrawing.
+# Only the game root and the test_config "latency_redraw" paths (relative to the
+# root) are watched for redraws, so the measurement stays out of the game's way
+const LATENCY_TIMEOUT_FRAMES = 30
+const LATENCY_SIGNALS = ["score_changed", "game_started", "game_over", "game_ended"]
+var latency_watches: Array = []
+var latency_probe: Dictionary = {}  # Pending press: frame, usec, scenario, values
+var latency_samples: Array[Dictionary] = []
+var latency_missed: Dictionary = {}  # Scenario -> presses without a reaction
+var last_draw_frame: Dictionary = {}  # CanvasItem instance id -> last frame it drew
+var redraw_callbacks: Dictionary = {}  # CanvasItem instance id -> its draw connection
+
+# Scene-tree index, kept current by node_added/node_removed so queries never walk
+# the tree. Selectors: "Type" (native class or subclass), "#name" (case-insensitive
+# substring), ".group", ":method"; combine as "Button#play", alternate with commas.
+# Groups use the engine's own index; methods outside INDEXED_METHODS and bare
+# "#name" selectors fall back to scanning the index rather than the tree
+const INDEXED_METHODS = ["_on_swipe", "handle_swipe", "_on_drag", "handle_drag", "load_snapshot", "get_snapshot"]
+const BUTTON_TYPES = ["Button", "TextureButton"]
+var nodes_by_class: Dictionary = {}  # Native class -> {instance id: node}
+var nodes_by_method: Dictionary = {}  # Indexed method -> {instance id: node}
+var parsed_selectors: Dictionary = {}
+var selector_regex := RegEx.create_from_string("([#.:]?)([^#.:]+)")
+
 # Test scenarios by game type
 const TEST_SCENARIOS = {
 	"tap": [
@@ -83,27 +141,355 @@ const TEST_SCENARIOS = {
 
 func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
+	_setup_node_index()
 	_load_test_config()
-	if test_config.get("auto_start", false):
+	_setup_trace()
+	call_deferred("_setup_latency_probes")
+	if is_replaying:
+		start_replay()
+	elif test_config.get("auto_start", false):
 		call_deferred("start_tests")
 
+func _setup_trace() -> void:
+	# Seed the global RNG before the first scene runs so a trace replays the same game.
+	# Scenario steps draw from agent_rng instead: they do not run during a replay, so
+	# sharing the global stream would hand the game a different sequence
+	var replay: Dictionary = test_config.get("replay", {})
+	is_replaying = not replay.is_empty()
+	trace_seed = int(replay.get("seed", test_config.get("seed", randi())))
+	seed(trace_seed)
+	agent_rng.seed = trace_seed
+	is_recording = test_config.get("record_trace", false) and not is_replaying
+	if is_recording:
+		print("[TEST_AGENT] Recording input trace (seed %d)" % trace_seed)
+
 func _load_test_config() -> void:
-	var config_path = "user://test_config.json"
-	if FileAccess.file_exists(config_path):
-		var file = FileAccess.open(config_path, FileAccess.READ)
-		var json = JSON.new()
-		if json.parse(file.get_as_text()) == OK:
-			test_config = json.data
-		file.close()
+	# The orchestrator writes the config next to project.godot; user:// overrides it
+	for config_path in ["user://test_config.json", "res://test_config.json"]:
+		if FileAccess.file_exists(config_path):
+			var file = FileAccess.open(config_path, FileAccess.READ)
+			var json = JSON.new()
+			if json.parse(file.get_as_text()) == OK:
+				test_config = json.data
+			file.close()
+			return
 
 func _process(delta: float) -> void:
+	if startup_ms == 0:
+		startup_ms = Time.get_ticks_msec()
+	trace_frame += 1
+	if is_replaying:
+		_replay_frame()
+
 	if not is_testing:
 		return
 
 	frames_elapsed += 1
+	_sample_frame_time()
+	_expire_latency_probe()
 	_process_pending_actions(delta)
 	_check_for_errors()
 
+func _input(event: InputEvent) -> void:
+	if is_recording:
+		_record_event(event)
+
+func _notification(what: int) -> void:
+	# Manual sessions end by closing the window rather than through _finish_tests()
+	if what == NOTIFICATION_WM_CLOSE_REQUEST and is_recording and not is_testing:
+		_save_trace()
+
+func _sample_frame_time() -> void:
+	var now = Time.get_ticks_usec()
+	if last_frame_usec > 0:
+		frame_times_ms.append((now - last_frame_usec) / 1000.0)
+	last_frame_usec = now
+	if frames_elapsed % MEMORY_SAMPLE_FRAMES == 0:
+		memory_samples.append(Vector2(now / 1000000.0, OS.get_static_memory_usage() / 1048576.0))
+
+func _setup_latency_probes() -> void:
+	# Called deferred, once every autoload (GameManager included) is in the tree
+	latency_watches = test_config.get("latency_watch", [])
+	var gm = get_node_or_null("/root/GameManager")
+	if gm:
+		for signal_info in gm.get_signal_list():
+			if signal_info.name in LATENCY_SIGNALS:
+				var reaction = _on_latency_reaction.bind("signal:" + signal_info.name)
+				gm.connect(signal_info.name, reaction.unbind(signal_info.args.size()))
+	RenderingServer.frame_pre_draw.connect(_check_latency_watches)
+
+func _is_redraw_watched(node: Node) -> bool:
+	# The scene root is current_scene before it enters the tree, children follow it
+	var scene = get_tree().current_scene
+	if node == scene:
+		return true
+	var paths: Array = test_config.get("latency_redraw", [])
+	if paths.is_empty() or not scene or not scene.is_ancestor_of(node):
+		return false
+	return str(scene.get_path_to(node)) in paths
+
+func _watch_redraws(node: Node) -> void:
+	# A node's first draw is its appearance, not a reaction, so it counts as drawn now
+	var id = node.get_instance_id()
+	if node is CanvasItem and not redraw_callbacks.has(id):
+		last_draw_frame[id] = Engine.get_process_frames()
+		redraw_callbacks[id] = _on_canvas_draw.bind(id, node.name)
+		node.draw.connect(redraw_callbacks[id])
+		node.tree_exiting.connect(_unwatch_redraws.bind(node, id), CONNECT_ONE_SHOT)
+
+func _unwatch_redraws(node: CanvasItem, id: int) -> void:
+	# Runs for free() as well as queue_free(); a moved node is watched again on re-entry
+	node.draw.disconnect(redraw_callbacks[id])
+	redraw_callbacks.erase(id)
+	last_draw_frame.erase(id)
+
+func _setup_node_index() -> void:
+	# Autoloads run _ready before the main scene enters, so only the root needs a walk
+	get_tree().node_added.connect(_index_node)
+	get_tree().node_removed.connect(_unindex_node)
+	_index_subtree(get_tree().root)
+
+func _index_subtree(node: Node) -> void:
+	_index_node(node)
+	for child in node.get_children():
+		_index_subtree(child)
+
+func _index_node(node: Node) -> void:
+	var id = node.get_instance_id()
+	var node_class = node.get_class()
+	if not nodes_by_class.has(node_class):
+		nodes_by_class[node_class] = {}
+	nodes_by_class[node_class][id] = node
+	for method in INDEXED_METHODS:
+		if node.has_method(method):
+			if not nodes_by_method.has(method):
+				nodes_by_method[method] = {}
+			nodes_by_method[method][id] = node
+	if _is_redraw_watched(node):
+		_watch_redraws(node)
+
+func _unindex_node(node: Node) -> void:
+	var id = node.get_instance_id()
+	if nodes_by_class.has(node.get_class()):
+		nodes_by_class[node.get_class()].erase(id)
+	for method in nodes_by_method:
+		nodes_by_method[method].erase(id)
+
+func select(selector: String, under: Node = null) -> Array[Node]:
+	## Nodes matching a selector, optionally limited to a subtree
+	var found: Array[Node] = []
+	for alternative in selector.split(","):
+		for node in _select_query(_parse_selector(alternative.strip_edges())):
+			if under and node != under and not under.is_ancestor_of(node):
+				continue
+			if not found.has(node):
+				found.append(node)
+	return found
+
+func select_first(selector: String, under: Node = null) -> Node:
+	var found = select(selector, under)
+	return found[0] if not found.is_empty() else null
+
+func _parse_selector(selector: String) -> Dictionary:
+	if parsed_selectors.has(selector):
+		return parsed_selectors[selector]
+	var query = {"type": "", "name": "", "groups": [], "methods": []}
+	for part in selector_regex.search_all(selector):
+		var value = part.get_string(2)
+		match part.get_string(1):
+			"":
+				query.type = value
+			"#":
+				query.name = value.to_lower()
+			".":
+				query.groups.append(value)
+			":":
+				query.methods.append(value)
+	parsed_selectors[selector] = query
+	return query
+
+func _select_query(query: Dictionary) -> Array:
+	# Start from the narrowest indexed set, then filter on the remaining parts
+	var candidates: Array = []
+	var indexed_methods = query.methods.filter(func(m): return nodes_by_method.has(m))
+	if not indexed_methods.is_empty():
+		candidates = nodes_by_method[indexed_methods[0]].values()
+	elif not query.groups.is_empty():
+		candidates = get_tree().get_nodes_in_group(query.groups[0])
+	else:
+		for node_class in nodes_by_class:
+			if query.type.is_empty() or node_class == query.type or ClassDB.is_parent_class(node_class, query.type):
+				candidates.append_array(nodes_by_class[node_class].values())
+
+	var matches = []
+	for node in candidates:
+		if not is_instance_valid(node):
+			continue
+		if not query.type.is_empty() and not node.is_class(query.type):
+			continue
+		if not query.name.is_empty() and not query.name in node.name.to_lower():
+			continue
+		if query.groups.any(func(g): return not node.is_in_group(g)):
+			continue
+		if query.methods.any(func(m): return not node.has_method(m)):
+			continue
+		matches.append(node)
+	return matches
+
+func _start_latency_probe() -> void:
+	# One press at a time: presses during a pending probe are not timed
+	if not latency_probe.is_empty() or not is_testing:
+		return
+	latency_probe = {
+		"frame": Engine.get_process_frames(),
+		"usec": Time.get_ticks_usec(),
+		"scenario": current_test,
+		"values": _read_latency_watches()
+	}
+
+func _on_latency_reaction(source: String) -> void:
+	if latency_probe.is_empty():
+		return
+	latency_samples.append({
+		"scenario": latency_probe.scenario,
+		"frames": Engine.get_process_frames() - latency_probe.frame,
+		"ms": (Time.get_ticks_usec() - latency_probe.usec) / 1000.0,
+		"source": source
+	})
+	latency_probe = {}
+
+func _on_canvas_draw(id: int, item_name: String) -> void:
+	var frame = Engine.get_process_frames()
+	var previous = last_draw_frame.get(id, -1)
+	last_draw_frame[id] = frame
+	# Items that were already redrawing around the press say nothing about input handling
+	if not latency_probe.is_empty() and previous < latency_probe.frame - 1:
+		_on_latency_reaction("redraw:" + item_name)
+
+func _read_latency_watches() -> Array:
+	var values = []
+	var root = get_tree().current_scene
+	for watch in latency_watches:
+		var node = root.get_node_or_null(NodePath(watch.get("node", "."))) if root else null
+		values.append(node.get(watch.property) if node else null)
+	return values
+
+func _check_latency_watches() -> void:
+	# Runs after every node has processed, so changes land on the frame that made them
+	if latency_probe.is_empty() or latency_watches.is_empty():
+		return
+	var values = _read_latency_watches()
+	for i in range(values.size()):
+		var before = latency_probe["values"][i]
+		var after = values[i]
+		if before == null or after == null:
+			continue
+		var changed = after != before
+		match latency_watches[i].get("change", "any"):
+			"decrease":
+				changed = after < before
+			"increase":
+				changed = after > before
+		if changed:
+			_on_latency_reaction("property:" + latency_watches[i].property)
+			return
+	# Compare frame to frame, so steady drift (e.g. gravity) is not a reaction
+	latency_probe["values"] = values
+
+func _expire_latency_probe() -> void:
+	if latency_probe.is_empty():
+		return
+	if Engine.get_process_frames() - latency_probe.frame > LATENCY_TIMEOUT_FRAMES:
+		latency_missed[latency_probe.scenario] = latency_missed.get(latency_probe.scenario, 0) + 1
+		latency_probe = {}
+
+func _record_event(event: InputEvent) -> void:
+	# Touch events are stored as-is; real mouse input (manual desktop sessions)
+	# is stored as touch, skipping the mouse events Godot emulates from touch
+	var kind = ""
+	if event is InputEventScreenTouch and event.index == 0:
+		kind = "press" if event.pressed else "release"
+	elif event is InputEventScreenDrag and event.index == 0:
+		kind = "drag"
+	elif event.device != InputEvent.DEVICE_ID_EMULATION:
+		if event is InputEventMouseButton and event.button_index == MOUSE_BUTTON_LEFT:
+			kind = "press" if event.pressed else "release"
+		elif event is InputEventMouseMotion and event.button_mask & MOUSE_BUTTON_MASK_LEFT:
+			kind = "drag"
+	if kind.is_empty():
+		return
+	trace_events.append({
+		"frame": trace_frame,
+		"type": kind,
+		"x": snappedf(event.position.x, 0.01),
+		"y": snappedf(event.position.y, 0.01)
+	})
+
+func _save_trace() -> void:
+	var trace = {
+		"version": TRACE_VERSION,
+		"game": _get_game_name(),
+		"seed": trace_seed,
+		"fps": TRACE_FPS,
+		"frames": trace_frame,
+		"events": trace_events,
+		"final_state": _game_state()
+	}
+	var file = FileAccess.open(TRACE_PATH, FileAccess.WRITE)
+	file.store_string(JSON.stringify(trace, "\t"))
+	file.close()
+	print("[TEST_AGENT] Input trace saved to: ", TRACE_PATH, " (", trace_events.size(), " events)")
+
+func start_replay() -> void:
+	var replay: Dictionary = test_config.replay
+	replay_events = replay.get("events", [])
+	replay_index = 0
+	replay_end_frame = int(replay.get("frames", 0))
+	if not replay_events.is_empty():
+		replay_end_frame = max(replay_end_frame, int(replay_events[-1].frame))
+
+	print("[TEST_AGENT] Replaying input trace: %d events over %d frames (seed %d)" % [replay_events.size(), replay_end_frame, trace_seed])
+	current_test = "replay"
+	is_testing = true
+	test_start_time = Time.get_ticks_msec() / 1000.0
+
+func _replay_frame() -> void:
+	# Events fire on the same frame index they were recorded on
+	while replay_index < replay_events.size() and int(replay_events[replay_index].frame) <= trace_frame:
+		var event: Dictionary = replay_events[replay_index]
+		match event.type:
+			"press":
+				_simulate_touch(event.x, event.y)
+			"release":
+				_simulate_touch_release(event.x, event.y)
+			"drag":
+				_simulate_touch_move(event.x, event.y)
+		actions_performed.append({"scenario": "replay", "step": event, "success": true, "timestamp": Time.get_ticks_msec() / 1000.0})
+		replay_index += 1
+
+	if trace_frame >= replay_end_frame:
+		is_replaying = false
+		# Deferred so the game has processed this frame too, as when the recording ended
+		call_deferred("_finish_tests")
+
+func _game_state() -> Dictionary:
+	# The game's snapshot, round-tripped through JSON so it compares equal to a stored one
+	var root = get_tree().current_scene
+	if not root or not root.has_method("get_snapshot"):
+		return {}
+	return JSON.parse_string(JSON.stringify(root.get_snapshot()))
+
+func _check_replay_state() -> void:
+	# A replay must end in the state the recording ended in (traces without one are skipped)
+	var expected: Dictionary = test_config.replay.get("final_state", {})
+	if expected.is_empty():
+		return
+	var actual = _game_state()
+	for key in expected:
+		if not actual.has(key) or JSON.stringify(actual[key]) != JSON.stringify(expected[key]):
+			errors_detected.append("Replay diverged from trace: '%s' is %s, recorded %s" % [
+				key, JSON.stringify(actual.get(key)), JSON.stringify(expected[key])])
+
 func start_tests() -> void:
 	print("[TEST_AGENT] Starting autonomous tests...")
 	is_testing = true
@@ -117,12 +503,90 @@ func start_tests() -> void:
 
 	# Run test scenarios
 	await _run_scenario("menu_navigation")
-	await _run_scenario(game_type)
-	await _run_scenario("stress_test")
-	await _run_scenario("full_playthrough")
+	if test_config.has("snapshot"):
+		await _apply_snapshot(test_config.snapshot)
+	if test_config.has("bot"):
+		await _run_bot(test_config.bot, test_config.get("bot_duration", BOT_DEFAULT_DURATION))
+	else:
+		await _run_scenario(game_type)
+		await _run_scenario("stress_test")
+		await _run_scenario("full_playthrough")
 
 	_finish_tests()
 
+func _apply_snapshot(snapshot: Dictionary) -> bool:
+	# Games expose get_snapshot()/load_snapshot() on their game scene root
+	var snapshot_name = snapshot.get("name", "snapshot")
+	for i in range(SNAPSHOT_WAIT_FRAMES):
+		var root = get_tree().current_scene
+		if root and root.has_method("load_snapshot"):
+			root.load_snapshot(snapshot.get("state", {}))
+			print("[TEST_AGENT] Snapshot loaded: ", snapshot_name)
+			return true
+		await get_tree().process_frame
+
+	errors_detected.append("Snapshot '%s' could not be loaded: no load_snapshot() on game scene" % snapshot_name)
+	return false
+
+func _save_snapshot() -> void:
+	var root = get_tree().current_scene
+	if not root or not root.has_method("get_snapshot"):
+		print("[TEST_AGENT] Current scene has no get_snapshot()")
+		return
+	var path = "user://snapshot.json"
+	var file = FileAccess.open(path, FileAccess.WRITE)
+	file.store_string(JSON.stringify({"name": "captured", "state": root.get_snapshot()}, "\t"))
+	file.close()
+	print("[TEST_AGENT] Snapshot saved to: ", path)
+
+func _run_bot(policy: String, duration: float) -> bool:
+	# Let a heuristic bot play until game over or until the duration runs out
+	var script_path = BOTS_DIR + policy + "_bot.gd"
+	var game = get_tree().current_scene
+	if not ResourceLoader.exists(script_path) or not game:
+		errors_detected.append("Bot '%s' could not be started" % policy)
+		return false
+
+	var bot = load(script_path).new()
+	bot.setup(self, game)
+	bot_name = policy
+	bot_game_over = false
+	current_test = "bot_" + policy
+	print("[TEST_AGENT] Running bot: ", policy, " (up to %.0fs)" % duration)
+
+	var gm = get_node_or_null("/root/GameManager")
+	var over_signal = ""
+	if gm:
+		for signal_name in ["game_over", "game_ended"]:
+			if gm.has_signal(signal_name):
+				over_signal = signal_name
+				gm.connect(over_signal, _on_bot_game_over)
+				break
+
+	# Survival is measured in game time, so it is comparable under --fixed-fps
+	survival_time = 0.0
+	while survival_time < duration and not bot_game_over and get_tree().current_scene == game:
+		bot.tick(get_process_delta_time())
+		await get_tree().process_frame
+		survival_time += get_process_delta_time()
+
+	bot.release()
+	bot_inputs = bot.inputs
+	if not over_signal.is_empty():
+		gm.disconnect(over_signal, _on_bot_game_over)
+
+	actions_performed.append({
+		"scenario": current_test,
+		"step": {"action": "bot", "bot": policy, "inputs": bot_inputs},
+		"success": true,
+		"timestamp": Time.get_ticks_msec() / 1000.0
+	})
+	print("[TEST_AGENT] Bot %s %s after %.1fs (%d inputs)" % [policy, "lost" if bot_game_over else "survived", survival_time, bot_inputs])
+	return true
+
+func _on_bot_game_over() -> void:
+	bot_game_over = true
+
 func _detect_game_type() -> String:
 	# Analyze current scene to determine game type
 	var root = get_tree().current_scene
@@ -130,24 +594,16 @@ func _detect_game_type() -> String:
 		return "tap"
 
 	# Check for swipe indicators
-	if _has_method_in_tree(root, "_on_swipe") or _has_method_in_tree(root, "handle_swipe"):
+	if select_first(":_on_swipe,:handle_swipe", root):
 		return "swipe"
 
 	# Check for drag indicators
-	if _has_method_in_tree(root, "_on_drag") or _has_method_in_tree(root, "handle_drag"):
+	if select_first(":_on_drag,:handle_drag", root):
 		return "drag"
 
 	# Default to tap
 	return "tap"
 
-func _has_method_in_tree(node: Node, method_name: String) -> bool:
-	if node.has_method(method_name):
-		return true
-	for child in node.get_children():
-		if _has_method_in_tree(child, method_name):
-			return true
-	return false
-
 func _run_scenario(scenario_name: String) -> void:
 	if not TEST_SCENARIOS.has(scenario_name):
 		print("[TEST_AGENT] Unknown scenario: ", scenario_name)
@@ -274,20 +730,10 @@ func _find_button_by_name(name_pattern: String) -> Control:
 	var root = get_tree().current_scene
 	if not root:
 		return null
-	return _search_button(root, name_pattern.to_lower())
-
-func _search_button(node: Node, pattern: String) -> Control:
-	if node is Button or node is TextureButton:
-		var node_name = node.name.to_lower()
-		if pattern in node_name or node_name in pattern:
-			if node.visible:
-				return node as Control
-
-	for child in node.get_children():
-		var found = _search_button(child, pattern)
-		if found:
-			return found
-
+	var selector = ",".join(BUTTON_TYPES.map(func(t): return "%s#%s" % [t, name_pattern]))
+	for button in select(selector, root):
+		if button.visible:
+			return button as Control
 	return null
 
 func _execute_play_game(step: Dictionary) -> bool:
@@ -297,8 +743,8 @@ func _execute_play_game(step: Dictionary) -> bool:
 
 	while elapsed < duration:
 		# Random tap in game area
-		var x = randf_range(100, 620)
-		var y = randf_range(200, 1000)
+		var x = agent_rng.randf_range(100, 620)
+		var y = agent_rng.randf_range(200, 1000)
 		_simulate_touch(x, y)
 		await get_tree().create_timer(0.05).timeout
 		_simulate_touch_release(x, y)
@@ -307,7 +753,7 @@ func _execute_play_game(step: Dictionary) -> bool:
 		elapsed += tap_interval + 0.05
 
 		# Vary tap interval
-		tap_interval = randf_range(0.2, 0.8)
+		tap_interval = agent_rng.randf_range(0.2, 0.8)
 
 	return true
 
@@ -360,6 +806,7 @@ func _simulate_touch(x: float, y: float) -> void:
 	event.pressed = true
 	Input.parse_input_event(event)
 	simulated_touches[0] = Vector2(x, y)
+	_start_latency_probe()
 
 func _simulate_touch_move(x: float, y: float) -> void:
 	var event = InputEventScreenDrag.new()
@@ -400,6 +847,8 @@ func _process_pending_actions(_delta: float) -> void:
 func _finish_tests() -> void:
 	is_testing = false
 	var duration = (Time.get_ticks_msec() / 1000.0) - test_start_time
+	if current_test == "replay":
+		_check_replay_state()
 
 	var results = {
 		"game_name": _get_game_name(),
@@ -410,11 +859,27 @@ func _finish_tests() -> void:
 		"passed": errors_detected.is_empty(),
 		"fps_avg": Engine.get_frames_per_second(),
 		"screenshots": screenshots.size(),
-		"timestamp": Time.get_datetime_string_from_system()
+		"timestamp": Time.get_datetime_string_from_system(),
+		"seed": trace_seed,
+		"replay": current_test == "replay",
+		"startup_ms": startup_ms
 	}
+	if not bot_name.is_empty():
+		results.merge({
+			"bot": bot_name,
+			"bot_inputs": bot_inputs,
+			"survival_time": survival_time,
+			"survived": not bot_game_over
+		})
+	results.merge(_frame_time_stats())
+	results.merge(_latency_stats())
 
 	# Save results
 	_save_results(results)
+	if is_recording:
+		_save_trace()
+	if test_config.get("capture_snapshot", false):
+		_save_snapshot()
 
 	print("[TEST_AGENT] Tests completed!")
 	print("[TEST_AGENT] Duration: %.2f seconds" % duration)
@@ -429,6 +894,93 @@ func _finish_tests() -> void:
 		await get_tree().create_timer(0.5).timeout
 		get_tree().quit(0 if results.passed else 1)
 
+func _frame_time_stats() -> Dictionary:
+	var sorted_times = frame_times_ms.duplicate()
+	sorted_times.sort()
+	var count = sorted_times.size()
+	if count == 0:
+		return {}
+	var total = 0.0
+	for t in sorted_times:
+		total += t
+	return {
+		"frame_time_avg_ms": total / count,
+		"frame_time_p50_ms": sorted_times[int(count * 0.5)],
+		"frame_time_p95_ms": sorted_times[min(int(count * 0.95), count - 1)],
+		"frame_time_max_ms": sorted_times[count - 1],
+		"memory_peak_mb": OS.get_static_memory_peak_usage() / 1048576.0,
+		"memory_slope_mb_s": _memory_slope()
+	}
+
+func _latency_stats() -> Dictionary:
+	var by_scenario = {}
+	var sources = {}
+	for sample in latency_samples:
+		if not by_scenario.has(sample.scenario):
+			by_scenario[sample.scenario] = []
+		by_scenario[sample.scenario].append(sample)
+		sources[sample.source] = sources.get(sample.source, 0) + 1
+	for scenario in latency_missed:
+		if not by_scenario.has(scenario):
+			by_scenario[scenario] = []
+
+	var scenarios = {}
+	for scenario in by_scenario:
+		scenarios[scenario] = _latency_distribution(by_scenario[scenario], latency_missed.get(scenario, 0))
+	var missed = 0
+	for scenario in latency_missed:
+		missed += latency_missed[scenario]
+	var overall = _latency_distribution(latency_samples, missed)
+	if overall.samples == 0 and missed == 0:
+		return {}
+	return {
+		"input_latency_p50_ms": overall.get("p50_ms", 0.0),
+		"input_latency_p95_ms": overall.get("p95_ms", 0.0),
+		"input_latency_p95_frames": overall.get("p95_frames", 0),
+		"input_latency_samples": overall.samples,
+		"input_latency_missed": missed,
+		"input_latency": {"scenarios": scenarios, "sources": sources}
+	}
+
+func _latency_distribution(samples: Array, missed: int) -> Dictionary:
+	var ms = PackedFloat32Array()
+	var frames = PackedInt32Array()
+	for sample in samples:
+		ms.append(sample.ms)
+		frames.append(sample.frames)
+	var stats = {"samples": samples.size(), "missed": missed}
+	if samples.is_empty():
+		return stats
+	ms.sort()
+	frames.sort()
+	var count = samples.size()
+	var p95 = min(int(count * 0.95), count - 1)
+	stats.merge({
+		"p50_ms": ms[int(count * 0.5)],
+		"p95_ms": ms[p95],
+		"max_ms": ms[count - 1],
+		"p50_frames": frames[int(count * 0.5)],
+		"p95_frames": frames[p95],
+		"max_frames": frames[count - 1]
+	})
+	return stats
+
+func _memory_slope() -> float:
+	# Least-squares growth rate of static memory over the run
+	var count = memory_samples.size()
+	if count < 2:
+		return 0.0
+	var mean = Vector2.ZERO
+	for sample in memory_samples:
+		mean += sample
+	mean /= count
+	var covariance = 0.0
+	var variance = 0.0
+	for sample in memory_samples:
+		covariance += (sample.x - mean.x) * (sample.y - mean.y)
+		variance += (sample.x - mean.x) * (sample.x - mean.x)
+	return covariance / variance if variance > 0.0 else 0.0
+
 func _get_game_name() -> String:
 	var scene_path = get_tree().current_scene.scene_file_path
 	if scene_path:
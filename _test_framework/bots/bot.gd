@@ -0,0 +1,54 @@
+extends RefCounted
+## Bot: Base class for heuristic test players
+## A bot reads the running game scene every frame and answers with simulated
+## touch input through the test agent, trying to keep the game alive
+
+var agent: Node
+var game: Node
+var cooldown: float = 0.0  ## Seconds until the bot may act again
+var inputs: int = 0
+var holding: bool = false
+var touch_pos: Vector2 = Vector2.ZERO
+
+func setup(test_agent: Node, game_scene: Node) -> void:
+	agent = test_agent
+	game = game_scene
+
+func tick(delta: float) -> void:
+	cooldown = max(cooldown - delta, 0.0)
+	if cooldown <= 0.0:
+		act(delta)
+
+func act(_delta: float) -> void:
+	pass  # Each policy decides here
+
+# Input helpers - all input goes through the agent so it is recorded like any other step
+
+func press(pos: Vector2) -> void:
+	if holding:
+		release()
+	agent._simulate_touch(pos.x, pos.y)
+	holding = true
+	touch_pos = pos
+	inputs += 1
+
+func drag(pos: Vector2) -> void:
+	if not holding:
+		press(pos)
+	agent._simulate_touch_move(pos.x, pos.y)
+	touch_pos = pos
+
+func release() -> void:
+	if not holding:
+		return
+	agent._simulate_touch_release(touch_pos.x, touch_pos.y)
+	holding = false
+
+func tap(pos: Vector2) -> void:
+	press(pos)
+	release()
+
+func swipe(from: Vector2, to: Vector2) -> void:
+	press(from)
+	drag(to)
+	release()
@@ -0,0 +1,77 @@
+extends "res://test_bots/bot.gd"
+## CornerBot: 2048 corner strategy
+## Keeps big tiles in the bottom-left corner by preferring down/left swipes,
+## and only swipes right or up when nothing else moves the board
+
+const GRID_SIZE = 4
+const MOVE_INTERVAL = 0.25  ## The game waits 0.15s before spawning the next tile
+const PREFERRED = [Vector2.DOWN, Vector2.LEFT]
+const FALLBACK = [Vector2.RIGHT, Vector2.UP]
+const SWIPE_CENTER = Vector2(360, 640)
+
+func act(_delta: float) -> void:
+	if not game.game_active:
+		return
+
+	var direction = _best_direction(PREFERRED)
+	if direction == Vector2.ZERO:
+		direction = _best_direction(FALLBACK)
+	if direction == Vector2.ZERO:
+		return
+
+	swipe(SWIPE_CENTER, SWIPE_CENTER + direction * 150)
+	cooldown = MOVE_INTERVAL
+
+func _best_direction(directions: Array) -> Vector2:
+	# Among the moves that change the board, keep the most empty cells
+	var best = Vector2.ZERO
+	var best_empty = -1
+	for direction in directions:
+		var result = _slide(game.grid, direction)
+		if result.is_empty():
+			continue
+		var empty = 0
+		for column in result:
+			empty += column.count(0)
+		if empty > best_empty:
+			best_empty = empty
+			best = direction
+	return best
+
+func _slide(source: Array, direction: Vector2) -> Array:
+	# Same sliding rules as the game; returns [] when nothing moves
+	var grid = source.duplicate(true)
+	var merged: Array = []
+	for i in range(GRID_SIZE):
+		merged.append([false, false, false, false])
+
+	var moved = false
+	var x_range = range(GRID_SIZE) if direction != Vector2.RIGHT else range(GRID_SIZE - 1, -1, -1)
+	var y_range = range(GRID_SIZE) if direction != Vector2.DOWN else range(GRID_SIZE - 1, -1, -1)
+	for y in y_range:
+		for x in x_range:
+			if grid[x][y] == 0:
+				continue
+			var new_x = x
+			var new_y = y
+			while true:
+				var next_x = new_x + int(direction.x)
+				var next_y = new_y + int(direction.y)
+				if next_x < 0 or next_x >= GRID_SIZE or next_y < 0 or next_y >= GRID_SIZE:
+					break
+				if grid[next_x][next_y] == 0:
+					new_x = next_x
+					new_y = next_y
+				elif grid[next_x][next_y] == grid[x][y] and not merged[next_x][next_y]:
+					new_x = next_x
+					new_y = next_y
+					merged[new_x][new_y] = true
+					break
+				else:
+					break
+			if new_x != x or new_y != y:
+				moved = true
+				grid[new_x][new_y] = grid[x][y] * 2 if grid[new_x][new_y] == grid[x][y] else grid[x][y]
+				grid[x][y] = 0
+
+	return grid if moved else []
@@ -0,0 +1,26 @@
+extends "res://test_bots/bot.gd"
+## FlappyBot: Flaps whenever the bird is about to sink below the next gap
+
+const PIPE_WIDTH = 80.0
+const BIRD_RADIUS = 30.0
+const LOOKAHEAD = 0.12  ## Seconds of fall to anticipate before flapping
+const AIM_OFFSET = 40.0  ## A flap lifts the bird ~85px, so aim below the gap centre
+const FLAP_COOLDOWN = 0.18
+
+func act(_delta: float) -> void:
+	if game.game_started and not game.game_active:
+		return
+
+	var bird_pos: Vector2 = game.bird.position
+	var predicted_y = bird_pos.y + game.velocity * LOOKAHEAD
+	if not game.game_started or predicted_y > _next_gap_y(bird_pos.x) + AIM_OFFSET:
+		tap(bird_pos)
+		cooldown = FLAP_COOLDOWN
+
+func _next_gap_y(bird_x: float) -> float:
+	# Pipes are positioned at their gap centre; the spawner lists them in scroll order
+	for pipe in game.pipes.get_active():
+		var pipe_pos: Vector2 = game.pipes.parent_position(pipe)
+		if pipe_pos.x + PIPE_WIDTH / 2 + BIRD_RADIUS >= bird_x:
+			return pipe_pos.y
+	return game.screen_height * 0.45
@@ -0,0 +1,52 @@
+extends "res://test_bots/bot.gd"
+## PaddleBot: Tracks the ball in Pong (vertical paddle) and Breakout (horizontal paddle)
+## Predicts where the ball will cross the paddle line, bouncing off the walls
+
+const PONG_BALL_SIZE = 30.0
+const PONG_PADDLE_WIDTH = 20.0
+
+func act(_delta: float) -> void:
+	if not game.game_started:
+		tap(_target())
+		return
+	if not game.game_active:
+		release()
+		return
+	drag(_target())
+
+func _target() -> Vector2:
+	if "player_paddle" in game:
+		return _pong_target()
+	return _breakout_target()
+
+func _pong_target() -> Vector2:
+	# Player paddle is on the left; touch y becomes the paddle centre
+	var paddle: Control = game.player_paddle
+	var half = PONG_BALL_SIZE / 2
+	var center: Vector2 = game.ball.position + Vector2(half, half)
+	var velocity: Vector2 = game.ball_velocity
+	var y = game.screen_height / 2
+	if velocity.x < 0:
+		var time = (center.x - (paddle.position.x + PONG_PADDLE_WIDTH)) / -velocity.x
+		y = _reflect(center.y + velocity.y * time, half, game.screen_height - half)
+	return Vector2(paddle.position.x + PONG_PADDLE_WIDTH, y)
+
+func _breakout_target() -> Vector2:
+	# Paddle is at the bottom; touch x becomes the paddle centre
+	var paddle: Control = game.paddle
+	var half: Vector2 = game.ball.size / 2
+	var center: Vector2 = game.ball.position + half
+	var velocity: Vector2 = game.ball_velocity
+	var x = center.x
+	if velocity.y > 0:
+		var time = (paddle.position.y - (center.y + half.y)) / velocity.y
+		x = _reflect(center.x + velocity.x * time, half.x, game.screen_width - half.x)
+	return Vector2(x, paddle.position.y)
+
+func _reflect(value: float, low: float, high: float) -> float:
+	# Fold a straight-line prediction back into the court
+	var span = high - low
+	if span <= 0.0:
+		return low
+	var folded = fposmod(value - low, span * 2.0)
+	return low + (folded if folded <= span else span * 2.0 - folded)
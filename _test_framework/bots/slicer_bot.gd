@@ -0,0 +1,48 @@
+extends "res://test_bots/bot.gd"
+## SlicerBot: Fruit Slice - slices the fruit nearest to the finger
+## The finger is lifted and put down on each target, so the trail never
+## crosses a bomb on the way there
+
+const BOMB_CLEARANCE = 110.0  ## Skip fruit this close to a bomb
+const SLICE_INTERVAL = 0.08
+
+func act(_delta: float) -> void:
+	if not game.game_active:
+		release()
+		return
+
+	var target = _nearest_fruit()
+	if target == null:
+		release()
+		return
+
+	press(target.position)
+	drag(target.position)
+	cooldown = SLICE_INTERVAL
+
+func _nearest_fruit() -> Node2D:
+	var fruits: Array[Node2D] = []
+	var bombs: Array[Node2D] = []
+	for fruit in game.fruits_container.get_children():
+		if fruit.is_queued_for_deletion() or fruit.get_meta("sliced", false):
+			continue
+		if fruit.position.y < 0 or fruit.position.y > game.screen_height:
+			continue  # Off screen - can't be touched
+		if fruit.get_meta("is_bomb", false):
+			bombs.append(fruit)
+		else:
+			fruits.append(fruit)
+
+	var nearest: Node2D = null
+	var nearest_distance = INF
+	for fruit in fruits:
+		var safe = true
+		for bomb in bombs:
+			if fruit.position.distance_to(bomb.position) < BOMB_CLEARANCE:
+				safe = false
+				break
+		var distance = touch_pos.distance_to(fruit.position)
+		if safe and distance < nearest_distance:
+			nearest = fruit
+			nearest_distance = distance
+	return nearest
@@ -0,0 +1,147 @@
+extends "res://test_bots/bot.gd"
+## TetrisBot: Greedy placement
+## Tries every rotation and column for the current piece, scores the resulting
+## board and steers the piece there with taps (rotate) and swipes (move, drop)
+
+const GRID_WIDTH = 10
+const GRID_HEIGHT = 20
+const MOVE_INTERVAL = 0.06
+
+# Board evaluation weights
+const HEIGHT_WEIGHT = -0.51
+const LINES_WEIGHT = 0.76
+const HOLES_WEIGHT = -0.36
+const BUMPINESS_WEIGHT = -0.18
+
+const SWIPE_CENTER = Vector2(360, 640)
+
+var _piece: Dictionary = {}
+var _plan: Array[String] = []
+
+func act(_delta: float) -> void:
+	if not game.game_active:
+		return
+
+	# The game duplicates a fresh dictionary for every spawned piece
+	if not is_same(game.current_piece, _piece):
+		_piece = game.current_piece
+		_plan = _make_plan()
+	if _plan.is_empty():
+		return
+
+	match _plan.pop_front():
+		"rotate":
+			tap(SWIPE_CENTER)
+		"left":
+			swipe(SWIPE_CENTER, SWIPE_CENTER + Vector2(-80, 0))
+		"right":
+			swipe(SWIPE_CENTER, SWIPE_CENTER + Vector2(80, 0))
+		"drop":
+			swipe(SWIPE_CENTER, SWIPE_CENTER + Vector2(0, 120))
+	cooldown = MOVE_INTERVAL
+
+func _make_plan() -> Array[String]:
+	var board = _read_board()
+	var start: Vector2i = game.current_pos
+	var shape: Array = _piece.shape
+	var best_score = -INF
+	var best_rotations = 0
+	var best_x = start.x
+
+	for rotations in range(4):
+		if rotations > 0:
+			var rotated = _rotate(shape)
+			# Rotation happens in place before moving, like the game does it
+			if not _fits(board, start, rotated):
+				break
+			shape = rotated
+		elif not _fits(board, start, shape):
+			break
+
+		for direction in [-1, 1]:
+			var x = start.x if direction == -1 else start.x + 1
+			while _fits(board, Vector2i(x, start.y), shape):
+				var score = _evaluate(board, Vector2i(x, start.y), shape)
+				if score > best_score:
+					best_score = score
+					best_rotations = rotations
+					best_x = x
+				x += direction
+
+	var plan: Array[String] = []
+	for i in range(best_rotations):
+		plan.append("rotate")
+	var step = "right" if best_x > start.x else "left"
+	for i in range(abs(best_x - start.x)):
+		plan.append(step)
+	plan.append("drop")
+	return plan
+
+func _read_board() -> PackedByteArray:
+	var board = PackedByteArray()
+	board.resize(GRID_WIDTH * GRID_HEIGHT)
+	for x in range(GRID_WIDTH):
+		for y in range(GRID_HEIGHT):
+			if game.grid[x][y] != null:
+				board[y * GRID_WIDTH + x] = 1
+	return board
+
+func _rotate(shape: Array) -> Array:
+	var rotated: Array = []
+	for cell in shape:
+		rotated.append([cell[1], -cell[0] + 2])
+	return rotated
+
+func _fits(board: PackedByteArray, pos: Vector2i, shape: Array) -> bool:
+	for cell in shape:
+		var x = pos.x + cell[0]
+		var y = pos.y + cell[1]
+		if x < 0 or x >= GRID_WIDTH or y >= GRID_HEIGHT:
+			return false
+		if y >= 0 and board[y * GRID_WIDTH + x]:
+			return false
+	return true
+
+func _evaluate(board: PackedByteArray, pos: Vector2i, shape: Array) -> float:
+	var landing = pos
+	while _fits(board, landing + Vector2i(0, 1), shape):
+		landing.y += 1
+
+	var placed = board.duplicate()
+	for cell in shape:
+		var y = landing.y + cell[1]
+		if y < 0:
+			return -INF  # Would lock above the board
+		placed[y * GRID_WIDTH + landing.x + cell[0]] = 1
+
+	# Drop full rows so heights and holes describe the board after clearing
+	var lines = 0
+	var cleared = PackedByteArray()
+	for y in range(GRID_HEIGHT):
+		var row = placed.slice(y * GRID_WIDTH, (y + 1) * GRID_WIDTH)
+		if row.count(1) == GRID_WIDTH:
+			lines += 1
+		else:
+			cleared.append_array(row)
+	var settled = PackedByteArray()
+	settled.resize(lines * GRID_WIDTH)
+	settled.append_array(cleared)
+
+	var total_height = 0
+	var holes = 0
+	var bumpiness = 0
+	var previous_height = -1
+	for x in range(GRID_WIDTH):
+		var height = 0
+		for y in range(GRID_HEIGHT):
+			if settled[y * GRID_WIDTH + x]:
+				if height == 0:
+					height = GRID_HEIGHT - y
+			elif height > 0:
+				holes += 1
+		total_height += height
+		if previous_height >= 0:
+			bumpiness += abs(height - previous_height)
+		previous_height = height
+
+	return total_height * HEIGHT_WEIGHT + lines * LINES_WEIGHT + holes * HOLES_WEIGHT + bumpiness * BUMPINESS_WEIGHT
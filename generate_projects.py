@@ -130,8 +130,10 @@ config/icon="res://icon.svg"
 
 [autoload]
 
+SaveManager="*res://autoload/save_manager.gd"
 GameManager="*res://autoload/game_manager.gd"
 AudioManager="*res://autoload/audio_manager.gd"
+Effects="*res://autoload/effects.gd"
 
 [display]
 
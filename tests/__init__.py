@@ -6,6 +6,11 @@ This package provides tools for automated testing of Godot games.
 Components:
 - test_orchestrator.py: Main orchestrator for running tests
 - run_tests.sh: Shell script for easy test execution
+- perf_bisect.py: Finds the commit behind a performance regression
+- fake_godot.py: Stand-in Godot executable for running the suite without an engine
+- orchestrator_benchmark.py: Measures orchestrator overhead as the collection grows
+- artifact_store.py: Compressed, deduplicated store for reports, logs and screenshots
+- cpu_control.py: Core pinning, priority, CPU duty cycles and load sampling for runs
 
 Usage:
     # List all games
@@ -19,20 +24,58 @@ Usage:
 
     # Parallel testing
     python -m tests.test_orchestrator -p 4 -v
+
+    # Start games from a stored late-game snapshot (tests/snapshots/)
+    python -m tests.test_orchestrator -s late_game
+
+    # Record input traces, then replay them deterministically (tests/traces/)
+    python -m tests.test_orchestrator -g flappy --record baseline --seed 42
+    python -m tests.test_orchestrator -g flappy --replay baseline
+
+    # Let heuristic bots (_test_framework/bots/) play for up to 5 minutes per game
+    python -m tests.test_orchestrator --bot --bot-duration 300 -v
+
+    # Run every game under several device profiles (tests/device_profiles.json)
+    python -m tests.test_orchestrator --profiles baseline low_end_android tall_phone -p 3
+    python -m tests.test_orchestrator --profiles all --windowed  # Renderers differ only with a window
+
+    # Comparable numbers under -p: one core set per worker, fixed priority;
+    # low_end_android/entry_level profiles hold games to one core and a duty cycle
+    python -m tests.test_orchestrator -p 4 --pin --nice 5 --profiles baseline entry_level
+
+    # Bisect a p95 frame time regression (5 deterministic runs per revision)
+    python -m tests.perf_bisect tetris --good v1.0 --bad HEAD -m frame_p95 -n 5
+
+    # Exercise the orchestrator without Godot, then benchmark it at scale
+    GODOT_CMD=tests/fake_godot.py FAKE_GODOT_FAIL_RATE=0.1 python -m tests.test_orchestrator -p 4
+    python -m tests.orchestrator_benchmark --sizes 10 100 1000 -p 1 8
+
+    # Browse stored runs (tests/reports/) and open one by id
+    python tests/artifact_store.py list
+    python tests/artifact_store.py show latest -g tetris --log stderr
+    python tests/artifact_store.py export 20250101_120000_ab12 /tmp/run
 """
 
+from .artifact_store import ArtifactStore
 from .test_orchestrator import (
     TestOrchestrator,
     TestAgent,
     GameDiscovery,
+    DeviceProfile,
+    SnapshotLibrary,
+    TraceLibrary,
     TestResult,
     TestReport,
 )
 
 __all__ = [
+    "ArtifactStore",
     "TestOrchestrator",
     "TestAgent",
     "GameDiscovery",
+    "DeviceProfile",
+    "SnapshotLibrary",
+    "TraceLibrary",
     "TestResult",
     "TestReport",
 ]
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Artifact Store for Test Reports
+Content-addressed storage for reports, logs and screenshots under tests/reports/.
+Blobs are compressed and stored once no matter how many runs share them; a small
+index tracks runs so retention and the size budget never need to open payloads
+
+Besides test runs the store keeps other tool reports (perf bisects, orchestrator
+benchmarks) under the same retention; a report's "kind" tells them apart
+
+Layout:
+    index.json              Runs (oldest first) with kind, summary, size and blob refs
+    index.json.lock         flock()ed while the index is read, changed and written
+    runs/<run_id>.json      Report with logs and screenshots replaced by refs
+    objects/ab/<sha256>.gz  Compressed blob (or objects/ab/<sha256> when
+                            compression does not pay off, e.g. PNGs)
+"""
+
+import os
+import sys
+import json
+import gzip
+import time
+import uuid
+import hashlib
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterator
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs are not saved concurrently there
+    fcntl = None
+
+REPORTS_DIR = Path(__file__).parent / "reports"
+STORE_VERSION = 1
+REF_PREFIX = "sha256:"
+LOG_FIELDS = ("stdout", "stderr")
+TEST_KIND = "test"
+DEFAULT_KEEP_RUNS = 50
+DEFAULT_MAX_MB = 200
+MIN_COMPRESSION_GAIN = 0.9  # Keep the gzip copy only when it is at least 10% smaller
+BLOB_GRACE_SECONDS = 3600  # Unreferenced blobs this fresh may belong to a run still being saved
+
+
+def new_run_id() -> str:
+    """Sortable run id: timestamp plus a short random suffix"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:4]}"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    temp.write_bytes(data)
+    os.replace(temp, path)
+
+
+class ArtifactStore:
+    """Deduplicated, compressed test artifacts grouped by run"""
+
+    def __init__(self, root: Path = REPORTS_DIR, keep_runs: int = DEFAULT_KEEP_RUNS,
+                 max_bytes: int = DEFAULT_MAX_MB * 1048576):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+        self.index_file = self.root / "index.json"
+        self.lock_file = self.root / "index.json.lock"
+        self.keep_runs = keep_runs
+        self.max_bytes = max_bytes
+
+    # Blobs
+
+    def put(self, data: bytes) -> str:
+        """Store a blob once and return its reference"""
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self._blob_path(digest)
+        if existing is not None:
+            # Refresh the age so gc() treats a reused blob as freshly written
+            os.utime(existing)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) <= len(data) * MIN_COMPRESSION_GAIN:
+                _write_atomic(self._object_base(digest).with_suffix(".gz"), compressed)
+            else:
+                _write_atomic(self._object_base(digest), data)
+        return REF_PREFIX + digest
+
+    def put_text(self, text: str) -> str:
+        return self.put(text.encode("utf-8"))
+
+    def put_file(self, path: Path) -> str:
+        return self.put(Path(path).read_bytes())
+
+    def get(self, ref: str) -> bytes:
+        path = self._blob_path(self._digest(ref))
+        if path is None:
+            raise KeyError(f"Missing artifact: {ref}")
+        data = path.read_bytes()
+        return gzip.decompress(data) if path.suffix == ".gz" else data
+
+    def get_text(self, ref: str) -> str:
+        return self.get(ref).decode("utf-8", errors="replace")
+
+    def _digest(self, ref: str) -> str:
+        return ref[len(REF_PREFIX):] if ref.startswith(REF_PREFIX) else ref
+
+    def _object_base(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _blob_path(self, digest: str) -> Optional[Path]:
+        base = self._object_base(digest)
+        for path in (base.with_suffix(".gz"), base):
+            if path.exists():
+                return path
+        return None
+
+    def _blob_size(self, ref: str) -> int:
+        path = self._blob_path(self._digest(ref))
+        return path.stat().st_size if path else 0
+
+    # Runs
+
+    def save_run(self, report: Dict[str, Any], run_id: Optional[str] = None) -> str:
+        """Store a report, moving its logs into blobs, then apply retention"""
+        run_id = run_id or new_run_id()
+        manifest = json.loads(json.dumps(report))  # Deep copy; the caller keeps its logs
+        manifest["run_id"] = run_id
+        for result in manifest.get("results", []):
+            for key in LOG_FIELDS:
+                if result.get(key):
+                    result[key] = self.put_text(result[key])
+
+        data = json.dumps(manifest, indent=2).encode("utf-8")
+        _write_atomic(self.runs_dir / f"{run_id}.json", data)
+
+        refs = sorted(set(self._refs(manifest)))
+        kind = manifest.get("kind", TEST_KIND)
+        with self._locked():
+            index = self._load_index()
+            index["runs"].append({
+                "run_id": run_id,
+                "kind": kind,
+                "timestamp": manifest.get("timestamp", datetime.now().isoformat()),
+                "summary": manifest.get("summary", {}),
+                "manifest_bytes": len(data),
+                "refs": refs
+            })
+            # 'latest' always names a test run, whatever other tools stored since
+            if kind == TEST_KIND:
+                index["latest"] = run_id
+            self._save_index(index)
+            self._collect()
+        return run_id
+
+    def load_run(self, run_id: str = "latest", inflate: bool = True) -> Dict[str, Any]:
+        """Open a stored report; with inflate, logs are read back from their blobs"""
+        run_id = self.resolve(run_id)
+        manifest = json.loads((self.runs_dir / f"{run_id}.json").read_text())
+        if inflate:
+            for result in manifest.get("results", []):
+                for key in LOG_FIELDS:
+                    if str(result.get(key, "")).startswith(REF_PREFIX):
+                        result[key] = self.get_text(result[key])
+        return manifest
+
+    def resolve(self, run_id: str) -> str:
+        """Expand 'latest' or a unique run id prefix to a full run id"""
+        index = self._load_index()
+        if run_id == "latest":
+            if not index.get("latest"):
+                raise KeyError("No runs stored")
+            return index["latest"]
+        matches = [r["run_id"] for r in index["runs"] if r["run_id"].startswith(run_id)]
+        if len(matches) != 1:
+            raise KeyError(f"Run id '{run_id}' matches {len(matches)} runs")
+        return matches[0]
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        return self._load_index()["runs"]
+
+    def total_bytes(self) -> int:
+        """Bytes on disk for all live runs (manifests plus referenced blobs)"""
+        runs = self._load_index()["runs"]
+        return self._size_of(runs)
+
+    # Retention
+
+    def gc(self) -> Dict[str, int]:
+        """Drop the oldest runs beyond the retention count or size budget, then sweep blobs"""
+        with self._locked():
+            return self._collect()
+
+    def _collect(self) -> Dict[str, int]:
+        """gc() body; the caller holds the index lock"""
+        index = self._load_index()
+        runs = index["runs"]
+        dropped = []
+        while len(runs) > max(1, self.keep_runs):
+            dropped.append(runs.pop(0))
+        # The newest run always survives, even if it alone exceeds the budget
+        while len(runs) > 1 and self._size_of(runs) > self.max_bytes:
+            dropped.append(runs.pop(0))
+
+        for run in dropped:
+            manifest = self.runs_dir / f"{run['run_id']}.json"
+            if manifest.exists():
+                manifest.unlink()
+        if dropped:
+            self._save_index(index)
+
+        # Blobs are written before their run is indexed, so a concurrent save's
+        # blobs look unreferenced until it takes the lock; leave recent ones alone
+        live = {self._digest(ref) for run in runs for ref in run["refs"]}
+        cutoff = time.time() - BLOB_GRACE_SECONDS
+        swept = 0
+        for path in self._iter_blobs():
+            if path.name.split(".")[0] in live:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    swept += 1
+            except FileNotFoundError:
+                pass
+        return {"runs_dropped": len(dropped), "blobs_removed": swept}
+
+    def _size_of(self, runs: List[Dict[str, Any]]) -> int:
+        refs = {ref for run in runs for ref in run["refs"]}
+        return sum(run.get("manifest_bytes", 0) for run in runs) + sum(self._blob_size(r) for r in refs)
+
+    def _iter_blobs(self) -> Iterator[Path]:
+        if not self.objects_dir.exists():
+            return
+        for path in self.objects_dir.glob("*/*"):
+            if not path.name.startswith("."):
+                yield path
+
+    def _refs(self, value: Any) -> Iterator[str]:
+        if isinstance(value, str):
+            if value.startswith(REF_PREFIX):
+                yield value
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from self._refs(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from self._refs(item)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize index updates across processes (parallel orchestrator, bisect
+        and benchmark runs can share one store)"""
+        if fcntl is None:
+            yield
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load_index(self) -> Dict[str, Any]:
+        if self.index_file.exists():
+            return json.loads(self.index_file.read_text())
+        return {"version": STORE_VERSION, "latest": None, "runs": []}
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        _write_atomic(self.index_file, json.dumps(index, indent=2).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browse and prune stored test reports")
+    parser.add_argument("--root", type=Path, default=REPORTS_DIR, help="Store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List stored runs")
+
+    show = commands.add_parser("show", help="Show a run's summary (or one game's log)")
+    show.add_argument("run_id", nargs="?", default="latest", help="Run id, prefix or 'latest'")
+    show.add_argument("--game", "-g", help="Game (partial name) whose log to print")
+    show.add_argument("--log", choices=LOG_FIELDS, default="stdout", help="Log to print with --game")
+
+    export = commands.add_parser("export", help="Write a run's full report and screenshots to a folder")
+    export.add_argument("run_id", nargs="?", default="latest")
+    export.add_argument("output", type=Path)
+
+    gc = commands.add_parser("gc", help="Apply retention and remove unreferenced blobs")
+    gc.add_argument("--keep-runs", type=int, default=DEFAULT_KEEP_RUNS)
+    gc.add_argument("--max-mb", type=float, default=DEFAULT_MAX_MB)
+    args = parser.parse_args()
+
+    store = ArtifactStore(args.root)
+    try:
+        if args.command == "list":
+            for run in store.list_runs():
+                summary = run.get("summary", {})
+                kind = run.get("kind", TEST_KIND)
+                if kind == TEST_KIND:
+                    print(f"  {run['run_id']}  {summary.get('passed', 0):>3} passed  "
+                          f"{summary.get('failed', 0):>3} failed  {len(run['refs']):>4} artifacts")
+                else:
+                    print(f"  {run['run_id']}  {kind:9} {summary.get('title', '')}")
+            print(f"\nStore size: {store.total_bytes() / 1048576:.2f}MB")
+
+        elif args.command == "show":
+            report = store.load_run(args.run_id, inflate=bool(args.game))
+            if report.get("kind", TEST_KIND) != TEST_KIND:
+                print(json.dumps(report, indent=2))
+                return 0
+            if args.game:
+                for result in report["results"]:
+                    if args.game.lower() in result["game_name"].lower():
+                        print(result.get(args.log, ""))
+                        return 0
+                print(f"Game not in run: {args.game}")
+                return 1
+            print(f"Run {report['run_id']} ({report.get('timestamp', '')})")
+            print(json.dumps(report.get("summary", {}), indent=2))
+            for result in report["results"]:
+                status = "PASS" if result["passed"] else "FAIL"
+                print(f"  {status}  {result['game_name']:24} {result['duration']:6.2f}s  "
+                      f"{len(result.get('artifacts', {}))} screenshots")
+
+        elif args.command == "export":
+            report = store.load_run(args.run_id)
+            args.output.mkdir(parents=True, exist_ok=True)
+            for result in report["results"]:
+                for name, ref in result.get("artifacts", {}).items():
+                    target = args.output / result["game_name"] / name
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(store.get(ref))
+            with open(args.output / "report.json", "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Exported run {report['run_id']} to {args.output}")
+
+        elif args.command == "gc":
+            store.keep_runs = args.keep_runs
+            store.max_bytes = int(args.max_mb * 1048576)
+            stats = store.gc()
+            print(f"Dropped {stats['runs_dropped']} runs, removed {stats['blobs_removed']} blobs")
+            print(f"Store size: {store.total_bytes() / 1048576:.2f}MB")
+
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+CPU Control for Test Runs
+Keeps performance numbers comparable from run to run: parallel workers get
+their own cores and a fixed scheduling priority, low-end device profiles are
+held to one core and a CPU duty cycle, and system load is sampled around every
+run so noisy results can be spotted. Pinning and load sampling need Linux; on
+other platforms those controls are skipped and runs proceed as before
+"""
+
+import os
+import queue
+import shutil
+import signal
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Iterator, Tuple
+
+DUTY_PERIOD = 0.02  # Seconds per stop/continue cycle, about one frame at 60 FPS
+PROC_STAT = "/proc/stat"
+
+
+def available_cores() -> List[int]:
+    """Cores this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def can_pin() -> bool:
+    return shutil.which("taskset") is not None
+
+
+def can_throttle() -> bool:
+    return hasattr(signal, "SIGSTOP")
+
+
+def load_average() -> float:
+    """1-minute system load average (0 where unavailable)"""
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return 0.0
+
+
+def cpu_times() -> Optional[Tuple[int, int]]:
+    """(busy, total) jiffies across all cores, from /proc/stat"""
+    try:
+        with open(PROC_STAT) as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)  # idle + iowait
+    total = sum(fields[:8])  # guest time is already counted in user
+    return total - idle, total
+
+
+def cpu_busy_pct(before: Optional[Tuple[int, int]], after: Optional[Tuple[int, int]]) -> float:
+    """Share of all cores that were busy between two cpu_times() samples"""
+    if not before or not after or after[1] <= before[1]:
+        return 0.0
+    return 100.0 * (after[0] - before[0]) / (after[1] - before[1])
+
+
+def limit_prefix(cores: Optional[List[int]], nice: Optional[int]) -> List[str]:
+    """taskset/nice command prefix that pins and reprioritizes the child before
+    Godot starts, so every thread the engine spawns inherits the limits.
+    Applied in the exec'd command rather than a preexec_fn, which is not safe
+    to run from the orchestrator's worker threads"""
+    prefix: List[str] = []
+    if cores and can_pin():
+        prefix += ["taskset", "-c", ",".join(str(c) for c in cores)]
+    if nice is not None and shutil.which("nice"):
+        # nice takes an increment; lowering niceness below the parent's needs
+        # privileges, otherwise nice warns and runs the command unchanged
+        prefix += ["nice", "-n", str(nice - os.nice(0))]
+    return prefix
+
+
+class CoreAllocator:
+    """Disjoint core sets, one per concurrent worker"""
+
+    def __init__(self, workers: int):
+        cores = available_cores()
+        workers = max(1, workers)
+        per_worker = max(1, len(cores) // workers)
+        # With more workers than cores the sets wrap around and overlap
+        self.shared = len(cores) < workers
+        self.per_worker = per_worker
+        self._slots: "queue.Queue[List[int]]" = queue.Queue()
+        for i in range(workers):
+            start = (i * per_worker) % len(cores)
+            self._slots.put(cores[start:start + per_worker])
+
+    @contextmanager
+    def acquire(self) -> Iterator[List[int]]:
+        """Borrow a core set for the duration of one run"""
+        slot = self._slots.get()
+        try:
+            yield slot
+        finally:
+            self._slots.put(slot)
+
+
+class DutyCycleThrottle:
+    """Alternately stops and continues a process so it gets at most `duty` of
+    each period - a rough stand-in for a slower CPU.
+
+    Create it right after spawning, before anything can reap the child: signals
+    go through a pidfd where available, so once the child has exited they fail
+    instead of reaching whatever process reuses the pid"""
+
+    def __init__(self, pid: int, duty: float, period: float = DUTY_PERIOD):
+        self.pid = pid
+        self.run_time = period * duty
+        self.pause_time = period - self.run_time
+        self._pidfd = self._open_pidfd(pid)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def start(self) -> "DutyCycleThrottle":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._signal(signal.SIGCONT)
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.run_time):
+            if not self._signal(signal.SIGSTOP):
+                return
+            stopping = self._stop.wait(self.pause_time)
+            if not self._signal(signal.SIGCONT) or stopping:
+                return
+
+    @staticmethod
+    def _open_pidfd(pid: int) -> Optional[int]:
+        if not hasattr(os, "pidfd_open") or not hasattr(signal, "pidfd_send_signal"):
+            return None
+        try:
+            return os.pidfd_open(pid)
+        except OSError:
+            return None
+
+    def _exited(self) -> bool:
+        """Whether the child has exited, without reaping it"""
+        try:
+            return os.waitid(os.P_PID, self.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None
+        except ChildProcessError:
+            return True  # Already reaped
+
+    def _signal(self, sig: int) -> bool:
+        if self._pidfd is not None:
+            try:
+                signal.pidfd_send_signal(self._pidfd, sig)
+                return True
+            except ProcessLookupError:
+                return False
+        # Without pidfds, stop as soon as the child exits. This narrows the
+        # window before communicate() reaps it but cannot close it entirely
+        if self._exited():
+            return False
+        try:
+            os.kill(self.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Fake Godot Executable
+Stand-in for the Godot binary that lets the orchestrator run without an engine.
+Mimics the CLI the suite uses, prints [TEST_AGENT] output and writes a results
+file to the project's user:// directory, with configurable latency and failures
+
+Usage:
+    GODOT_CMD=tests/fake_godot.py python tests/test_orchestrator.py
+
+Environment:
+    FAKE_GODOT_LATENCY      Seconds each run takes (default: 0.05)
+    FAKE_GODOT_JITTER       Extra random latency, up to this many seconds (default: 0)
+    FAKE_GODOT_FAIL_RATE    Probability a run reports failed tests (default: 0)
+    FAKE_GODOT_CRASH_RATE   Probability a run crashes without results (default: 0)
+    FAKE_GODOT_OUTPUT_LINES Extra log lines printed per run (default: 20)
+    FAKE_GODOT_FRAME_MS     Mean frame time reported (default: 16.7)
+
+Like Godot, --quit-after is a frame count: a run whose session needs more frames
+(at --fixed-fps, or 60) quits early without writing results
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import random
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_orchestrator import GameDiscovery
+
+FAKE_VERSION = "4.2.stable.fake"
+
+
+def env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, default))
+
+
+def fake_results(game_path: Path, config: dict, failed: bool) -> dict:
+    """Results in the shape test_agent.gd writes them"""
+    frame_ms = env_float("FAKE_GODOT_FRAME_MS", 16.7)
+    frame_times = sorted(random.gauss(frame_ms, frame_ms * 0.1) for _ in range(300))
+    results = {
+        "game_name": game_path.name,
+        "duration": env_float("FAKE_GODOT_LATENCY", 0.05),
+        "frames": len(frame_times),
+        "actions": len(config.get("scenarios", [])) * 5,
+        "errors": ["Fake failure"] if failed else [],
+        "passed": not failed,
+        "fps_avg": round(1000.0 / frame_ms),
+        "screenshots": 1,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "seed": config.get("seed", random.randint(0, 2**31)),
+        "replay": "replay" in config,
+        "startup_ms": random.randint(150, 250),
+        "frame_time_avg_ms": sum(frame_times) / len(frame_times),
+        "frame_time_p50_ms": frame_times[len(frame_times) // 2],
+        "frame_time_p95_ms": frame_times[int(len(frame_times) * 0.95)],
+        "frame_time_max_ms": frame_times[-1],
+        "memory_peak_mb": random.uniform(40, 60),
+        "memory_slope_mb_s": random.uniform(-0.01, 0.01)
+    }
+    if config.get("scenarios"):
+        latencies = sorted(random.uniform(frame_ms, frame_ms * 3) for _ in range(20))
+        results.update({
+            "input_latency_p50_ms": latencies[10],
+            "input_latency_p95_ms": latencies[19],
+            "input_latency_p95_frames": round(latencies[19] / frame_ms),
+            "input_latency_samples": len(latencies),
+            "input_latency_missed": 0,
+            "input_latency": {"scenarios": {}, "sources": {"signal:score_changed": len(latencies)}}
+        })
+    if config.get("bot"):
+        results.update({
+            "bot": config["bot"],
+            "bot_inputs": random.randint(100, 1000),
+            "survival_time": random.uniform(10, config.get("bot_duration", 180)),
+            "survived": False
+        })
+    return results
+
+
+def fake_png(width: int = 72, height: int = 128) -> bytes:
+    """Solid-colour PNG standing in for a viewport screenshot"""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    rows = b"".join(b"\x00" + b"\x1a\x1a\x2e" * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows))
+            + chunk(b"IEND", b""))
+
+
+def run_project(args: argparse.Namespace) -> int:
+    game_path = Path(args.path).resolve()
+    config_file = game_path / "test_config.json"
+    config = json.loads(config_file.read_text()) if config_file.exists() else {}
+
+    print(f"Godot Engine v{FAKE_VERSION} - https://godotengine.org")
+    print("[TEST_AGENT] Starting autonomous tests...")
+
+    delay = env_float("FAKE_GODOT_LATENCY", 0.05) + random.uniform(0, env_float("FAKE_GODOT_JITTER", 0.0))
+    time.sleep(delay)
+
+    # Frames the session would take: bots play for their full duration, replays for the trace
+    fps = args.fixed_fps or 60
+    frames_needed = max(1, round(delay * fps))
+    if config.get("bot"):
+        frames_needed = max(frames_needed, int(config.get("bot_duration", 0) * fps))
+    if config.get("replay"):
+        frames_needed = max(frames_needed, int(config["replay"].get("frames", 0)))
+    if args.quit_after and args.quit_after < frames_needed:
+        print(f"[TEST_AGENT] Quit after {args.quit_after} of {frames_needed} frames, before the tests finished")
+        return 0
+
+    if random.random() < env_float("FAKE_GODOT_CRASH_RATE", 0.0):
+        print("ERROR: Fake crash (signal 11)", file=sys.stderr)
+        return 139
+
+    for scenario in config.get("scenarios", []):
+        print(f"[TEST_AGENT] Running scenario: {scenario}")
+    for i in range(int(env_float("FAKE_GODOT_OUTPUT_LINES", 20))):
+        print(f"[TEST_AGENT] Frame {i * 60}: ok")
+
+    failed = random.random() < env_float("FAKE_GODOT_FAIL_RATE", 0.0)
+    user_dir = GameDiscovery.user_data_dir(game_path)
+    user_dir.mkdir(parents=True, exist_ok=True)
+    screenshot_dir = user_dir / "test_screenshots"
+    screenshot_dir.mkdir(exist_ok=True)
+    (screenshot_dir / f"gameplay_{int(time.time() * 1000)}.png").write_bytes(fake_png())
+    with open(user_dir / "test_results.json", "w") as f:
+        json.dump(fake_results(game_path, config, failed), f, indent=2)
+    if config.get("record_trace"):
+        with open(user_dir / "input_trace.json", "w") as f:
+            json.dump({"version": 1, "game": game_path.name, "seed": config.get("seed", 0),
+                       "fps": args.fixed_fps or 60, "frames": 0, "events": [],
+                       "final_state": {}}, f, indent=2)
+
+    print("[TEST_AGENT] Tests completed!")
+    print(f"[TEST_AGENT] PASSED: {str(not failed).lower()}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Godot executable for orchestrator testing")
+    parser.add_argument("--version", action="store_true")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--path")
+    parser.add_argument("--quit-after", type=int)
+    parser.add_argument("--fixed-fps", type=int)
+    parser.add_argument("--resolution")
+    args, _ = parser.parse_known_args()
+
+    if args.version:
+        print(FAKE_VERSION)
+        return 0
+    if not args.path:
+        print("ERROR: fake Godot only runs projects (--path)", file=sys.stderr)
+        return 1
+    return run_project(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
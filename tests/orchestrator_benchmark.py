@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Orchestrator Scale Benchmark
+Measures the orchestrator's own cost - discovery, prepare()/cleanup() file
+rewriting, thread-pool dispatch, result parsing and report serialization -
+by running it against fake_godot.py on synthetic collections of growing size
+"""
+
+import os
+import sys
+import io
+import shutil
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import List, Dict, Any
+from datetime import datetime
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generate_projects import PROJECT_GODOT_TEMPLATE
+
+REPO_DIR = Path(__file__).parent.parent
+FAKE_GODOT = Path(__file__).parent / "fake_godot.py"
+DEFAULT_SIZES = [10, 50, 200, 500]
+DEFAULT_PARALLEL = [1, 8]
+DEFAULT_LATENCY = 0.05
+
+
+def build_collection(root: Path, count: int, start: int = 0) -> List[str]:
+    """Add template games `start`..`count - 1` to a collection, creating it
+    (with the test framework) on the first call"""
+    if not (root / "_test_framework").exists():
+        shutil.copytree(REPO_DIR / "_test_framework", root / "_test_framework",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+    names = []
+    for i in range(start, count):
+        name = f"{i:04d}_bench_game"
+        game_dir = root / name
+        for item in ["autoload", "scenes"]:
+            shutil.copytree(REPO_DIR / "_template" / item, game_dir / item)
+        (game_dir / "project.godot").write_text(PROJECT_GODOT_TEMPLATE.format(
+            name=f"Bench Game {i:04d}",
+            description="Synthetic benchmark game"
+        ))
+        names.append(name)
+    return names
+
+
+def spawn_baseline(samples: int = 5) -> float:
+    """Seconds to start and finish fake_godot.py with no latency (process cost)"""
+    env = dict(os.environ, FAKE_GODOT_LATENCY="0")
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        subprocess.run([str(FAKE_GODOT), "--version"], capture_output=True, env=env)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run_benchmark(sizes: List[int], parallel_levels: List[int], repeat: int,
+                  latency: float) -> Dict[str, Any]:
+    root = Path(tempfile.mkdtemp(prefix="godot_bench_"))
+    try:
+        print(f"Building synthetic collection of up to {max(sizes)} games in {root}")
+        built = 0
+
+        # The orchestrator reads these at import time; fake_godot.py inherits them
+        os.environ["TEST_GAMES_DIR"] = str(root)
+        os.environ["GODOT_CMD"] = str(FAKE_GODOT)
+        os.environ["XDG_DATA_HOME"] = str(root / ".userdata")
+        os.environ["FAKE_GODOT_LATENCY"] = str(latency)
+        from tests.test_orchestrator import GameDiscovery, TestOrchestrator
+
+        baseline = spawn_baseline()
+        print(f"Stand-in process cost: {baseline * 1000:.1f}ms per run\n")
+
+        rows = []
+        tracemalloc.start()
+        for size in sizes:
+            # Grow the collection to exactly this size, so discovery and the
+            # orchestrator's own scan cover the games being measured and no more
+            build_collection(root, size, start=built)
+            built = max(built, size)
+
+            start = time.perf_counter()
+            GameDiscovery.discover_games()
+            discovery = time.perf_counter() - start
+
+            for parallel in parallel_levels:
+                walls = []
+                overheads = []
+                game_times = []
+                tracemalloc.reset_peak()
+                for _ in range(repeat):
+                    orchestrator = TestOrchestrator(parallel=parallel)
+                    with redirect_stdout(io.StringIO()):
+                        start = time.perf_counter()
+                        report = orchestrator.run_all_tests()
+                        walls.append(time.perf_counter() - start)
+                    # Job time not spent inside the stand-in process (spawn and
+                    # interpreter start-up count as the game's own runtime). Summing
+                    # per-job wall times leaves out workers idling for lack of jobs
+                    jobs = max(1, report.total_games)
+                    game_time = sum(r.process_time for r in report.results)
+                    busy = sum(r.duration for r in report.results)
+                    overheads.append(max(0.0, busy - game_time) / jobs)
+                    game_times.append(game_time / jobs)
+                _, peak = tracemalloc.get_traced_memory()
+
+                jobs = report.total_games
+                wall = statistics.median(walls)
+                overhead = statistics.median(overheads)
+                row = {
+                    "games": size,
+                    "parallel": parallel,
+                    "jobs": jobs,
+                    "failed": report.failed,
+                    "wall_s": wall,
+                    "throughput_jobs_s": jobs / wall if wall else 0.0,
+                    "game_time_per_job_ms": statistics.median(game_times) * 1000,
+                    "overhead_per_job_ms": overhead * 1000,
+                    "discovery_ms": discovery * 1000,
+                    "peak_python_mb": peak / 1048576
+                }
+                rows.append(row)
+                print(f"  {size:5} games  x{parallel:<3} {wall:8.2f}s  "
+                      f"{row['throughput_jobs_s']:7.1f} jobs/s  "
+                      f"{row['game_time_per_job_ms']:7.1f}ms/job in game  "
+                      f"{row['overhead_per_job_ms']:7.1f}ms/job overhead  "
+                      f"discovery {row['discovery_ms']:6.1f}ms  "
+                      f"peak {row['peak_python_mb']:6.1f}MB")
+        tracemalloc.stop()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "latency_s": latency,
+        "repeat": repeat,
+        "spawn_baseline_ms": baseline * 1000,
+        "results": rows
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the test orchestrator against a fake Godot")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"Collection sizes to test (default: {DEFAULT_SIZES})")
+    parser.add_argument("--parallel", "-p", type=int, nargs="+", default=DEFAULT_PARALLEL,
+                        help=f"Worker counts to test (default: {DEFAULT_PARALLEL})")
+    parser.add_argument("--repeat", "-r", type=int, default=1, help="Runs per configuration (median is kept)")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help=f"Seconds each fake game run takes (default: {DEFAULT_LATENCY})")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("ORCHESTRATOR SCALE BENCHMARK")
+    print(f"{'='*60}")
+    results = run_benchmark(sorted(args.sizes), args.parallel, args.repeat, args.latency)
+
+    # Kept in the artifact store so retention and `list` cover benchmarks too
+    largest = max(results["results"], key=lambda r: (r["games"], r["parallel"]))
+    results["kind"] = "benchmark"
+    results["summary"] = {"title": f"orchestrator: {largest['overhead_per_job_ms']:.1f}ms/job overhead "
+                                   f"at {largest['games']} games x{largest['parallel']}"}
+    # Imported late: the tests package loads the orchestrator, which must see TEST_GAMES_DIR
+    from tests.artifact_store import ArtifactStore
+    store = ArtifactStore()
+    run_id = store.save_run(results)
+    print(f"\nReport saved: run {run_id} ({store.runs_dir / run_id}.json)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Performance Bisect for Godot Games
+Finds the commit that introduced a frame time, startup or memory regression
+by measuring revisions in separate git worktrees
+"""
+
+import sys
+import math
+import shutil
+import argparse
+import itertools
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Any
+from datetime import datetime
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_orchestrator import GameDiscovery, TestAgent, GAMES_DIR
+from tests.artifact_store import ArtifactStore
+
+# Metrics that can be bisected: TestResult field and unit (higher is always worse)
+METRICS = {
+    "frame_p95": ("frame_time_p95_ms", "ms"),
+    "frame_avg": ("frame_time_avg_ms", "ms"),
+    "startup": ("startup_ms", "ms"),
+    "memory_peak": ("memory_peak_mb", "MB"),
+    "memory_slope": ("memory_slope_mb_s", "MB/s"),
+}
+DEFAULT_RUNS = 5
+DEFAULT_SEED = 1
+DEFAULT_FPS = 60
+EXACT_TEST_LIMIT = 200000  # Largest number of rank permutations enumerated exactly
+
+
+@dataclass
+class RevisionMeasurement:
+    """Repeated measurements of one metric at one revision"""
+    commit: str
+    subject: str
+    samples: List[float] = field(default_factory=list)
+    p_value: Optional[float] = None
+    verdict: str = ""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["median"] = self.median
+        return data
+
+
+def mann_whitney_p(baseline: List[float], candidate: List[float]) -> float:
+    """One-sided Mann-Whitney U test: p-value that candidate tends to be larger"""
+    pooled = sorted(baseline + candidate)
+    ranks: Dict[float, float] = {}
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1] == pooled[i]:
+            j += 1
+        ranks[pooled[i]] = (i + j) / 2 + 1  # Ties share their average rank
+        i = j + 1
+
+    n1, n2 = len(baseline), len(candidate)
+    all_ranks = [ranks[v] for v in baseline + candidate]
+    observed = sum(ranks[v] for v in candidate)
+
+    # Small samples (the usual case): enumerate every assignment of ranks
+    if math.comb(n1 + n2, n2) <= EXACT_TEST_LIMIT:
+        total = 0
+        extreme = 0
+        for combo in itertools.combinations(all_ranks, n2):
+            total += 1
+            if sum(combo) >= observed - 1e-9:
+                extreme += 1
+        return extreme / total
+
+    # Large samples: normal approximation with continuity correction
+    u = observed - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    sd = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sd == 0:
+        return 1.0
+    z = (u - mean - 0.5) / sd
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(runs: int) -> float:
+    """Smallest p mann_whitney_p() can return with `runs` samples per side: every
+    candidate sample ranked above every baseline sample"""
+    return 1 / math.comb(2 * runs, runs)
+
+
+def git(*args: str) -> str:
+    """Run a git command in the collection repository"""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=str(GAMES_DIR),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+class PerfBisect:
+    """Binary search over git history for the first revision with a regression"""
+
+    def __init__(self, game_name: str, metric: str, runs: int = DEFAULT_RUNS,
+                 alpha: float = 0.05, min_effect: float = 0.05,
+                 agent_config: Optional[Dict[str, Any]] = None):
+        self.game_name = game_name
+        self.metric = metric
+        self.field, self.unit = METRICS[metric]
+        self.runs = runs
+        self.alpha = alpha
+        self.min_effect = min_effect
+        self.agent_config = agent_config or {}
+        self.measurements: Dict[str, RevisionMeasurement] = {}
+        self.worktree_root: Optional[Path] = None
+        self.baseline: Optional[RevisionMeasurement] = None
+
+    def run(self, good: str, bad: str) -> Dict[str, Any]:
+        """Bisect between a known good and a known bad revision"""
+        good_sha = git("rev-parse", "--verify", f"{good}^{{commit}}")
+        bad_sha = git("rev-parse", "--verify", f"{bad}^{{commit}}")
+
+        # Only commits that touch the game can change how it performs
+        candidates = git("rev-list", "--reverse", f"{good_sha}..{bad_sha}", "--", self.game_name).split()
+        if not candidates or candidates[-1] != bad_sha:
+            candidates.append(bad_sha)
+
+        print(f"\n{'='*60}")
+        print(f"PERFORMANCE BISECT: {self.game_name}")
+        print(f"{'='*60}")
+        print(f"Metric:     {self.metric} ({self.field}, higher is worse)")
+        print(f"Good:       {good_sha[:10]}")
+        print(f"Bad:        {bad_sha[:10]}")
+        print(f"Candidates: {len(candidates)} commits touching {self.game_name}")
+        print(f"Runs:       {self.runs} per revision")
+        print(f"{'='*60}\n")
+
+        self.worktree_root = Path(tempfile.mkdtemp(prefix="godot_bisect_"))
+        first_bad = None
+        try:
+            self.baseline = self._measure(good_sha)
+            self.baseline.verdict = "good"
+            if not self.baseline.samples:
+                raise RuntimeError(f"No measurements at good revision {good_sha[:10]}")
+
+            bad_measurement = self._measure(bad_sha)
+            if not self._is_bad(bad_measurement):
+                print("\nNo significant regression between the good and bad revisions")
+            else:
+                first_bad = self._search(candidates)
+        finally:
+            self._remove_worktrees()
+
+        report = self._build_report(good_sha, bad_sha, first_bad)
+        self._print_summary(report)
+        self._save_report(report)
+        return report
+
+    def _search(self, candidates: List[str]) -> Optional[str]:
+        # candidates[-1] is known bad; everything before index `low` is good
+        low, high = -1, len(candidates) - 1
+        while high - low > 1:
+            mid = (low + high) // 2
+            measurement = self._measure(candidates[mid])
+            if not measurement.samples:
+                # Unmeasurable revision (e.g. broken build) - leave it out
+                measurement.verdict = "skip"
+                del candidates[mid]
+                high -= 1
+                continue
+            if self._is_bad(measurement):
+                high = mid
+            else:
+                low = mid
+        return candidates[high]
+
+    def _is_bad(self, measurement: RevisionMeasurement) -> bool:
+        """Worse than the good revision both significantly and by a meaningful margin"""
+        if not measurement.samples:
+            return False
+        measurement.p_value = mann_whitney_p(self.baseline.samples, measurement.samples)
+        margin = abs(self.baseline.median) * self.min_effect
+        bad = measurement.p_value < self.alpha and measurement.median > self.baseline.median + margin
+        measurement.verdict = "bad" if bad else "good"
+        return bad
+
+    def _measure(self, commit: str) -> RevisionMeasurement:
+        """Run the game N times at a revision (cached per commit)"""
+        if commit in self.measurements:
+            return self.measurements[commit]
+
+        subject = git("log", "-1", "--format=%s", commit)
+        measurement = RevisionMeasurement(commit=commit, subject=subject)
+        self.measurements[commit] = measurement
+        print(f"[BISECT] Measuring {commit[:10]} {subject}")
+
+        game_dir = self._checkout(commit) / self.game_name
+        if not (game_dir / "project.godot").exists():
+            print(f"[BISECT]   {self.game_name} does not exist at this revision")
+            return measurement
+
+        game_info = GameDiscovery._analyze_game(game_dir)
+        for i in range(self.runs):
+            agent = TestAgent(game_info, self.agent_config)
+            if not agent.prepare():
+                agent.cleanup()
+                break
+            result = agent.run()
+            # A zero median frame time means the agent never reported results
+            if result.frame_time_p50_ms > 0:
+                measurement.samples.append(getattr(result, self.field))
+            else:
+                print(f"[BISECT]   run {i + 1} produced no results: {'; '.join(result.errors[:2])}")
+
+        if measurement.samples:
+            print(f"[BISECT]   median {self.metric}: {measurement.median:.3f} {self.unit} "
+                  f"({len(measurement.samples)} runs)")
+        return measurement
+
+    def _checkout(self, commit: str) -> Path:
+        path = self.worktree_root / commit[:12]
+        if not path.exists():
+            git("worktree", "add", "--detach", str(path), commit)
+        return path
+
+    def _remove_worktrees(self) -> None:
+        if not self.worktree_root:
+            return
+        for path in self.worktree_root.iterdir():
+            subprocess.run(["git", "worktree", "remove", "--force", str(path)],
+                           cwd=str(GAMES_DIR), capture_output=True)
+        shutil.rmtree(self.worktree_root, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=str(GAMES_DIR), capture_output=True)
+
+    def _build_report(self, good: str, bad: str, first_bad: Optional[str]) -> Dict[str, Any]:
+        measured = sorted(self.measurements.values(),
+                          key=lambda m: int(git("rev-list", "--count", m.commit)))
+        first_bad_label = first_bad[:10] if first_bad else "none"
+        return {
+            "kind": "bisect",
+            "summary": {"title": f"{self.game_name} {self.metric}: first bad {first_bad_label}"},
+            "game": self.game_name,
+            "metric": self.metric,
+            "unit": self.unit,
+            "runs": self.runs,
+            "alpha": self.alpha,
+            "min_effect": self.min_effect,
+            "good": good,
+            "bad": bad,
+            "first_bad": first_bad,
+            "first_bad_subject": self.measurements[first_bad].subject if first_bad else None,
+            "agent_config": self.agent_config,
+            "timestamp": datetime.now().isoformat(),
+            "revisions": [m.to_dict() for m in measured]
+        }
+
+    def _print_summary(self, report: Dict[str, Any]) -> None:
+        print(f"\n{'='*60}")
+        print("BISECT SUMMARY")
+        print(f"{'='*60}")
+        for revision in report["revisions"]:
+            p_value = f"p={revision['p_value']:.3f}" if revision["p_value"] is not None else "baseline"
+            print(f"  {revision['commit'][:10]}  {revision['verdict']:5}  "
+                  f"{revision['median']:9.3f} {self.unit:4}  {p_value:9}  {revision['subject'][:40]}")
+        print(f"{'='*60}")
+        if report["first_bad"]:
+            print(f"First bad commit: {report['first_bad'][:10]} {report['first_bad_subject']}")
+        else:
+            print("First bad commit: not found")
+
+    def _save_report(self, report: Dict[str, Any]) -> None:
+        # Kept in the artifact store so retention and `list` cover bisects too
+        store = ArtifactStore()
+        run_id = store.save_run(report)
+        print(f"\nReport saved: run {run_id} ({store.runs_dir / run_id}.json)")
+        print(f"Open it with: python tests/artifact_store.py show {run_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bisect a performance regression across git history")
+    parser.add_argument("game", help="Game name or partial name (e.g., 'flappy', '05')")
+    parser.add_argument("--good", required=True, help="Revision without the regression")
+    parser.add_argument("--bad", default="HEAD", help="Revision with the regression (default: HEAD)")
+    parser.add_argument("--metric", "-m", choices=sorted(METRICS), default="frame_p95",
+                        help="Metric to bisect (default: frame_p95)")
+    parser.add_argument("--runs", "-n", type=int, default=DEFAULT_RUNS,
+                        help=f"Runs per revision (default: {DEFAULT_RUNS})")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level (default: 0.05)")
+    parser.add_argument("--min-effect", type=float, default=0.05,
+                        help="Smallest relative slowdown that counts as bad (default: 0.05)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Game RNG seed")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS,
+                        help=f"Fixed timestep; frames run unthrottled (default: {DEFAULT_FPS})")
+    parser.add_argument("--replay", metavar="NAME", help="Drive each run with a recorded input trace")
+    parser.add_argument("--snapshot", "-s", help="Start each run from a stored snapshot")
+    parser.add_argument("--bot", "-b", action="store_true", help="Drive each run with the game's heuristic bot")
+    parser.add_argument("--bot-duration", type=int, metavar="SECONDS", help="Longest bot session per run")
+    parser.add_argument("--cores", type=int, nargs="+", metavar="CPU",
+                        help="Pin every run to these cores for steadier numbers (Linux)")
+    parser.add_argument("--nice", type=int, metavar="N", help="Run games at this scheduling priority")
+    args = parser.parse_args()
+
+    if args.bot and args.replay:
+        parser.error("--bot and --replay cannot be combined")
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    if not 0 < args.alpha < 1:
+        parser.error("--alpha must be between 0 and 1")
+    # With too few runs even a total separation is not significant, and no
+    # revision could ever be marked bad
+    if min_p_value(args.runs) >= args.alpha:
+        needed = next(n for n in itertools.count(args.runs) if min_p_value(n) < args.alpha)
+        parser.error(f"--runs {args.runs} cannot reach p < {args.alpha} "
+                     f"(smallest possible p is {min_p_value(args.runs):.3f}); use at least {needed}")
+
+    games = [g for g in GameDiscovery.discover_games() if args.game.lower() in g["name"].lower()]
+    if not games:
+        print(f"Game not found: {args.game}")
+        return 1
+
+    # Deterministic, accelerated runs: fixed seed and a fixed timestep
+    agent_config = {
+        "seed": args.seed,
+        "fixed_fps": args.fps,
+        "replay": args.replay,
+        "snapshot": args.snapshot,
+        "bot": args.bot,
+        "bot_duration": args.bot_duration,
+        "cores": args.cores,
+        "nice": args.nice,
+    }
+    bisect = PerfBisect(games[0]["name"], args.metric, runs=args.runs, alpha=args.alpha,
+                        min_effect=args.min_effect, agent_config=agent_config)
+    try:
+        report = bisect.run(args.good, args.bad)
+    except subprocess.CalledProcessError as e:
+        print(f"git failed: {e.stderr.strip()}")
+        return 1
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
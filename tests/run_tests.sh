@@ -43,6 +43,9 @@ PARALLEL=1
 VERBOSE=""
 GAMES=""
 LIST_ONLY=""
+SNAPSHOT=""
+BOT=""
+PROFILES=""
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -58,6 +61,21 @@ while [[ $# -gt 0 ]]; do
             LIST_ONLY="-l"
             shift
             ;;
+        -s|--snapshot)
+            SNAPSHOT="$2"
+            shift 2
+            ;;
+        -b|--bot)
+            BOT="-b"
+            shift
+            ;;
+        -d|--profiles)
+            shift
+            while [[ $# -gt 0 ]] && [[ ! "$1" =~ ^- ]]; do
+                PROFILES="$PROFILES $1"
+                shift
+            done
+            ;;
         -g|--games)
             shift
             while [[ $# -gt 0 ]] && [[ ! "$1" =~ ^- ]]; do
@@ -73,6 +91,9 @@ while [[ $# -gt 0 ]]; do
             echo "  -v, --verbose       Verbose output"
             echo "  -l, --list          List games only, don't run tests"
             echo "  -g, --games NAMES   Test specific games (space separated)"
+            echo "  -s, --snapshot NAME Start games from a stored snapshot"
+            echo "  -b, --bot           Let heuristic bots play games that have one"
+            echo "  -d, --profiles NAMES Run every game under these device profiles ('all' for every one)"
             echo "  -h, --help          Show this help"
             echo ""
             echo "Examples:"
@@ -80,6 +101,9 @@ while [[ $# -gt 0 ]]; do
             echo "  $0 -l                       # List all games"
             echo "  $0 -g flappy snake          # Test specific games"
             echo "  $0 -p 4 -v                  # 4 parallel workers, verbose"
+            echo "  $0 -s late_game             # Benchmark late-game states"
+            echo "  $0 -b -v                    # Long bot sessions with survival times"
+            echo "  $0 -d baseline low_end_android  # Compare device profiles side by side"
             exit 0
             ;;
         *)
@@ -94,6 +118,9 @@ CMD="python3 \"$SCRIPT_DIR/test_orchestrator.py\""
 [ -n "$PARALLEL" ] && CMD="$CMD -p $PARALLEL"
 [ -n "$VERBOSE" ] && CMD="$CMD $VERBOSE"
 [ -n "$LIST_ONLY" ] && CMD="$CMD $LIST_ONLY"
+[ -n "$SNAPSHOT" ] && CMD="$CMD -s $SNAPSHOT"
+[ -n "$BOT" ] && CMD="$CMD $BOT"
+[ -n "$PROFILES" ] && CMD="$CMD --profiles $PROFILES"
 [ -n "$GAMES" ] && CMD="$CMD -g $GAMES"
 
 # Run tests
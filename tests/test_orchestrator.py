@@ -13,15 +13,30 @@ import time
 import argparse
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import tempfile
 
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.artifact_store import ArtifactStore, new_run_id, DEFAULT_KEEP_RUNS, DEFAULT_MAX_MB
+from tests.cpu_control import (CoreAllocator, DutyCycleThrottle, available_cores, can_pin,
+                               can_throttle, cpu_busy_pct, cpu_times, limit_prefix, load_average)
+
 # Configuration
-GAMES_DIR = Path(__file__).parent.parent
+# TEST_GAMES_DIR points the suite at another collection (e.g. the synthetic one
+# built by orchestrator_benchmark.py); it must contain _test_framework/ as well
+GAMES_DIR = Path(os.environ.get("TEST_GAMES_DIR") or Path(__file__).parent.parent)
 TEST_FRAMEWORK_DIR = GAMES_DIR / "_test_framework"
+SNAPSHOTS_DIR = GAMES_DIR / "tests" / "snapshots"
+TRACES_DIR = GAMES_DIR / "tests" / "traces"
+PROFILES_FILE = GAMES_DIR / "tests" / "device_profiles.json"
+REPORTS_DIR = GAMES_DIR / "tests" / "reports"
+BOTS_DIR = TEST_FRAMEWORK_DIR / "bots"
 TEST_TIMEOUT = 60  # seconds per game
+BOT_DURATION = 180  # seconds a bot may keep a game alive
 GODOT_CMD = os.environ.get("GODOT_CMD", "godot")
 
 
@@ -41,6 +56,32 @@ class TestResult:
     stderr: str = ""
     exit_code: int = 0
     timestamp: str = ""
+    snapshot: str = ""
+    seed: int = 0
+    frame_time_avg_ms: float = 0.0
+    frame_time_p50_ms: float = 0.0
+    frame_time_p95_ms: float = 0.0
+    frame_time_max_ms: float = 0.0
+    memory_peak_mb: float = 0.0
+    memory_slope_mb_s: float = 0.0
+    startup_ms: float = 0.0
+    bot: str = ""
+    survival_time: float = 0.0
+    survived: bool = False
+    artifacts: Dict[str, str] = field(default_factory=dict)  # Screenshot name -> store ref
+    profile: str = ""
+    cpu_cores: List[int] = field(default_factory=list)  # Empty when the run was not pinned
+    cpu_duty: float = 1.0
+    load_avg_start: float = 0.0
+    load_avg_end: float = 0.0
+    cpu_busy_pct: float = 0.0  # All-core utilisation while the game ran
+    process_time: float = 0.0  # Seconds the Godot process itself ran (duration minus orchestration)
+    input_latency_p50_ms: float = 0.0
+    input_latency_p95_ms: float = 0.0
+    input_latency_p95_frames: int = 0
+    input_latency_samples: int = 0
+    input_latency_missed: int = 0  # Presses with no reaction within the probe window
+    input_latency: Dict[str, Any] = field(default_factory=dict)  # Per scenario and reaction source
 
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -57,9 +98,23 @@ class TestReport:
     results: List[TestResult] = field(default_factory=list)
     timestamp: str = ""
     godot_version: str = ""
+    run_id: str = ""
+
+    def profile_matrix(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Frame-time percentiles per game and device profile"""
+        matrix: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for result in self.results:
+            if result.profile:
+                matrix.setdefault(result.game_name, {})[result.profile] = {
+                    "p50_ms": result.frame_time_p50_ms,
+                    "p95_ms": result.frame_time_p95_ms,
+                    "max_ms": result.frame_time_max_ms
+                }
+        return matrix
 
     def to_dict(self) -> Dict:
         return {
+            "run_id": self.run_id,
             "summary": {
                 "total_games": self.total_games,
                 "passed": self.passed,
@@ -70,6 +125,7 @@ class TestReport:
             },
             "godot_version": self.godot_version,
             "timestamp": self.timestamp,
+            "profiles": self.profile_matrix(),
             "results": [r.to_dict() for r in self.results]
         }
 
@@ -85,6 +141,25 @@ class GameDiscovery:
         "puzzle": ["memory", "match", "puzzle", "pin", "pull"]
     }
 
+    # Heuristic bot policies (_test_framework/bots/<policy>_bot.gd)
+    BOT_POLICIES = {
+        "flappy": ["flappy"],
+        "paddle": ["pong", "breakout"],
+        "tetris": ["tetris"],
+        "corner": ["2048"],
+        "slicer": ["fruit"]
+    }
+
+    # Game scene properties that change when a tap is handled, timed by the agent's
+    # input latency probes on top of GameManager signals and redraws. "decrease"
+    # skips the steady climb of a value such as falling velocity
+    LATENCY_WATCHES = {
+        "flappy": [{"node": ".", "property": "velocity", "change": "decrease"}],
+        "tap_dash": [{"node": ".", "property": "game_started"},
+                     {"node": ".", "property": "current_direction"}],
+        "fidget": [{"node": ".", "property": "_is_pressing"}]
+    }
+
     @staticmethod
     def discover_games() -> List[Dict[str, Any]]:
         """Find all game projects in the collection"""
@@ -121,6 +196,15 @@ class GameDiscovery:
                     game_type = gtype
                     break
 
+        latency_watch = next((watches for pattern, watches in GameDiscovery.LATENCY_WATCHES.items()
+                              if pattern in name_lower), [])
+
+        bot = None
+        for policy, patterns in GameDiscovery.BOT_POLICIES.items():
+            if any(pattern in name_lower for pattern in patterns):
+                bot = policy
+                break
+
         # Check for game.gd to analyze mechanics
         game_gd = game_dir / "scenes" / "game.gd"
         mechanics = []
@@ -140,19 +224,165 @@ class GameDiscovery:
             "path": str(game_dir),
             "type": game_type,
             "mechanics": mechanics,
+            "bot": bot,
+            "latency_watch": latency_watch,
             "has_menu": (game_dir / "scenes" / "main_menu.tscn").exists(),
             "has_game_manager": (game_dir / "autoload" / "game_manager.gd").exists(),
             "has_audio": (game_dir / "autoload" / "audio_manager.gd").exists()
         }
 
+    @staticmethod
+    def user_data_dir(game_path: Path) -> Optional[Path]:
+        """Get the Godot user:// directory for a game"""
+        if not (game_path / "project.godot").exists():
+            return None
+        project_name = GameDiscovery.project_name(game_path)
+
+        # Godot user directory varies by OS
+        if sys.platform == "darwin":
+            base = Path.home() / "Library/Application Support/Godot/app_userdata"
+        elif sys.platform == "win32":
+            base = Path(os.environ.get("APPDATA", "")) / "Godot/app_userdata"
+        else:
+            data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local/share"
+            base = Path(data_home) / "godot/app_userdata"
+
+        return base / project_name
+
+    @staticmethod
+    def project_name(game_path: Path) -> str:
+        """Project name as Godot sees it (override.cfg wins over project.godot)"""
+        project_name = None
+        for settings_file in (game_path / "project.godot", game_path / "override.cfg"):
+            if not settings_file.exists():
+                continue
+            for line in settings_file.read_text().split("\n"):
+                if line.startswith("config/name="):
+                    project_name = line.split("=", 1)[1].strip().strip('"')
+                    break
+        return project_name or game_path.name
+
+
+@dataclass
+class DeviceProfile:
+    """Device configuration applied to a sandboxed copy of a game"""
+    name: str
+    description: str = ""
+    screen: List[int] = field(default_factory=lambda: [720, 1280])  # Device window size
+    stretch_mode: str = "viewport"
+    stretch_aspect: str = "keep"
+    renderer: str = "mobile"
+    max_fps: int = 0
+    cpu_cores: int = 0  # 0 = no limit
+    cpu_duty: float = 1.0  # Share of each period the game may run
+
+    @staticmethod
+    def load_all() -> Dict[str, "DeviceProfile"]:
+        """Profiles defined in tests/device_profiles.json"""
+        if not PROFILES_FILE.exists():
+            return {}
+        with open(PROFILES_FILE) as f:
+            data = json.load(f)
+        return {name: DeviceProfile(name=name, **values) for name, values in data.items()}
+
+    def override_cfg(self, project_name: str) -> str:
+        """Contents for override.cfg, which Godot applies on top of project.godot"""
+        # A distinct name gives every profile its own user:// directory
+        return "\n".join([
+            "[application]",
+            "",
+            f'config/name="{project_name} [{self.name}]"',
+            f"run/max_fps={self.max_fps}",
+            "",
+            "[display]",
+            "",
+            # The 720x1280 design size stays; the stretch mode scales it to the device window
+            f"window/size/window_width_override={self.screen[0]}",
+            f"window/size/window_height_override={self.screen[1]}",
+            f'window/stretch/mode="{self.stretch_mode}"',
+            f'window/stretch/aspect="{self.stretch_aspect}"',
+            "",
+            "[rendering]",
+            "",
+            f'renderer/rendering_method="{self.renderer}"',
+            f'renderer/rendering_method.mobile="{self.renderer}"',
+            ""
+        ])
+
+
+def job_label(game_info: Dict[str, Any]) -> str:
+    """Game name, plus the device profile for profile matrix jobs"""
+    profile = game_info.get("profile")
+    return f"{game_info['name']} [{profile.name}]" if profile else game_info["name"]
+
+
+class JsonLibrary:
+    """Per-game library of JSON files stored as ROOT/<game folder>/<name>.json"""
+
+    ROOT: Path = SNAPSHOTS_DIR
+
+    @classmethod
+    def path(cls, game_name: str, name: str) -> Path:
+        return cls.ROOT / game_name / f"{name}.json"
+
+    @classmethod
+    def list_names(cls, game_name: str) -> List[str]:
+        """List entry names available for a game"""
+        game_dir = cls.ROOT / game_name
+        if not game_dir.is_dir():
+            return []
+        return sorted(p.stem for p in game_dir.glob("*.json"))
+
+    @classmethod
+    def load(cls, game_name: str, name: str) -> Optional[Dict[str, Any]]:
+        """Load an entry, or None if the game has no entry of that name"""
+        entry_file = cls.path(game_name, name)
+        if not entry_file.exists():
+            return None
+
+        with open(entry_file) as f:
+            data = json.load(f)
+        data.setdefault("name", name)
+        return data
+
+
+class SnapshotLibrary(JsonLibrary):
+    """Stored late-game snapshots that a test run can start from
+
+    Each file holds the dictionary a game's load_snapshot() accepts under
+    the "state" key.
+    """
+
+    ROOT = SNAPSHOTS_DIR
+
+
+class TraceLibrary(JsonLibrary):
+    """Recorded input traces: frame-indexed touch events plus the RNG seed"""
+
+    ROOT = TRACES_DIR
+
+    @classmethod
+    def save(cls, game_name: str, name: str, trace_file: Path) -> Path:
+        """Store a trace written by the test agent under the given name"""
+        dest = cls.path(game_name, name)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(trace_file, dest)
+        return dest
+
 
 class TestAgent:
     """Agent that runs tests on a single game"""
 
-    def __init__(self, game_info: Dict[str, Any], config: Dict[str, Any] = None):
+    def __init__(self, game_info: Dict[str, Any], config: Dict[str, Any] = None,
+                 store: Optional[ArtifactStore] = None):
         self.game_info = game_info
         self.config = config or {}
+        self.store = store
+        self.source_path = Path(game_info["path"])
+        self.profile: Optional[DeviceProfile] = game_info.get("profile")
         self.temp_dir: Optional[Path] = None
+        self.fixed_fps: Optional[int] = self.config.get("fixed_fps")
+        self.timeout = TEST_TIMEOUT
 
     def prepare(self) -> bool:
         """Prepare the game for testing by injecting test framework"""
@@ -161,6 +391,10 @@ class TestAgent:
         # Create temp directory for test files
         self.temp_dir = Path(tempfile.mkdtemp(prefix="godot_test_"))
 
+        # Profile runs use a sandboxed copy, so several profiles of one game can run at once
+        if self.profile:
+            game_path = self._make_sandbox(game_path)
+
         # Copy test agent to game's autoload
         test_agent_src = TEST_FRAMEWORK_DIR / "autoload" / "test_agent.gd"
         if not test_agent_src.exists():
@@ -176,9 +410,55 @@ class TestAgent:
             "auto_exit": True,
             "game_type": self.game_info["type"],
             "timeout": TEST_TIMEOUT,
-            "scenarios": ["menu_navigation", self.game_info["type"], "stress_test"]
+            "scenarios": ["menu_navigation", self.game_info["type"], "stress_test"],
+            "latency_watch": self.game_info.get("latency_watch", [])
         }
 
+        snapshot_name = self.config.get("snapshot")
+        if snapshot_name:
+            snapshot = SnapshotLibrary.load(self.game_info["name"], snapshot_name)
+            if snapshot is None:
+                print(f"[ERROR] Snapshot not found: {self.game_info['name']}/{snapshot_name}")
+                return False
+            test_config["snapshot"] = snapshot
+
+        # Bots replace the scripted scenarios and may play for minutes
+        if self.config.get("bot") and self.game_info.get("bot"):
+            shutil.copytree(BOTS_DIR, game_path / "test_bots", dirs_exist_ok=True)
+            bot_duration = self.config.get("bot_duration") or BOT_DURATION
+            test_config["bot"] = self.game_info["bot"]
+            test_config["bot_duration"] = bot_duration
+            self.timeout = TEST_TIMEOUT + bot_duration
+
+        # Results left over from an earlier run must not be mistaken for this one
+        user_dir = self._get_godot_user_dir(game_path)
+        stale_results = user_dir / "test_results.json" if user_dir else None
+        if stale_results and stale_results.exists():
+            stale_results.unlink()
+        stale_screenshots = user_dir / "test_screenshots" if user_dir else None
+        if stale_screenshots and stale_screenshots.exists():
+            shutil.rmtree(stale_screenshots, ignore_errors=True)
+
+        if self.config.get("seed") is not None:
+            test_config["seed"] = self.config["seed"]
+
+        # Recording and replay both run at a fixed timestep so frame indices line up
+        trace_name = self.config.get("replay")
+        if trace_name:
+            trace = TraceLibrary.load(self.game_info["name"], trace_name)
+            if trace is None:
+                print(f"[ERROR] Input trace not found: {self.game_info['name']}/{trace_name}")
+                return False
+            test_config["replay"] = trace
+            self.fixed_fps = int(trace.get("fps", 60))
+            self.timeout = TEST_TIMEOUT + int(trace.get("frames", 0)) // self.fixed_fps
+        elif self.config.get("record"):
+            test_config["record_trace"] = True
+            self.fixed_fps = 60
+            stale_trace = user_dir / "input_trace.json" if user_dir else None
+            if stale_trace and stale_trace.exists():
+                stale_trace.unlink()
+
         config_path = game_path / "test_config.json"
         with open(config_path, "w") as f:
             json.dump(test_config, f, indent=2)
@@ -188,6 +468,15 @@ class TestAgent:
 
         return True
 
+    def _make_sandbox(self, game_path: Path) -> Path:
+        """Copy the game into the temp dir and apply the device profile there"""
+        sandbox = self.temp_dir / game_path.name
+        shutil.copytree(game_path, sandbox)
+        project_name = GameDiscovery.project_name(game_path)
+        (sandbox / "override.cfg").write_text(self.profile.override_cfg(project_name))
+        self.game_info = dict(self.game_info, path=str(sandbox))
+        return sandbox
+
     def _inject_autoload(self, project_file: Path) -> None:
         """Add test agent to project autoloads"""
         content = project_file.read_text()
@@ -198,10 +487,11 @@ class TestAgent:
 
         # Find autoload section or create it
         if "[autoload]" in content:
-            # Add to existing autoloads
+            # Add as the first autoload; cleanup drops the line and restores the file exactly
             content = content.replace(
-                "[autoload]\n",
-                '[autoload]\n\nTestAgent="*res://autoload/test_agent.gd"\n'
+                "[autoload]\n\n",
+                '[autoload]\n\nTestAgent="*res://autoload/test_agent.gd"\n',
+                1
             )
         else:
             # Add autoload section
@@ -216,10 +506,12 @@ class TestAgent:
 
         result = TestResult(
             game_name=self.game_info["name"],
-            game_path=str(game_path),
+            game_path=str(self.source_path),
             passed=False,
             duration=0,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            snapshot=self.config.get("snapshot") or "",
+            profile=self.profile.name if self.profile else ""
         )
 
         try:
@@ -227,40 +519,71 @@ class TestAgent:
             cmd = [
                 GODOT_CMD,
                 "--headless",
-                "--path", str(game_path),
-                "--quit-after", str(TEST_TIMEOUT)
+                "--path", str(game_path)
             ]
-
-            print(f"[TEST] Running: {self.game_info['name']}")
-
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
+            # Renderer differences only show up with a real window
+            if self.config.get("windowed"):
+                cmd.remove("--headless")
+            # --quit-after counts frames, not seconds: only a fixed timestep turns the
+            # time budget into an exact frame count. Otherwise the wall-clock timeout
+            # on communicate() below is the backstop
+            if self.fixed_fps:
+                cmd.extend(["--fixed-fps", str(self.fixed_fps),
+                            "--quit-after", str(self.timeout * self.fixed_fps)])
+
+            cores, duty = self._cpu_limits(result)
+            result.cpu_cores = cores or []
+            result.cpu_duty = duty
+
+            print(f"[TEST] Running: {job_label(self.game_info)}")
+
+            result.load_avg_start = load_average()
+            cpu_before = cpu_times()
+            process_start = time.time()
+            process = subprocess.Popen(
+                limit_prefix(cores, self.config.get("nice")) + cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=TEST_TIMEOUT + 10,
                 cwd=str(game_path)
             )
-
-            result.stdout = process.stdout
-            result.stderr = process.stderr
+            throttle = DutyCycleThrottle(process.pid, duty).start() if duty < 1.0 else None
+            try:
+                # A throttled game needs proportionally more wall time
+                stdout, stderr = process.communicate(timeout=(self.timeout + 10) / duty)
+            finally:
+                if throttle:
+                    throttle.stop()
+                if process.poll() is None:
+                    process.kill()
+                    process.communicate()
+                result.process_time = time.time() - process_start
+                result.load_avg_end = load_average()
+                result.cpu_busy_pct = cpu_busy_pct(cpu_before, cpu_times())
+
+            result.stdout = stdout
+            result.stderr = stderr
             result.exit_code = process.returncode
 
             # Parse test results from game output
             self._parse_results(result, game_path)
+            self._collect_screenshots(result, game_path)
+            if self.config.get("record"):
+                self._store_trace(result, game_path)
 
             # Check for success indicators
             if process.returncode == 0:
                 result.passed = True
-            elif "PASSED: true" in process.stdout or "PASSED: True" in process.stdout:
+            elif "PASSED: true" in stdout or "PASSED: True" in stdout:
                 result.passed = True
 
             # Check for errors in output
-            if "ERROR" in process.stderr:
+            if "ERROR" in stderr:
                 result.errors.append("Godot errors in stderr")
                 result.passed = False
 
         except subprocess.TimeoutExpired:
-            result.errors.append(f"Test timed out after {TEST_TIMEOUT}s")
+            result.errors.append(f"Test timed out after {self.timeout}s")
 
         except FileNotFoundError:
             result.errors.append(f"Godot not found at: {GODOT_CMD}")
@@ -274,6 +597,23 @@ class TestAgent:
 
         return result
 
+    def _cpu_limits(self, result: TestResult) -> Tuple[Optional[List[int]], float]:
+        """Cores to pin the game to (None = unpinned) and its CPU duty cycle"""
+        cores = self.config.get("cores")
+        duty = 1.0
+        if self.profile and self.profile.cpu_cores:
+            # Sliced from this worker's own core set, so parallel jobs stay apart
+            cores = (cores or available_cores())[:self.profile.cpu_cores]
+        if self.profile and self.profile.cpu_duty < 1.0:
+            if can_throttle():
+                duty = max(0.05, self.profile.cpu_duty)
+            else:
+                result.warnings.append("CPU duty cycle not supported on this platform")
+        if cores and not can_pin():
+            result.warnings.append("CPU pinning not supported on this platform")
+            cores = None
+        return cores, duty
+
     def _parse_results(self, result: TestResult, game_path: Path) -> None:
         """Parse test results from game output files"""
         results_file = game_path / "test_results.json"
@@ -294,35 +634,51 @@ class TestAgent:
                     result.fps_avg = data.get("fps_avg", 0)
                     result.actions_performed = data.get("actions", 0)
                     result.screenshots = data.get("screenshots", 0)
+                    result.seed = data.get("seed", 0)
+                    result.frame_time_avg_ms = data.get("frame_time_avg_ms", 0.0)
+                    result.frame_time_p50_ms = data.get("frame_time_p50_ms", 0.0)
+                    result.frame_time_p95_ms = data.get("frame_time_p95_ms", 0.0)
+                    result.frame_time_max_ms = data.get("frame_time_max_ms", 0.0)
+                    result.memory_peak_mb = data.get("memory_peak_mb", 0.0)
+                    result.memory_slope_mb_s = data.get("memory_slope_mb_s", 0.0)
+                    result.startup_ms = data.get("startup_ms", 0.0)
+                    result.bot = data.get("bot", "")
+                    result.survival_time = data.get("survival_time", 0.0)
+                    result.survived = data.get("survived", False)
+                    result.input_latency_p50_ms = data.get("input_latency_p50_ms", 0.0)
+                    result.input_latency_p95_ms = data.get("input_latency_p95_ms", 0.0)
+                    result.input_latency_p95_frames = data.get("input_latency_p95_frames", 0)
+                    result.input_latency_samples = data.get("input_latency_samples", 0)
+                    result.input_latency_missed = data.get("input_latency_missed", 0)
+                    result.input_latency = data.get("input_latency", {})
             except Exception as e:
                 result.warnings.append(f"Could not parse results: {e}")
 
-    def _get_godot_user_dir(self, game_path: Path) -> Optional[Path]:
-        """Get the Godot user:// directory for this game"""
-        # Parse project name from project.godot
-        project_file = game_path / "project.godot"
-        if not project_file.exists():
-            return None
+    def _collect_screenshots(self, result: TestResult, game_path: Path) -> None:
+        """Move screenshots taken by the agent into the artifact store"""
+        user_dir = self._get_godot_user_dir(game_path)
+        screenshot_dir = user_dir / "test_screenshots" if user_dir else None
+        if not self.store or not screenshot_dir or not screenshot_dir.exists():
+            return
 
-        content = project_file.read_text()
-        project_name = None
-        for line in content.split("\n"):
-            if line.startswith("config/name="):
-                project_name = line.split("=", 1)[1].strip().strip('"')
-                break
+        for screenshot in sorted(screenshot_dir.glob("*.png")):
+            result.artifacts[screenshot.name] = self.store.put_file(screenshot)
+            screenshot.unlink()
 
-        if not project_name:
-            project_name = game_path.name
+    def _store_trace(self, result: TestResult, game_path: Path) -> None:
+        """Copy the input trace recorded by the game into the trace library"""
+        user_dir = self._get_godot_user_dir(game_path)
+        trace_file = user_dir / "input_trace.json" if user_dir else None
+        if not trace_file or not trace_file.exists():
+            result.warnings.append("No input trace was recorded")
+            return
 
-        # Godot user directory varies by OS
-        if sys.platform == "darwin":
-            base = Path.home() / "Library/Application Support/Godot/app_userdata"
-        elif sys.platform == "win32":
-            base = Path(os.environ.get("APPDATA", "")) / "Godot/app_userdata"
-        else:
-            base = Path.home() / ".local/share/godot/app_userdata"
+        dest = TraceLibrary.save(self.game_info["name"], self.config["record"], trace_file)
+        print(f"[TEST] Input trace saved: {dest}")
 
-        return base / project_name
+    def _get_godot_user_dir(self, game_path: Path) -> Optional[Path]:
+        """Get the Godot user:// directory for this game"""
+        return GameDiscovery.user_data_dir(game_path)
 
     def cleanup(self) -> None:
         """Clean up test files from game"""
@@ -333,6 +689,11 @@ class TestAgent:
         if test_agent.exists():
             test_agent.unlink()
 
+        # Remove injected bots
+        bots_dir = game_path / "test_bots"
+        if bots_dir.exists():
+            shutil.rmtree(bots_dir, ignore_errors=True)
+
         # Remove test config
         config_file = game_path / "test_config.json"
         if config_file.exists():
@@ -362,14 +723,29 @@ class TestAgent:
 class TestOrchestrator:
     """Orchestrates testing across all games"""
 
-    def __init__(self, parallel: int = 1, verbose: bool = False):
+    def __init__(self, parallel: int = 1, verbose: bool = False,
+                 agent_config: Optional[Dict[str, Any]] = None,
+                 keep_runs: int = DEFAULT_KEEP_RUNS, max_report_mb: float = DEFAULT_MAX_MB,
+                 profiles: Optional[List[DeviceProfile]] = None, pin: bool = False):
         self.parallel = parallel
         self.verbose = verbose
+        self.agent_config = agent_config or {}
+        self.profiles = profiles or []
+        # Pinned workers each own a core set for the whole run. Profiles that limit
+        # cores draw from the same sets even without --pin, so concurrent low-end
+        # jobs never share one core
+        self.pin = pin
+        needs_cores = pin or any(p.cpu_cores for p in self.profiles)
+        self.cores = CoreAllocator(parallel) if needs_cores and can_pin() else None
+        if pin and not self.cores:
+            print("Warning: CPU pinning is not supported on this platform; running unpinned")
         self.report = TestReport()
+        self.store = ArtifactStore(REPORTS_DIR, keep_runs=keep_runs,
+                                   max_bytes=int(max_report_mb * 1048576))
 
     def run_all_tests(self, games: Optional[List[str]] = None) -> TestReport:
         """Run tests on all or specified games"""
-        self.report = TestReport(timestamp=datetime.now().isoformat())
+        self.report = TestReport(timestamp=datetime.now().isoformat(), run_id=new_run_id())
 
         # Get Godot version
         self.report.godot_version = self._get_godot_version()
@@ -383,21 +759,55 @@ class TestOrchestrator:
                 pattern in g["name"].lower() for pattern in games
             )]
 
-        self.report.total_games = len(all_games)
+        # Only games that ship the requested snapshot/trace can use it
+        for key, library in (("snapshot", SnapshotLibrary), ("replay", TraceLibrary)):
+            entry = self.agent_config.get(key)
+            if entry:
+                available = [g for g in all_games if entry in library.list_names(g["name"])]
+                self.report.skipped += len(all_games) - len(available)
+                all_games = available
+
+        # Bot runs only cover games with a matching policy
+        if self.agent_config.get("bot"):
+            available = [g for g in all_games if g["bot"]]
+            self.report.skipped += len(all_games) - len(available)
+            all_games = available
+
+        # Device profiles multiply the job list: every game runs once per profile
+        jobs = all_games
+        if self.profiles:
+            jobs = [dict(g, profile=profile) for g in all_games for profile in self.profiles]
+
+        self.report.total_games = len(jobs)
         print(f"\n{'='*60}")
         print(f"AUTONOMOUS GAME TEST SUITE")
         print(f"{'='*60}")
         print(f"Games to test: {len(all_games)}")
+        if self.profiles:
+            print(f"Device profiles: {', '.join(p.name for p in self.profiles)} ({len(jobs)} jobs)")
         print(f"Parallel workers: {self.parallel}")
         print(f"Timeout per game: {TEST_TIMEOUT}s")
+        if self.cores:
+            overlap = " (shared: more workers than cores)" if self.cores.shared else ""
+            scope = "per worker" if self.pin else "per core-limited profile job"
+            print(f"CPU pinning: {self.cores.per_worker} core(s) {scope}{overlap}")
+        if self.agent_config.get("nice") is not None:
+            print(f"Nice level: {self.agent_config['nice']}")
+        for key in ("snapshot", "replay", "record"):
+            if self.agent_config.get(key):
+                print(f"{key.capitalize()}: {self.agent_config[key]}")
+        if self.agent_config.get("bot"):
+            print(f"Bots: up to {self.agent_config.get('bot_duration') or BOT_DURATION}s per game")
+        if self.report.skipped:
+            print(f"Skipped (no matching snapshot/trace/bot): {self.report.skipped}")
         print(f"{'='*60}\n")
 
         start_time = time.time()
 
         if self.parallel > 1:
-            self._run_parallel(all_games)
+            self._run_parallel(jobs)
         else:
-            self._run_sequential(all_games)
+            self._run_sequential(jobs)
 
         self.report.total_duration = time.time() - start_time
 
@@ -410,7 +820,7 @@ class TestOrchestrator:
     def _run_sequential(self, games: List[Dict]) -> None:
         """Run tests one at a time"""
         for i, game_info in enumerate(games, 1):
-            print(f"\n[{i}/{len(games)}] Testing: {game_info['name']}")
+            print(f"\n[{i}/{len(games)}] Testing: {job_label(game_info)}")
             result = self._test_game(game_info)
             self._record_result(result)
 
@@ -427,21 +837,30 @@ class TestOrchestrator:
                 try:
                     result = future.result()
                     self._record_result(result)
-                    print(f"[{i}/{len(games)}] Completed: {game['name']} - {'PASS' if result.passed else 'FAIL'}")
+                    print(f"[{i}/{len(games)}] Completed: {job_label(game)} - {'PASS' if result.passed else 'FAIL'}")
                 except Exception as e:
-                    print(f"[{i}/{len(games)}] Error testing {game['name']}: {e}")
+                    print(f"[{i}/{len(games)}] Error testing {job_label(game)}: {e}")
 
     def _test_game(self, game_info: Dict) -> TestResult:
         """Test a single game"""
-        agent = TestAgent(game_info)
+        profile = game_info.get("profile")
+        if self.cores and (self.pin or (profile and profile.cpu_cores)):
+            with self.cores.acquire() as cores:
+                return self._run_agent(game_info, dict(self.agent_config, cores=cores))
+        return self._run_agent(game_info, self.agent_config)
+
+    def _run_agent(self, game_info: Dict, config: Dict[str, Any]) -> TestResult:
+        agent = TestAgent(game_info, config, store=self.store)
 
         if not agent.prepare():
+            agent.cleanup()
             return TestResult(
                 game_name=game_info["name"],
                 game_path=game_info["path"],
                 passed=False,
                 duration=0,
-                errors=["Failed to prepare test environment"]
+                errors=["Failed to prepare test environment"],
+                profile=game_info["profile"].name if game_info.get("profile") else ""
             )
 
         return agent.run()
@@ -457,7 +876,12 @@ class TestOrchestrator:
 
         if self.verbose:
             status = "✅ PASS" if result.passed else "❌ FAIL"
-            print(f"  {status} ({result.duration:.2f}s)")
+            frame_info = f", p95 frame {result.frame_time_p95_ms:.1f}ms" if result.frame_time_p95_ms else ""
+            if result.input_latency_samples:
+                frame_info += f", p95 input latency {result.input_latency_p95_ms:.1f}ms"
+            if result.bot:
+                frame_info += f", {result.bot} bot survived {result.survival_time:.1f}s"
+            print(f"  {status} ({result.duration:.2f}s{frame_info})")
             for error in result.errors:
                 print(f"    Error: {error}")
 
@@ -485,8 +909,42 @@ class TestOrchestrator:
         print(f"Skipped:      {self.report.skipped}")
         print(f"Pass rate:    {(self.report.passed / max(1, self.report.total_games)) * 100:.1f}%")
         print(f"Duration:     {self.report.total_duration:.2f}s")
+        loads = [r.load_avg_start for r in self.report.results if r.load_avg_start]
+        if loads:
+            print(f"System load:  {min(loads):.2f} - {max(loads):.2f} (1-min avg at game start, "
+                  f"{len(available_cores())} cores)")
         print(f"{'='*60}")
 
+        matrix = self.report.profile_matrix()
+        if matrix:
+            names = [p.name for p in self.profiles]
+            print("\nFrame time by device profile (p50 / p95 ms):")
+            print(f"  {'':20}" + "".join(f"{name[:16]:>18}" for name in names))
+            for game_name in sorted(matrix):
+                cells = []
+                for name in names:
+                    stats = matrix[game_name].get(name)
+                    cells.append(f"{stats['p50_ms']:7.1f} /{stats['p95_ms']:7.1f}" if stats else "-")
+                print(f"  {game_name[:20]:20}" + "".join(f"{cell:>18}" for cell in cells))
+
+        latency_results = [r for r in self.report.results if r.input_latency_samples or r.input_latency_missed]
+        if latency_results:
+            print("\nInput latency (press to first reaction):")
+            for result in latency_results:
+                label = f"{result.game_name} [{result.profile}]" if result.profile else result.game_name
+                print(f"  {label:28} "
+                      f"p50 {result.input_latency_p50_ms:6.1f}ms  p95 {result.input_latency_p95_ms:6.1f}ms "
+                      f"({result.input_latency_p95_frames} frames)  "
+                      f"{result.input_latency_samples} taps, {result.input_latency_missed} unanswered")
+
+        bot_results = [r for r in self.report.results if r.bot]
+        if bot_results:
+            print("\nBot survival:")
+            for result in bot_results:
+                outcome = "alive" if result.survived else "game over"
+                print(f"  {result.game_name:20} {result.survival_time:7.1f}s ({outcome:9})  "
+                      f"p95 frame {result.frame_time_p95_ms:.1f}ms, peak mem {result.memory_peak_mb:.1f}MB")
+
         if self.report.failed > 0:
             print("\nFailed games:")
             for result in self.report.results:
@@ -496,22 +954,10 @@ class TestOrchestrator:
                         print(f"      - {error}")
 
     def _save_report(self) -> None:
-        """Save detailed report to file"""
-        report_dir = GAMES_DIR / "tests" / "reports"
-        report_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = report_dir / f"test_report_{timestamp}.json"
-
-        with open(report_file, "w") as f:
-            json.dump(self.report.to_dict(), f, indent=2)
-
-        print(f"\nReport saved: {report_file}")
-
-        # Also save latest report
-        latest_file = report_dir / "latest_report.json"
-        with open(latest_file, "w") as f:
-            json.dump(self.report.to_dict(), f, indent=2)
+        """Save detailed report to the artifact store (logs become deduplicated blobs)"""
+        run_id = self.store.save_run(self.report.to_dict(), self.report.run_id)
+        print(f"\nReport saved: run {run_id} ({self.store.runs_dir / run_id}.json)")
+        print(f"Open it with: python tests/artifact_store.py show {run_id}")
 
 
 def main():
@@ -520,16 +966,77 @@ def main():
     parser.add_argument("--parallel", "-p", type=int, default=1, help="Parallel workers")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--list", "-l", action="store_true", help="List games only")
+    parser.add_argument("--snapshot", "-s", help="Start each game from a stored snapshot (e.g. late_game)")
+    parser.add_argument("--record", metavar="NAME", help="Record input traces into tests/traces/<game>/NAME.json")
+    parser.add_argument("--replay", metavar="NAME", help="Replay recorded input traces at a fixed timestep")
+    parser.add_argument("--seed", type=int, help="Seed the game RNG (ignored when replaying)")
+    parser.add_argument("--profiles", nargs="+", metavar="NAME",
+                        help="Run every game under these device profiles ('all' for every profile)")
+    parser.add_argument("--windowed", action="store_true",
+                        help="Run with a window instead of --headless (needed to compare renderers)")
+    parser.add_argument("--pin", action="store_true",
+                        help="Pin each parallel worker to its own cores (Linux)")
+    parser.add_argument("--nice", type=int, metavar="N",
+                        help="Run games at this scheduling priority (negative values need root)")
+    parser.add_argument("--keep-runs", type=int, default=DEFAULT_KEEP_RUNS,
+                        help=f"Stored runs to keep in tests/reports (default: {DEFAULT_KEEP_RUNS})")
+    parser.add_argument("--max-report-mb", type=float, default=DEFAULT_MAX_MB,
+                        help=f"Size budget for tests/reports in MB (default: {DEFAULT_MAX_MB})")
+    parser.add_argument("--bot", "-b", action="store_true", help="Let heuristic bots play games that have one")
+    parser.add_argument("--bot-duration", type=int, metavar="SECONDS",
+                        help=f"Longest bot session per game (default: {BOT_DURATION})")
     args = parser.parse_args()
 
     if args.list:
         games = GameDiscovery.discover_games()
         print(f"\nDiscovered {len(games)} games:\n")
         for game in games:
-            print(f"  [{game['type']:8}] {game['name']}")
+            extras = []
+            snapshots = SnapshotLibrary.list_names(game["name"])
+            if snapshots:
+                extras.append(f"snapshots: {', '.join(snapshots)}")
+            traces = TraceLibrary.list_names(game["name"])
+            if traces:
+                extras.append(f"traces: {', '.join(traces)}")
+            if game["bot"]:
+                extras.append(f"bot: {game['bot']}")
+            suffix = f"  ({'; '.join(extras)})" if extras else ""
+            print(f"  [{game['type']:8}] {game['name']}{suffix}")
+        profiles = DeviceProfile.load_all()
+        if profiles:
+            print(f"\nDevice profiles:\n")
+            for profile in profiles.values():
+                print(f"  {profile.name:16} {profile.description}")
         return 0
 
-    orchestrator = TestOrchestrator(parallel=args.parallel, verbose=args.verbose)
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+    if args.bot and args.replay:
+        parser.error("--bot and --replay cannot be combined")
+
+    profiles = []
+    if args.profiles:
+        available = DeviceProfile.load_all()
+        names = list(available) if "all" in args.profiles else args.profiles
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            parser.error(f"unknown device profile(s): {', '.join(unknown)} (see --list)")
+        profiles = [available[name] for name in names]
+
+    agent_config = {
+        "snapshot": args.snapshot,
+        "record": args.record,
+        "replay": args.replay,
+        "seed": args.seed,
+        "bot": args.bot,
+        "bot_duration": args.bot_duration,
+        "windowed": args.windowed,
+        "nice": args.nice,
+    }
+    orchestrator = TestOrchestrator(parallel=args.parallel, verbose=args.verbose,
+                                    agent_config=agent_config, keep_runs=args.keep_runs,
+                                    max_report_mb=args.max_report_mb, profiles=profiles,
+                                    pin=args.pin)
     report = orchestrator.run_all_tests(games=args.games)
 
     return 0 if report.failed == 0 else 1
@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import argparse
+import json
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -15,18 +16,20 @@ from datetime import datetime
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tests.test_orchestrator import GameDiscovery, TEST_FRAMEWORK_DIR
+from tests.test_orchestrator import GameDiscovery, TraceLibrary, TEST_FRAMEWORK_DIR
 
 GAMES_DIR = Path(__file__).parent.parent
 GODOT_CMD = os.environ.get("GODOT_CMD", "godot")
+TRACE_FPS = 60  # Frame rate the test agent stamps on traces (TRACE_FPS in test_agent.gd)
 
 
 class VisualTestRunner:
     """Runs games visually for manual testing and verification"""
 
-    def __init__(self, game_name: str, inject_agent: bool = True):
+    def __init__(self, game_name: str, inject_agent: bool = True, record: str = None):
         self.game_name = game_name
-        self.inject_agent = inject_agent
+        self.inject_agent = inject_agent or bool(record)
+        self.record = record
         self.game_info = None
         self.cleanup_needed = False
 
@@ -68,17 +71,36 @@ class VisualTestRunner:
         if "TestAgent" not in content:
             if "[autoload]" in content:
                 content = content.replace(
-                    "[autoload]\n",
-                    '[autoload]\n\nTestAgent="*res://autoload/test_agent.gd"\n'
+                    "[autoload]\n\n",
+                    '[autoload]\n\nTestAgent="*res://autoload/test_agent.gd"\n',
+                    1
                 )
             else:
                 content += '\n[autoload]\n\nTestAgent="*res://autoload/test_agent.gd"\n'
             project_file.write_text(content)
 
+        # Manual sessions only record input; the agent does not drive the game
+        if self.record:
+            with open(game_path / "test_config.json", "w") as f:
+                json.dump({"record_trace": True}, f, indent=2)
+            stale_trace = GameDiscovery.user_data_dir(game_path) / "input_trace.json"
+            if stale_trace.exists():
+                stale_trace.unlink()
+
         self.cleanup_needed = True
         print("Test agent injected")
         return True
 
+    def save_trace(self) -> None:
+        """Store the trace recorded during a manual session"""
+        game_path = Path(self.game_info["path"])
+        trace_file = GameDiscovery.user_data_dir(game_path) / "input_trace.json"
+        if not trace_file.exists():
+            print("No input trace was recorded")
+            return
+        dest = TraceLibrary.save(self.game_info["name"], self.record, trace_file)
+        print(f"Input trace saved: {dest}")
+
     def run(self, windowed: bool = True, resolution: str = "720x1280") -> int:
         """Run the game visually"""
         game_path = Path(self.game_info["path"])
@@ -95,8 +117,15 @@ class VisualTestRunner:
             width, height = resolution.split("x")
             cmd.extend(["--resolution", f"{width}x{height}"])
 
+        # Traces are replayed under a fixed timestep, so record under the same one
+        # or game time drifts from the frame count and the final state diverges
+        if self.record:
+            cmd.extend(["--fixed-fps", str(TRACE_FPS)])
+
         try:
             process = subprocess.run(cmd, cwd=str(game_path))
+            if self.record:
+                self.save_trace()
             return process.returncode
         except KeyboardInterrupt:
             print("\nTest interrupted by user")
@@ -121,6 +150,11 @@ class VisualTestRunner:
         if test_agent.exists():
             test_agent.unlink()
 
+        # Remove recording config
+        config_file = game_path / "test_config.json"
+        if config_file.exists():
+            config_file.unlink()
+
         # Clean project.godot
         project_file = game_path / "project.godot"
         if project_file.exists():
@@ -171,6 +205,7 @@ def main():
     parser.add_argument("--resolution", "-r", default="720x1280", help="Window resolution")
     parser.add_argument("--list", "-l", action="store_true", help="List games only")
     parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
+    parser.add_argument("--record", metavar="NAME", help="Record the session as tests/traces/<game>/NAME.json")
     args = parser.parse_args()
 
     if args.list:
@@ -188,11 +223,14 @@ def main():
             return 0
 
     # Run the game
-    runner = VisualTestRunner(game_name, inject_agent=not args.no_agent)
+    runner = VisualTestRunner(game_name, inject_agent=not args.no_agent, record=args.record)
 
     if not runner.find_game():
         return 1
 
+    if not runner.prepare_test_agent():
+        return 1
+
     return runner.run(resolution=args.resolution)
 
 